@@ -0,0 +1,93 @@
+"""use enum types for visibility and session ttl unit
+
+Revision ID: 0b3d6f8a2c5e
+Revises: 9a2c5e7f1b4d
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0b3d6f8a2c5e"
+down_revision: str | None = "9a2c5e7f1b4d"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+visibility = postgresql.ENUM("private", "group", "public", name="visibility")
+session_ttl_unit = postgresql.ENUM("minutes", "hours", "days", name="session_ttl_unit")
+
+VISIBILITY_TABLES = ("recipes", "calendars", "grocery_lists")
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Normalize legacy values on every dialect: the Enum columns reject unknown
+    # values when rows are loaded, and on Postgres the casts below would fail
+    for table in VISIBILITY_TABLES:
+        op.execute(
+            f"UPDATE {table} SET visibility = 'private' "
+            "WHERE visibility NOT IN ('private', 'group', 'public')"
+        )
+    op.execute(
+        "UPDATE session_settings SET session_ttl_unit = 'days' "
+        "WHERE session_ttl_unit NOT IN ('minutes', 'hours', 'days')"
+    )
+
+    # SQLite has no enum type; SQLAlchemy keeps storing these as VARCHAR there
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    visibility.create(op.get_bind(), checkfirst=True)
+    session_ttl_unit.create(op.get_bind(), checkfirst=True)
+
+    for table in VISIBILITY_TABLES:
+        # The text default cannot be cast along with the column, so swap it out
+        op.alter_column(table, "visibility", server_default=None)
+        op.alter_column(
+            table,
+            "visibility",
+            type_=visibility,
+            postgresql_using="visibility::visibility",
+            existing_nullable=False,
+        )
+        op.alter_column(table, "visibility", server_default="private")
+    op.alter_column(
+        "session_settings",
+        "session_ttl_unit",
+        type_=session_ttl_unit,
+        postgresql_using="session_ttl_unit::session_ttl_unit",
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.alter_column(
+        "session_settings",
+        "session_ttl_unit",
+        type_=sa.String(length=20),
+        postgresql_using="session_ttl_unit::text",
+        existing_nullable=False,
+    )
+    for table in VISIBILITY_TABLES:
+        op.alter_column(table, "visibility", server_default=None)
+        op.alter_column(
+            table,
+            "visibility",
+            type_=sa.String(length=20),
+            postgresql_using="visibility::text",
+            existing_nullable=False,
+        )
+        op.alter_column(table, "visibility", server_default="private")
+
+    session_ttl_unit.drop(op.get_bind(), checkfirst=True)
+    visibility.drop(op.get_bind(), checkfirst=True)
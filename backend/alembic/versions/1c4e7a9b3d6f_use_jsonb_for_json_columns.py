@@ -0,0 +1,62 @@
+"""use jsonb for json columns
+
+Revision ID: 1c4e7a9b3d6f
+Revises: 0b3d6f8a2c5e
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "1c4e7a9b3d6f"
+down_revision: str | None = "0b3d6f8a2c5e"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (table, column, nullable)
+JSON_COLUMNS = [
+    ("users", "dietary_preferences", True),
+    ("users", "preferences", True),
+    ("recipes", "ingredients", True),
+    ("recipes", "instructions", True),
+    ("recipes", "nutritional_info", True),
+    ("group_members", "permissions", True),
+    ("grocery_lists", "items", False),
+]
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # SQLite has no JSONB; SQLAlchemy keeps using its text JSON type there
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table, column, nullable in JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.JSONB(),
+            postgresql_using=f"{column}::jsonb",
+            existing_nullable=nullable,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table, column, nullable in JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.JSON(),
+            postgresql_using=f"{column}::json",
+            existing_nullable=nullable,
+        )
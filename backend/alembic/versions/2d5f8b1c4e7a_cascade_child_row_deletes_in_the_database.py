@@ -0,0 +1,53 @@
+"""cascade child row deletes in the database
+
+Revision ID: 2d5f8b1c4e7a
+Revises: 1c4e7a9b3d6f
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "2d5f8b1c4e7a"
+down_revision: str | None = "1c4e7a9b3d6f"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (table, column, referenced table); constraints use PostgreSQL's default names
+CASCADING_FOREIGN_KEYS = [
+    ("recipe_tags", "recipe_id", "recipes"),
+    ("recipe_ratings", "recipe_id", "recipes"),
+    ("user_favorites", "recipe_id", "recipes"),
+    ("user_favorites", "user_id", "users"),
+    ("calendar_meals", "calendar_id", "calendars"),
+    ("recipe_collection_items", "collection_id", "recipe_collections"),
+    ("group_members", "group_id", "groups"),
+    ("grocery_lists", "user_id", "users"),
+]
+
+
+def _recreate_foreign_keys(ondelete: str | None) -> None:
+    for table, column, referent in CASCADING_FOREIGN_KEYS:
+        name = f"{table}_{column}_fkey"
+        op.drop_constraint(name, table, type_="foreignkey")
+        op.create_foreign_key(name, table, referent, [column], ["id"], ondelete=ondelete)
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # SQLite cannot alter constraints in place; the models delete children explicitly there
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    _recreate_foreign_keys("CASCADE")
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    _recreate_foreign_keys(None)
@@ -0,0 +1,51 @@
+"""drop redundant indexes on primary key columns
+
+Revision ID: 3e6a9c2d5f8b
+Revises: 2d5f8b1c4e7a
+Create Date: 2026-10-17 19:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3e6a9c2d5f8b"
+down_revision: str | None = "2d5f8b1c4e7a"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Tables whose ``id`` primary key also got a plain ``ix_<table>_id`` index
+TABLES_WITH_ID_INDEX = [
+    "users",
+    "recipes",
+    "recipe_ingredients",
+    "recipe_tags",
+    "recipe_ratings",
+    "user_favorites",
+    "calendars",
+    "calendar_meals",
+    "groups",
+    "group_members",
+    "grocery_lists",
+    "pantry_inventory",
+    "feature_toggles",
+    "password_reset_tokens",
+    "recipe_collections",
+    "recipe_collection_items",
+    "blocked_image_domains",
+]
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # The primary key constraint already indexes ``id``
+    for table in TABLES_WITH_ID_INDEX:
+        op.drop_index(f"ix_{table}_id", table_name=table)
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    for table in TABLES_WITH_ID_INDEX:
+        op.create_index(f"ix_{table}_id", table, ["id"], unique=False)
@@ -0,0 +1,35 @@
+"""add partial index for unused password reset tokens
+
+Revision ID: 4f7b0d3e6a9c
+Revises: 3e6a9c2d5f8b
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4f7b0d3e6a9c"
+down_revision: str | None = "3e6a9c2d5f8b"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.create_index(
+        "ix_password_reset_tokens_unused_user",
+        "password_reset_tokens",
+        ["user_id"],
+        postgresql_where=sa.text("used_at IS NULL"),
+        sqlite_where=sa.text("used_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index("ix_password_reset_tokens_unused_user", table_name="password_reset_tokens")
@@ -0,0 +1,43 @@
+"""drop deprecated is_shared/is_public flags
+
+Revision ID: 5a8c1e4f7b0d
+Revises: 4f7b0d3e6a9c
+Create Date: 2026-10-17 21:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5a8c1e4f7b0d"
+down_revision: str | None = "4f7b0d3e6a9c"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # visibility was backfilled from these flags when it was introduced and is
+    # the only field access checks read
+    op.drop_column("calendars", "is_shared")
+    op.drop_column("recipes", "is_public")
+    op.drop_column("recipes", "is_shared")
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.add_column("recipes", sa.Column("is_shared", sa.Boolean(), nullable=True))
+    op.add_column("recipes", sa.Column("is_public", sa.Boolean(), nullable=True))
+    op.add_column("calendars", sa.Column("is_shared", sa.Boolean(), nullable=True))
+
+    op.execute(
+        """
+        UPDATE recipes
+        SET is_shared = (visibility = 'group'), is_public = (visibility = 'public')
+        """
+    )
+    op.execute("UPDATE calendars SET is_shared = (visibility = 'group')")
@@ -0,0 +1,43 @@
+"""add partial indexes for active recipes
+
+Revision ID: 5c8e1f2a9d3b
+Revises: b34c6205a914
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5c8e1f2a9d3b"
+down_revision: str | None = "b34c6205a914"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.create_index(
+        "ix_recipes_active",
+        "recipes",
+        ["owner_id", "visibility", "group_id"],
+        postgresql_where=sa.text("deleted_at IS NULL"),
+        sqlite_where=sa.text("deleted_at IS NULL"),
+    )
+    op.create_index(
+        "ix_recipes_active_created",
+        "recipes",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+        postgresql_where=sa.text("deleted_at IS NULL"),
+        sqlite_where=sa.text("deleted_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index("ix_recipes_active_created", table_name="recipes")
+    op.drop_index("ix_recipes_active", table_name="recipes")
@@ -0,0 +1,100 @@
+"""use enum types for meal type, difficulty and group role
+
+Revision ID: 6d9f2b4c8e1a
+Revises: 5c8e1f2a9d3b
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6d9f2b4c8e1a"
+down_revision: str | None = "5c8e1f2a9d3b"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+meal_type = postgresql.ENUM("breakfast", "lunch", "dinner", "snack", name="meal_type")
+difficulty_level = postgresql.ENUM("easy", "medium", "hard", name="difficulty_level")
+group_role = postgresql.ENUM("admin", "member", name="group_role")
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Normalize legacy values on every dialect: the Enum columns reject unknown
+    # values when rows are loaded, and on Postgres the casts below would fail
+    op.execute(
+        "UPDATE recipes SET difficulty = lower(trim(difficulty)) WHERE difficulty IS NOT NULL"
+    )
+    op.execute(
+        "UPDATE recipes SET difficulty = NULL "
+        "WHERE difficulty NOT IN ('easy', 'medium', 'hard')"
+    )
+    op.execute("UPDATE group_members SET role = 'member' WHERE role IS NULL OR role <> 'admin'")
+
+    # SQLite has no enum type; SQLAlchemy keeps storing these as VARCHAR there
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    meal_type.create(op.get_bind(), checkfirst=True)
+    difficulty_level.create(op.get_bind(), checkfirst=True)
+    group_role.create(op.get_bind(), checkfirst=True)
+
+    op.alter_column(
+        "calendar_meals",
+        "meal_type",
+        type_=meal_type,
+        postgresql_using="meal_type::meal_type",
+        existing_nullable=False,
+    )
+    op.alter_column(
+        "recipes",
+        "difficulty",
+        type_=difficulty_level,
+        postgresql_using="difficulty::difficulty_level",
+        existing_nullable=True,
+    )
+    op.alter_column(
+        "group_members",
+        "role",
+        type_=group_role,
+        postgresql_using="role::group_role",
+        existing_nullable=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.alter_column(
+        "group_members",
+        "role",
+        type_=sa.String(length=20),
+        postgresql_using="role::text",
+        existing_nullable=True,
+    )
+    op.alter_column(
+        "recipes",
+        "difficulty",
+        type_=sa.String(length=20),
+        postgresql_using="difficulty::text",
+        existing_nullable=True,
+    )
+    op.alter_column(
+        "calendar_meals",
+        "meal_type",
+        type_=sa.String(length=20),
+        postgresql_using="meal_type::text",
+        existing_nullable=False,
+    )
+
+    group_role.drop(op.get_bind(), checkfirst=True)
+    difficulty_level.drop(op.get_bind(), checkfirst=True)
+    meal_type.drop(op.get_bind(), checkfirst=True)
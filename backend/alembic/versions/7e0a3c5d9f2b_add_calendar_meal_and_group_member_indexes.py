@@ -0,0 +1,31 @@
+"""add calendar meal date and group member user indexes
+
+Revision ID: 7e0a3c5d9f2b
+Revises: 6d9f2b4c8e1a
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7e0a3c5d9f2b"
+down_revision: str | None = "6d9f2b4c8e1a"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.create_index(
+        "ix_calendar_meal_cal_date", "calendar_meals", ["calendar_id", "meal_date"]
+    )
+    op.create_index("ix_group_members_user", "group_members", ["user_id"])
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index("ix_group_members_user", table_name="group_members")
+    op.drop_index("ix_calendar_meal_cal_date", table_name="calendar_meals")
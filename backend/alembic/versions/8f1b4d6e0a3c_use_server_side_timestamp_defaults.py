@@ -0,0 +1,84 @@
+"""use server-side defaults for created_at and updated_at
+
+Revision ID: 8f1b4d6e0a3c
+Revises: 7e0a3c5d9f2b
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8f1b4d6e0a3c"
+down_revision: str | None = "7e0a3c5d9f2b"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (table, column, nullable) for every timestamp now filled in by the database
+TIMESTAMP_COLUMNS = [
+    ("users", "created_at", False),
+    ("users", "updated_at", True),
+    ("recipes", "created_at", False),
+    ("recipes", "updated_at", True),
+    ("recipe_ratings", "created_at", False),
+    ("user_favorites", "created_at", False),
+    ("calendars", "created_at", False),
+    ("calendars", "updated_at", True),
+    ("calendar_meals", "created_at", False),
+    ("groups", "created_at", False),
+    ("groups", "updated_at", True),
+    ("group_members", "created_at", False),
+    ("grocery_lists", "created_at", False),
+    ("pantry_inventory", "updated_at", True),
+    ("feature_toggles", "created_at", False),
+    ("feature_toggles", "updated_at", True),
+    ("openai_settings", "updated_at", True),
+    ("session_settings", "updated_at", True),
+    ("email_settings", "updated_at", True),
+    ("password_reset_tokens", "created_at", False),
+    ("recipe_collections", "created_at", False),
+    ("recipe_collections", "updated_at", True),
+    ("recipe_collection_items", "added_at", False),
+]
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    for table, column, nullable in TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.DateTime(),
+            existing_nullable=nullable,
+            server_default=sa.func.now(),
+        )
+    op.alter_column(
+        "blocked_image_domains",
+        "created_at",
+        existing_type=sa.DateTime(timezone=True),
+        existing_nullable=False,
+        server_default=sa.func.now(),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.alter_column(
+        "blocked_image_domains",
+        "created_at",
+        existing_type=sa.DateTime(timezone=True),
+        existing_nullable=False,
+        server_default=None,
+    )
+    for table, column, nullable in reversed(TIMESTAMP_COLUMNS):
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.DateTime(),
+            existing_nullable=nullable,
+            server_default=None,
+        )
@@ -0,0 +1,29 @@
+"""add recipe tag name and category index
+
+Revision ID: 9a2c5e7f1b4d
+Revises: 8f1b4d6e0a3c
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9a2c5e7f1b4d"
+down_revision: str | None = "8f1b4d6e0a3c"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.create_index(
+        "ix_recipe_tags_name_category", "recipe_tags", ["tag_name", "tag_category"]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index("ix_recipe_tags_name_category", table_name="recipe_tags")
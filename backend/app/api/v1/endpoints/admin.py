@@ -8,10 +8,11 @@ from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.dependencies import get_current_user, get_db
-from app.config import get_app_version, settings
+from app.config import APP_VERSION, settings
 from app.models import (
     BlockedImageDomain,
     Calendar,
+    DifficultyLevel,
     EmailSettings,
     FeatureToggle,
     Group,
@@ -20,7 +21,9 @@ from app.models import (
     Recipe,
     SessionSettings,
     User,
+    Visibility,
 )
+from app.models.loaders import select_recipes_with_owner
 from app.schemas import (
     AdminPasswordReset,
     AdminStatsResponse,
@@ -43,7 +46,9 @@ from app.schemas import (
     SessionSettingsUpdate,
     UserResponse,
 )
+from app.services.blocked_domains import invalidate_blocked_domains
 from app.services.email_service import get_email_service
+from app.services.settings_cache import invalidate_settings_cache, is_feature_enabled
 from app.utils.auth import get_password_hash
 
 logger = logging.getLogger(__name__)
@@ -69,9 +74,7 @@ async def get_admin_stats(
     total_users_result = await db.execute(select(func.count(User.id)))
     total_users = total_users_result.scalar() or 0
 
-    total_recipes_result = await db.execute(
-        select(func.count(Recipe.id)).where(Recipe.deleted_at.is_(None))
-    )
+    total_recipes_result = await db.execute(select(func.count(Recipe.id)))
     total_recipes = total_recipes_result.scalar() or 0
 
     total_calendars_result = await db.execute(select(func.count(Calendar.id)))
@@ -81,29 +84,20 @@ async def get_admin_stats(
     total_groups = total_groups_result.scalar() or 0
 
     total_public_result = await db.execute(
-        select(func.count(Recipe.id)).where(
-            Recipe.deleted_at.is_(None), Recipe.visibility == "public"
-        )
+        select(func.count(Recipe.id)).where(Recipe.visibility == "public")
     )
     total_public_recipes = total_public_result.scalar() or 0
 
     total_group_result = await db.execute(
-        select(func.count(Recipe.id)).where(
-            Recipe.deleted_at.is_(None), Recipe.visibility == "group"
-        )
+        select(func.count(Recipe.id)).where(Recipe.visibility == "group")
     )
     total_group_recipes = total_group_result.scalar() or 0
 
     total_private_result = await db.execute(
-        select(func.count(Recipe.id)).where(
-            Recipe.deleted_at.is_(None), Recipe.visibility == "private"
-        )
+        select(func.count(Recipe.id)).where(Recipe.visibility == "private")
     )
     total_private_recipes = total_private_result.scalar() or 0
 
-    # Get app version
-    version = get_app_version()
-
     return AdminStatsResponse(
         total_users=total_users,
         total_recipes=total_recipes,
@@ -112,7 +106,7 @@ async def get_admin_stats(
         total_public_recipes=total_public_recipes,
         total_group_recipes=total_group_recipes,
         total_private_recipes=total_private_recipes,
-        version=version,
+        version=APP_VERSION,
     )
 
 
@@ -133,9 +127,7 @@ async def list_all_users(
     result = []
     for user in users:
         recipe_count_result = await db.execute(
-            select(func.count(Recipe.id)).where(
-                Recipe.owner_id == user.id, Recipe.deleted_at.is_(None)
-            )
+            select(func.count(Recipe.id)).where(Recipe.owner_id == user.id)
         )
         recipe_count = recipe_count_result.scalar() or 0
 
@@ -293,11 +285,7 @@ async def admin_reset_user_password(
 
         if api_key:
             # Check feature toggle
-            toggle_result = await db.execute(
-                select(FeatureToggle).where(FeatureToggle.feature_key == "sendgrid_email")
-            )
-            toggle = toggle_result.scalar_one_or_none()
-            sendgrid_enabled = toggle.is_enabled if toggle else False
+            sendgrid_enabled = await is_feature_enabled(db, "sendgrid_email")
 
             if sendgrid_enabled:
                 email_service = get_email_service(api_key=api_key, from_email=admin_email)
@@ -326,13 +314,11 @@ async def list_all_recipes(
     limit: int = 100,
     search: str | None = None,
     category: str | None = None,
-    difficulty: str | None = None,
-    visibility: str | None = None,
+    difficulty: DifficultyLevel | None = None,
+    visibility: Visibility | None = None,
 ):
     """List all recipes with details and filters (admin only)."""
-    from sqlalchemy.orm import selectinload
-
-    stmt = select(Recipe).where(Recipe.deleted_at.is_(None)).options(selectinload(Recipe.owner))
+    stmt = select_recipes_with_owner()
 
     if search:
         search_pattern = f"%{search}%"
@@ -382,13 +368,7 @@ async def get_recipe_details(
     _admin: Annotated[User, Depends(require_admin)],
 ):
     """Get detailed information about a specific recipe (admin only)."""
-    from sqlalchemy.orm import selectinload
-
-    result = await db.execute(
-        select(Recipe)
-        .where(Recipe.id == recipe_id, Recipe.deleted_at.is_(None))
-        .options(selectinload(Recipe.owner))
-    )
+    result = await db.execute(select_recipes_with_owner().where(Recipe.id == recipe_id))
     recipe = result.scalar_one_or_none()
     if not recipe:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Recipe not found")
@@ -424,7 +404,7 @@ async def update_recipe(
     """Update a recipe (admin only). Admins can modify all recipe fields."""
 
     result = await db.execute(
-        select(Recipe).where(Recipe.id == recipe_id, Recipe.deleted_at.is_(None))
+        select(Recipe).where(Recipe.id == recipe_id)
     )
     recipe = result.scalar_one_or_none()
     if not recipe:
@@ -442,7 +422,7 @@ async def update_recipe(
 
     result = await db.execute(
         select(Recipe)
-        .where(Recipe.id == recipe_id, Recipe.deleted_at.is_(None))
+        .where(Recipe.id == recipe_id)
         .options(selectinload(Recipe.owner), selectinload(Recipe.tags))
     )
     recipe = result.scalar_one_or_none()
@@ -472,7 +452,7 @@ async def delete_recipe(
     from datetime import datetime
 
     result = await db.execute(
-        select(Recipe).where(Recipe.id == recipe_id, Recipe.deleted_at.is_(None))
+        select(Recipe).where(Recipe.id == recipe_id)
     )
     recipe = result.scalar_one_or_none()
     if not recipe:
@@ -558,6 +538,11 @@ async def update_calendar(
     if not calendar:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Calendar not found")
 
+    if "visibility" in calendar_data and calendar_data["visibility"] not in tuple(Visibility):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid calendar visibility"
+        )
+
     # Update allowed fields
     for field in ["name", "visibility", "group_id"]:
         if field in calendar_data:
@@ -640,14 +625,20 @@ async def get_group_details(
         .options(
             selectinload(Group.owner),
             selectinload(Group.members).selectinload(GroupMember.user),
-            selectinload(Group.recipes),
-            selectinload(Group.calendars),
         )
     )
     group = result.scalar_one_or_none()
     if not group:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Group not found")
 
+    # Count shared content in the database rather than loading every row
+    recipe_count_result = await db.execute(
+        select(func.count(Recipe.id)).where(Recipe.group_id == group.id)
+    )
+    calendar_count_result = await db.execute(
+        select(func.count(Calendar.id)).where(Calendar.group_id == group.id)
+    )
+
     return {
         "id": group.id,
         "name": group.name,
@@ -663,8 +654,8 @@ async def get_group_details(
             }
             for member in group.members
         ],
-        "recipe_count": len(group.recipes),
-        "calendar_count": len(group.calendars),
+        "recipe_count": recipe_count_result.scalar() or 0,
+        "calendar_count": calendar_count_result.scalar() or 0,
         "created_at": group.created_at,
         "updated_at": group.updated_at,
     }
@@ -789,6 +780,7 @@ async def create_feature_toggle(
     toggle = FeatureToggle(**toggle_data.model_dump())
     db.add(toggle)
     await db.commit()
+    invalidate_settings_cache()
     await db.refresh(toggle)
     return FeatureToggleResponse.model_validate(toggle)
 
@@ -814,6 +806,7 @@ async def update_feature_toggle(
         setattr(toggle, key, value)
 
     await db.commit()
+    invalidate_settings_cache()
     await db.refresh(toggle)
     return FeatureToggleResponse.model_validate(toggle)
 
@@ -835,6 +828,7 @@ async def delete_feature_toggle(
 
     await db.delete(toggle)
     await db.commit()
+    invalidate_settings_cache()
 
 
 # OpenAI Settings Management
@@ -879,6 +873,7 @@ async def update_openai_settings(
         setattr(settings, key, value)
 
     await db.commit()
+    invalidate_settings_cache()
     await db.refresh(settings)
     response = OpenAISettingsResponse.model_validate(settings)
     response.has_api_key = bool(settings.api_key)
@@ -998,6 +993,7 @@ async def update_session_settings(
         setattr(settings, key, value)
 
     await db.commit()
+    invalidate_settings_cache()
     await db.refresh(settings)
     return SessionSettingsResponse.model_validate(settings)
 
@@ -1046,6 +1042,7 @@ async def add_blocked_domain(
     db.add(blocked_domain)
     await db.commit()
     await db.refresh(blocked_domain)
+    invalidate_blocked_domains()
 
     logger.info("Blocked image domain added: %s by admin user_id=%s", normalized_domain, admin.id)
     return BlockedDomainResponse.model_validate(blocked_domain)
@@ -1072,6 +1069,7 @@ async def remove_blocked_domain(
     logger.info("Removing blocked image domain: %s", domain.domain)
     await db.delete(domain)
     await db.commit()
+    invalidate_blocked_domains()
 
 # Email Settings Management
 @router.get("/email-settings", response_model=EmailSettingsResponse)
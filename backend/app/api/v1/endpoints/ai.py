@@ -131,8 +131,6 @@ async def execute_ai_tool(
                 nutritional_info=recipe.nutritional_info,
                 visibility=recipe.visibility,
                 group_id=recipe.group_id,
-                is_shared=recipe.is_shared,
-                is_public=recipe.is_public,
                 image_url=recipe.image_url,
                 created_at=recipe.created_at,
                 updated_at=recipe.updated_at,
@@ -172,8 +170,6 @@ async def execute_ai_tool(
                 nutritional_info=recipe.nutritional_info,
                 visibility=recipe.visibility,
                 group_id=recipe.group_id,
-                is_shared=recipe.is_shared,
-                is_public=recipe.is_public,
                 image_url=recipe.image_url,
                 created_at=recipe.created_at,
                 updated_at=recipe.updated_at,
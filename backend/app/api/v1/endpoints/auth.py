@@ -6,13 +6,13 @@ from datetime import datetime, timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy import func, select
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.dependencies import get_current_active_user
 from app.config import settings
 from app.database import get_db
-from app.models import EmailSettings, FeatureToggle, PasswordResetToken, User
+from app.models import EmailSettings, PasswordResetToken, User
 from app.schemas import (
     PasswordResetConfig,
     PasswordResetConfirm,
@@ -23,6 +23,7 @@ from app.schemas import (
     UserUpdate,
 )
 from app.services.email_service import get_email_service
+from app.services.settings_cache import is_feature_enabled
 from app.utils.auth import (
     create_access_token_async,
     create_refresh_token,
@@ -50,11 +51,7 @@ async def get_password_reset_config(db: AsyncSession = Depends(get_db)) -> Passw
 
     if email_service.is_configured():
         # Check feature toggle
-        toggle_result = await db.execute(
-            select(FeatureToggle).where(FeatureToggle.feature_key == "sendgrid_email")
-        )
-        toggle = toggle_result.scalar_one_or_none()
-        email_enabled = toggle.is_enabled if toggle else False
+        email_enabled = await is_feature_enabled(db, "sendgrid_email")
 
     # Get admin email from EmailSettings with fallback to settings.ADMIN_EMAIL
     email_settings_result = await db.execute(select(EmailSettings).limit(1))
@@ -291,21 +288,12 @@ async def request_password_reset(
         return {"message": "If the email exists in our system, a password reset link will be sent."}
 
     # Invalidate any existing tokens for this user
-    existing_tokens = (
-        (
-            await db.execute(
-                select(PasswordResetToken).where(
-                    PasswordResetToken.user_id == user.id, PasswordResetToken.used_at.is_(None)
-                )
-            )
-        )
-        .scalars()
-        .all()
+    await db.execute(
+        update(PasswordResetToken)
+        .where(PasswordResetToken.user_id == user.id, PasswordResetToken.used_at.is_(None))
+        .values(used_at=datetime.utcnow())
     )
 
-    for token in existing_tokens:
-        token.used_at = datetime.utcnow()
-
     # Generate secure token
     reset_token = secrets.token_urlsafe(32)
     expires_at = datetime.utcnow() + timedelta(hours=24)
@@ -327,11 +315,7 @@ async def request_password_reset(
     api_key = None
 
     # First check feature toggle
-    toggle_result = await db.execute(
-        select(FeatureToggle).where(FeatureToggle.feature_key == "sendgrid_email")
-    )
-    toggle = toggle_result.scalar_one_or_none()
-    sendgrid_enabled = toggle.is_enabled if toggle else False
+    sendgrid_enabled = await is_feature_enabled(db, "sendgrid_email")
 
     # Load API key from database settings, fallback to environment variable
     if sendgrid_enabled:
@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.api.v1.dependencies import get_current_active_user
 from app.database import get_db
 from app.models import Calendar, CalendarMeal, GroupMember, Recipe, User
+from app.models.loaders import select_meals_with_recipe
 from app.schemas import (
     CalendarCopyRequest,
     CalendarCopyResponse,
@@ -67,7 +68,7 @@ async def create_calendar(
     calendar_data: CalendarCreate,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
-) -> dict:
+) -> CalendarResponse:
     """Create a new calendar."""
     logger.info("Creating calendar: user_id=%s", current_user.id)
     calendar = Calendar(
@@ -79,18 +80,16 @@ async def create_calendar(
     await db.refresh(calendar)
     logger.info("Calendar created successfully: calendar_id=%s", calendar.id)
 
-    # Return calendar with can_edit field set to True (user is the owner)
-    return {
-        "id": calendar.id,
-        "name": calendar.name,
-        "owner_id": calendar.owner_id,
-        "visibility": calendar.visibility,
-        "group_id": calendar.group_id,
-        "is_shared": calendar.is_shared,
-        "created_at": calendar.created_at,
-        "updated_at": calendar.updated_at,
-        "can_edit": True,
-    }
+    # Return calendar with can_edit field set to True (user is the owner); the
+    # request body is already validated, so only the database fields are added
+    return CalendarResponse.model_construct(
+        **dict(calendar_data),
+        id=calendar.id,
+        owner_id=calendar.owner_id,
+        created_at=calendar.created_at,
+        updated_at=calendar.updated_at,
+        can_edit=True,
+    )
 
 
 @router.get("", response_model=list[CalendarResponse])
@@ -148,7 +147,6 @@ async def list_calendars(
             "owner_id": calendar.owner_id,
             "visibility": calendar.visibility,
             "group_id": calendar.group_id,
-            "is_shared": calendar.is_shared,
             "created_at": calendar.created_at,
             "updated_at": calendar.updated_at,
             "can_edit": can_edit,
@@ -188,7 +186,6 @@ async def get_calendar(
         "owner_id": calendar.owner_id,
         "visibility": calendar.visibility,
         "group_id": calendar.group_id,
-        "is_shared": calendar.is_shared,
         "created_at": calendar.created_at,
         "updated_at": calendar.updated_at,
         "can_edit": can_edit,
@@ -286,7 +283,6 @@ async def add_meal_to_calendar(
     result = await db.execute(
         select(Recipe).where(
             Recipe.id == meal_data.recipe_id,
-            Recipe.deleted_at.is_(None),
         )
     )
     recipe = result.scalar_one_or_none()
@@ -312,12 +308,7 @@ async def add_meal_to_calendar(
     await db.refresh(meal)
 
     # Load the recipe relationship to populate recipe_name
-    from sqlalchemy.orm import selectinload
-    result = await db.execute(
-        select(CalendarMeal)
-        .where(CalendarMeal.id == meal.id)
-        .options(selectinload(CalendarMeal.recipe))
-    )
+    result = await db.execute(select_meals_with_recipe().where(CalendarMeal.id == meal.id))
     meal = result.scalar_one()
 
     return meal
@@ -353,13 +344,7 @@ async def list_calendar_meals(
         )
 
     # Build query with recipe join
-    from sqlalchemy.orm import selectinload
-
-    query = (
-        select(CalendarMeal)
-        .where(CalendarMeal.calendar_id == calendar_id)
-        .options(selectinload(CalendarMeal.recipe))
-    )
+    query = select_meals_with_recipe().where(CalendarMeal.calendar_id == calendar_id)
 
     if date_from:
         # Convert timezone-aware datetime to naive (UTC) for comparison
@@ -461,12 +446,8 @@ async def export_calendar_to_ical(
         )
 
     # Get all meals
-    from sqlalchemy.orm import selectinload
-
     result = await db.execute(
-        select(CalendarMeal)
-        .where(CalendarMeal.calendar_id == calendar_id)
-        .options(selectinload(CalendarMeal.recipe))
+        select_meals_with_recipe().where(CalendarMeal.calendar_id == calendar_id)
     )
     meals = result.scalars().all()
 
@@ -635,16 +616,10 @@ async def copy_calendar_period(
         )
 
     # Get source meals
-    from sqlalchemy.orm import selectinload
-
-    source_query = (
-        select(CalendarMeal)
-        .where(
-            CalendarMeal.calendar_id == calendar_id,
-            CalendarMeal.meal_date >= source_start,
-            CalendarMeal.meal_date < source_end,
-        )
-        .options(selectinload(CalendarMeal.recipe))
+    source_query = select_meals_with_recipe().where(
+        CalendarMeal.calendar_id == calendar_id,
+        CalendarMeal.meal_date >= source_start,
+        CalendarMeal.meal_date < source_end,
     )
     result = await db.execute(source_query)
     source_meals = result.scalars().all()
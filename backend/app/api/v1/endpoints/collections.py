@@ -15,8 +15,8 @@ from app.schemas import (
     RecipeCollectionItemResponse,
     RecipeCollectionResponse,
     RecipeCollectionUpdate,
+    RecipeListAdapter,
     RecipeResponse,
-    RecipeTagResponse,
 )
 
 logger = logging.getLogger(__name__)
@@ -27,11 +27,9 @@ async def build_collection_response(
     collection: RecipeCollection, db: AsyncSession
 ) -> RecipeCollectionResponse:
     """Build a collection response with recipe items."""
-    # Load collection items with recipes
+    # Load collection items; RecipeCollectionItem.recipe is joined in the same query
     result = await db.execute(
-        select(RecipeCollectionItem)
-        .where(RecipeCollectionItem.collection_id == collection.id)
-        .options(selectinload(RecipeCollectionItem.recipe))
+        select(RecipeCollectionItem).where(RecipeCollectionItem.collection_id == collection.id)
     )
     items = result.scalars().all()
 
@@ -225,48 +223,21 @@ async def get_collection_recipes(
 
     recipes_result = await db.execute(
         select(Recipe)
-        .where(Recipe.id.in_(recipe_ids), Recipe.deleted_at.is_(None))
+        .where(Recipe.id.in_(recipe_ids))
         .options(selectinload(Recipe.tags))
     )
     recipes = recipes_result.scalars().all()
 
-    # Build recipe responses
-    recipe_responses = []
-    for recipe in recipes:
-        # Check if favorited
-        favorite_result = await db.execute(
-            select(UserFavorite).where(
-                UserFavorite.user_id == current_user.id, UserFavorite.recipe_id == recipe.id
-            )
-        )
-        is_favorited = favorite_result.scalar_one_or_none() is not None
-
-        recipe_response = RecipeResponse(
-            id=recipe.id,
-            owner_id=recipe.owner_id,
-            title=recipe.title,
-            description=recipe.description,
-            ingredients=recipe.ingredients,
-            instructions=recipe.instructions,
-            serving_size=recipe.serving_size,
-            prep_time=recipe.prep_time,
-            cook_time=recipe.cook_time,
-            difficulty=recipe.difficulty,
-            category=recipe.category,
-            nutritional_info=recipe.nutritional_info,
-            visibility=recipe.visibility,
-            group_id=recipe.group_id,
-            is_shared=recipe.is_shared,
-            is_public=recipe.is_public,
-            image_url=recipe.image_url,
-            created_at=recipe.created_at,
-            updated_at=recipe.updated_at,
-            is_favorite=is_favorited,
-            tags=[RecipeTagResponse.model_validate(tag) for tag in recipe.tags]
-            if recipe.tags
-            else [],
+    favorites_result = await db.execute(
+        select(UserFavorite.recipe_id).where(
+            UserFavorite.user_id == current_user.id, UserFavorite.recipe_id.in_(recipe_ids)
         )
-        recipe_responses.append(recipe_response)
+    )
+    favorited_recipe_ids = set(favorites_result.scalars().all())
+
+    recipe_responses = RecipeListAdapter.validate_python(recipes, from_attributes=True)
+    for recipe_response in recipe_responses:
+        recipe_response.is_favorite = recipe_response.id in favorited_recipe_ids
 
     return recipe_responses
 
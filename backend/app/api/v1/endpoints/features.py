@@ -4,11 +4,10 @@ import logging
 from typing import Annotated
 
 from fastapi import APIRouter, Depends
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.dependencies import get_db
-from app.models import FeatureToggle
+from app.services.settings_cache import get_feature_flags, is_feature_enabled
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/features", tags=["features"])
@@ -20,10 +19,9 @@ async def get_enabled_features(
 ) -> dict[str, bool]:
     """Get all enabled feature toggles (public endpoint)."""
     logger.debug("Fetching all enabled features")
-    result = await db.execute(select(FeatureToggle).where(FeatureToggle.is_enabled))
-    toggles = result.scalars().all()
+    flags = await get_feature_flags(db)
 
-    return {toggle.feature_key: True for toggle in toggles}
+    return {feature_key: True for feature_key, enabled in flags.items() if enabled}
 
 
 @router.get("/{feature_key}")
@@ -33,7 +31,4 @@ async def check_feature(
 ) -> dict[str, bool]:
     """Check if a specific feature is enabled (public endpoint)."""
     logger.debug("Checking feature: %s", feature_key)
-    result = await db.execute(select(FeatureToggle).where(FeatureToggle.feature_key == feature_key))
-    toggle = result.scalar_one_or_none()
-
-    return {"enabled": toggle.is_enabled if toggle else False}
+    return {"enabled": await is_feature_enabled(db, feature_key)}
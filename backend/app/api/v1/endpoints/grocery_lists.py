@@ -2,7 +2,9 @@
 
 import csv
 import logging
+from collections.abc import Sequence
 from io import StringIO
+from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import HTMLResponse, StreamingResponse
@@ -18,12 +20,13 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/grocery-lists", tags=["Grocery Lists"])
 
 
-def consolidate_ingredients(recipes: list[Recipe]) -> list[dict]:
+def consolidate_ingredients(recipes: Sequence[Any]) -> list[dict]:
     """Consolidate ingredients from multiple recipes."""
     ingredient_map = {}
 
     for recipe in recipes:
-        for ingredient in recipe.ingredients:
+        # Menu items may have no ingredient list
+        for ingredient in recipe.ingredients or ():
             name = ingredient["name"].lower()
             quantity = float(ingredient["quantity"])
             unit = ingredient["unit"]
@@ -85,8 +88,9 @@ async def create_grocery_list(
             detail="Not authorized to access this calendar",
         )
 
-    # Get meals in date range
-    query = select(CalendarMeal).where(CalendarMeal.calendar_id == calendar_id)
+    # Only the recipes' ingredient lists are needed, so select that column for the
+    # recipes planned in the range instead of loading meals and then full recipes
+    meal_recipe_ids = select(CalendarMeal.recipe_id).where(CalendarMeal.calendar_id == calendar_id)
 
     if list_data.date_from:
         # Convert timezone-aware datetime to naive (UTC) for comparison
@@ -95,7 +99,7 @@ async def create_grocery_list(
             if list_data.date_from.tzinfo
             else list_data.date_from
         )
-        query = query.where(CalendarMeal.meal_date >= date_from_naive)
+        meal_recipe_ids = meal_recipe_ids.where(CalendarMeal.meal_date >= date_from_naive)
     if list_data.date_to:
         # Convert timezone-aware datetime to naive (UTC) for comparison
         date_to_naive = (
@@ -103,21 +107,10 @@ async def create_grocery_list(
             if list_data.date_to.tzinfo
             else list_data.date_to
         )
-        query = query.where(CalendarMeal.meal_date <= date_to_naive)
+        meal_recipe_ids = meal_recipe_ids.where(CalendarMeal.meal_date <= date_to_naive)
 
-    result = await db.execute(query)
-    meals = result.scalars().all()
-    logger.debug("Found %d meals for grocery list", len(meals))
-
-    # Get recipes
-    recipe_ids = [meal.recipe_id for meal in meals]
-    result = await db.execute(
-        select(Recipe).where(
-            Recipe.id.in_(recipe_ids),
-            Recipe.deleted_at.is_(None),
-        )
-    )
-    recipes = result.scalars().all()
+    result = await db.execute(select(Recipe.ingredients).where(Recipe.id.in_(meal_recipe_ids)))
+    recipes = result.all()
     logger.debug("Processing %d recipes for grocery list consolidation", len(recipes))
 
     # Consolidate ingredients
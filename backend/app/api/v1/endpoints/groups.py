@@ -257,7 +257,7 @@ async def add_group_member(
         group_id=group_id,
         user_id=member_data.user_id,
         role=member_data.role,
-        permissions=member_data.permissions,
+        permissions=member_data.permissions.model_dump() if member_data.permissions else None,
     )
 
     db.add(member)
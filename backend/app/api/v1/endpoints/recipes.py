@@ -1,26 +1,42 @@
 """Recipe endpoints."""
 
-import json
+import asyncio
 import logging
+import os
 import re
 import uuid
+from collections.abc import AsyncIterator
 from datetime import datetime
 from pathlib import Path
 
 import httpx
+import orjson
 from fastapi import APIRouter, Depends, File, HTTPException, Query, Response, UploadFile, status
-from sqlalchemy import func, or_, select
+from fastapi.responses import StreamingResponse
+from sqlalchemy import and_, func, insert, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import noload, raiseload, selectinload
 
 from app.api.v1.dependencies import get_current_active_user
-from app.config import settings
+from app.config import BACKEND_DIR, settings
 from app.database import get_db
-from app.models import GroupMember, Recipe, RecipeRating, RecipeTag, User, UserFavorite
+from app.models import (
+    DifficultyLevel,
+    GroupMember,
+    Recipe,
+    RecipeRating,
+    RecipeTag,
+    User,
+    UserFavorite,
+)
 from app.schemas import (
+    NutritionalInfo,
     PaginatedRecipeResponse,
     PaginationMetadata,
     RecipeCreate,
+    RecipeListAdapter,
     RecipeQuickAdd,
     RecipeRatingCreate,
     RecipeRatingResponse,
@@ -31,10 +47,30 @@ from app.schemas import (
 )
 from app.services.nutrition import calculate_recipe_nutrition
 from app.services.openai_service import OpenAIService
+from app.utils.http_client import get_http_client, stream_upstream_response
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/recipes", tags=["Menu Items"])
 
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+EXPORT_BATCH_SIZE = 200
+
+# Leading bytes of the image formats accepted for recipe uploads
+_IMAGE_SIGNATURES = (
+    b"\xff\xd8\xff",  # JPEG
+    b"\x89PNG\r\n\x1a\n",  # PNG
+    b"GIF87a",  # GIF
+    b"GIF89a",
+)
+
+
+# Matches either "(100 g) cheese" (pq/pu/pn) or "1/2 cup flour" (fq/fu/fn) in one pass
+_INGREDIENT_MEASUREMENT_RE = re.compile(
+    r"^(?:\((?P<pq>[\d.]+)\s*(?P<pu>[a-zA-Z]+)\)\s*(?P<pn>.+)"
+    r"|(?P<fq>[\d./]+)\s+(?P<fu>[a-zA-Z]+)\s+(?P<fn>.+))$"
+)
+_LEADING_MEASUREMENT_RE = re.compile(r"^[\d./\s()]+[a-zA-Z]+\s+")
+
 
 def clean_ingredient_data(ingredients: list) -> list:
     """Clean malformed ingredient data from database.
@@ -61,43 +97,35 @@ def clean_ingredient_data(ingredients: list) -> list:
         # Check if name contains measurements and try to fix it
         if name and (name[0].isdigit() or name.startswith("(")):
             # Try to parse "1/2 cup flour" or "(100 g) cheese, softened"
-            # Pattern: optional (number unit) or number/number unit, followed by name
-            patterns = [
-                r"^\(([\d.]+)\s*([a-zA-Z]+)\)\s*(.+)$",  # (100 g) cheese
-                r"^([\d./]+)\s+([a-zA-Z]+)\s+(.+)$",  # 1/2 cup flour
-            ]
-
             parsed = False
-            for pattern in patterns:
-                match = re.match(pattern, name)
-                if match:
-                    try:
-                        parsed_qty = match.group(1)
-                        # Handle fractions like 1/2
-                        if "/" in parsed_qty:
-                            parts = parsed_qty.split("/")
-                            parsed_qty = float(parts[0]) / float(parts[1])
-                        else:
-                            parsed_qty = float(parsed_qty)
-
-                        parsed_unit = match.group(2)
-                        parsed_name = match.group(3).strip(", ")
-
-                        # Use parsed values if current values are generic
-                        if unit == "serving" or not unit:
-                            unit = parsed_unit
-                        if quantity == 1 or not quantity:
-                            quantity = parsed_qty
-                        name = parsed_name
-                        parsed = True
-                        break
-                    except (ValueError, IndexError):
-                        continue
+            match = _INGREDIENT_MEASUREMENT_RE.match(name)
+            if match:
+                if match.group("pq") is not None:
+                    raw_qty, parsed_unit, parsed_name = match.group("pq", "pu", "pn")
+                else:
+                    raw_qty, parsed_unit, parsed_name = match.group("fq", "fu", "fn")
+                try:
+                    # Handle fractions like 1/2
+                    if "/" in raw_qty:
+                        parts = raw_qty.split("/")
+                        parsed_qty = float(parts[0]) / float(parts[1])
+                    else:
+                        parsed_qty = float(raw_qty)
+
+                    # Use parsed values if current values are generic
+                    if unit == "serving" or not unit:
+                        unit = parsed_unit
+                    if quantity == 1 or not quantity:
+                        quantity = parsed_qty
+                    name = parsed_name.strip(", ")
+                    parsed = True
+                except (ValueError, IndexError):
+                    pass
 
             # If we couldn't parse, try to extract just the ingredient name
             if not parsed:
                 # Remove leading measurements
-                name = re.sub(r"^[\d./\s()]+[a-zA-Z]+\s+", "", name)
+                name = _LEADING_MEASUREMENT_RE.sub("", name)
                 name = name.strip(", ")
 
         # Ensure we have valid data
@@ -113,6 +141,67 @@ def clean_ingredient_data(ingredients: list) -> list:
     return cleaned
 
 
+async def _clean_recipes_ingredients(recipes: list[Recipe]) -> None:
+    """Clean ingredient data for a page of recipes off the event loop.
+
+    Each recipe's regex normalization runs in a worker thread so a page with
+    large ingredient lists cannot block other requests. Recipes without
+    ingredients skip the thread hop entirely.
+    """
+    pending = [recipe for recipe in recipes if recipe.ingredients]
+    cleaned_lists = await asyncio.gather(
+        *(asyncio.to_thread(clean_ingredient_data, recipe.ingredients) for recipe in pending)
+    )
+    for recipe, cleaned in zip(pending, cleaned_lists):
+        recipe.ingredients = cleaned
+
+
+def _recipe_access_predicates(current_user: User, user_group_ids: list[int]) -> list:
+    """Build the OR-ed predicates for recipes the user may read.
+
+    The group branch is omitted entirely when the user belongs to no groups,
+    so the database never has to evaluate an empty ``IN ()`` clause.
+    """
+    predicates = [
+        Recipe.owner_id == current_user.id,  # User's own recipes
+        Recipe.visibility == "public",  # Public recipes
+    ]
+    if user_group_ids:
+        predicates.append(
+            and_(Recipe.visibility == "group", Recipe.group_id.in_(user_group_ids))
+        )  # Group recipes
+    return predicates
+
+
+def _import_nutritional_info(recipe_data: dict) -> dict | None:
+    """Validate an imported recipe's nutrition facts as the create endpoint would."""
+    nutritional_info = recipe_data.get("nutritional_info")
+    if nutritional_info is None:
+        return None
+    return NutritionalInfo.model_validate(nutritional_info).to_stored()
+
+
+async def _reload_recipe_response(db: AsyncSession, recipe_id: int, user_id: int) -> RecipeResponse:
+    """Reload a recipe with its tags and the user's favorite flag in a single round trip."""
+    is_favorite_expr = (
+        select(UserFavorite.id)
+        .where(UserFavorite.user_id == user_id, UserFavorite.recipe_id == Recipe.id)
+        .exists()
+        .label("is_favorite")
+    )
+    reload_result = await db.execute(
+        select(Recipe, is_favorite_expr)
+        .where(Recipe.id == recipe_id)
+        .options(selectinload(Recipe.tags))
+        .execution_options(populate_existing=True)
+    )
+    recipe, is_favorited = reload_result.one()
+
+    # Tags are already loaded on the instance; only the favorite flag comes from
+    # outside the row, so validate the ORM object directly and patch that in
+    return RecipeResponse.model_validate(recipe).model_copy(update={"is_favorite": is_favorited})
+
+
 @router.post("", response_model=RecipeResponse, status_code=status.HTTP_201_CREATED)
 async def create_recipe(
     recipe_data: RecipeCreate,
@@ -124,6 +213,8 @@ async def create_recipe(
 
     # If no image URL is provided, use the default placeholder image
     recipe_dict = recipe_data.model_dump()
+    if recipe_data.nutritional_info is not None:
+        recipe_dict["nutritional_info"] = recipe_data.nutritional_info.to_stored()
     if not recipe_dict.get("image_url"):
         image_url = settings.DEFAULT_RECIPE_IMAGE
         if image_url and not image_url.startswith(("http://", "https://")):
@@ -139,32 +230,8 @@ async def create_recipe(
     await db.refresh(recipe)
 
     logger.info("Recipe created successfully: recipe_id=%s", recipe.id)
-    # Create RecipeResponse with all fields including is_favorite=False
-    recipe_response = RecipeResponse(
-        id=recipe.id,
-        owner_id=recipe.owner_id,
-        title=recipe.title,
-        description=recipe.description,
-        ingredients=recipe.ingredients,
-        instructions=recipe.instructions,
-        serving_size=recipe.serving_size,
-        prep_time=recipe.prep_time,
-        cook_time=recipe.cook_time,
-        difficulty=recipe.difficulty,
-        category=recipe.category,
-        nutritional_info=recipe.nutritional_info,
-        visibility=recipe.visibility,
-        group_id=recipe.group_id,
-        is_shared=recipe.is_shared,
-        is_public=recipe.is_public,
-        image_url=recipe.image_url,
-        created_at=recipe.created_at,
-        updated_at=recipe.updated_at,
-        is_favorite=False,  # New recipes are not favorited
-        tags=[],  # New recipes have no tags initially
-    )
-
-    return recipe_response
+    # New recipes are not favorited and have no tags yet, which are the defaults
+    return RecipeResponse.model_validate(recipe)
 
 
 @router.post("/quick-add", response_model=RecipeResponse, status_code=status.HTTP_201_CREATED)
@@ -221,33 +288,7 @@ async def quick_add_menu_item(
     await db.refresh(recipe)
 
     logger.info("Menu item quick-added successfully: recipe_id=%s", recipe.id)
-
-    # Create RecipeResponse
-    recipe_response = RecipeResponse(
-        id=recipe.id,
-        owner_id=recipe.owner_id,
-        title=recipe.title,
-        description=recipe.description,
-        ingredients=recipe.ingredients,
-        instructions=recipe.instructions,
-        serving_size=recipe.serving_size,
-        prep_time=recipe.prep_time,
-        cook_time=recipe.cook_time,
-        difficulty=recipe.difficulty,
-        category=recipe.category,
-        nutritional_info=recipe.nutritional_info,
-        visibility=recipe.visibility,
-        group_id=recipe.group_id,
-        is_shared=recipe.is_shared,
-        is_public=recipe.is_public,
-        image_url=recipe.image_url,
-        created_at=recipe.created_at,
-        updated_at=recipe.updated_at,
-        is_favorite=False,
-        tags=[],
-    )
-
-    return recipe_response
+    return RecipeResponse.model_validate(recipe)
 
 
 @router.get("", response_model=PaginatedRecipeResponse)
@@ -257,7 +298,7 @@ async def list_recipes(
     search: str | None = None,
     tags: str | None = Query(None, description="Comma-separated list of tags to filter by"),
     category: str | None = Query(None, description="Recipe category filter"),
-    difficulty: str | None = Query(None, description="Recipe difficulty filter"),
+    difficulty: DifficultyLevel | None = Query(None, description="Recipe difficulty filter"),
     dietary: str | None = Query(
         None, description="Dietary preference filter (tag) - deprecated, use tags"
     ),
@@ -265,7 +306,7 @@ async def list_recipes(
     max_cook_time: int | None = Query(None, description="Maximum cook time in minutes"),
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
-) -> PaginatedRecipeResponse:
+) -> Response:
     """List recipes accessible to the user with optional filters and pagination."""
     logger.debug(
         "Listing recipes: user_id=%s, page=%d, page_size=%d, category=%s",
@@ -281,13 +322,7 @@ async def list_recipes(
     query = (
         select(Recipe)
         .where(
-            Recipe.deleted_at.is_(None),
-            or_(
-                Recipe.owner_id == current_user.id,  # User's own recipes
-                Recipe.visibility == "public",  # Public recipes
-                (Recipe.visibility == "group")
-                & (Recipe.group_id.in_(user_group_ids)),  # Group recipes
-            ),
+            or_(*_recipe_access_predicates(current_user, user_group_ids)),
         )
         .options(selectinload(Recipe.tags))
     )
@@ -322,11 +357,19 @@ async def list_recipes(
     if tags:
         tag_list = [t.strip() for t in tags.split(",") if t.strip()]
         if tag_list:
-            query = query.join(RecipeTag).where(RecipeTag.tag_name.in_(tag_list)).distinct()
+            query = query.where(
+                select(RecipeTag.id)
+                .where(RecipeTag.recipe_id == Recipe.id, RecipeTag.tag_name.in_(tag_list))
+                .exists()
+            )
 
     # Apply dietary preference filter (backward compatibility)
     elif dietary:
-        query = query.join(RecipeTag).where(RecipeTag.tag_name.ilike(f"%{dietary}%")).distinct()
+        query = query.where(
+            select(RecipeTag.id)
+            .where(RecipeTag.recipe_id == Recipe.id, RecipeTag.tag_name.ilike(f"%{dietary}%"))
+            .exists()
+        )
 
     # Get total count before applying pagination
     count_query = select(func.count()).select_from(query.subquery())
@@ -338,6 +381,7 @@ async def list_recipes(
     query = query.offset(skip).limit(page_size)
     result = await db.execute(query)
     recipes = result.scalars().all()
+    await _clean_recipes_ingredients(recipes)
 
     # Get user's favorited recipe IDs
     favorites_result = await db.execute(
@@ -345,46 +389,15 @@ async def list_recipes(
     )
     favorited_recipe_ids = {row[0] for row in favorites_result.all()}
 
-    # Convert to response format with is_favorite field
-    response_recipes = []
-    for recipe in recipes:
-        if recipe.ingredients:
-            recipe.ingredients = clean_ingredient_data(recipe.ingredients)
-
-        # Load tags eagerly to avoid lazy loading issues
-        tag_result = await db.execute(select(RecipeTag).where(RecipeTag.recipe_id == recipe.id))
-        recipe_tags = tag_result.scalars().all()
-
-        # Create RecipeResponse with all fields including is_favorite and tags
-        recipe_response = RecipeResponse(
-            id=recipe.id,
-            owner_id=recipe.owner_id,
-            title=recipe.title,
-            description=recipe.description,
-            ingredients=recipe.ingredients,
-            instructions=recipe.instructions,
-            serving_size=recipe.serving_size,
-            prep_time=recipe.prep_time,
-            cook_time=recipe.cook_time,
-            difficulty=recipe.difficulty,
-            category=recipe.category,
-            nutritional_info=recipe.nutritional_info,
-            visibility=recipe.visibility,
-            group_id=recipe.group_id,
-            is_shared=recipe.is_shared,
-            is_public=recipe.is_public,
-            image_url=recipe.image_url,
-            created_at=recipe.created_at,
-            updated_at=recipe.updated_at,
-            is_favorite=recipe.id in favorited_recipe_ids,
-            tags=[RecipeTagResponse.model_validate(tag) for tag in recipe_tags],
-        )
-        response_recipes.append(recipe_response)
+    # Tags are selectin-loaded with the recipes, so the page validates in one pass
+    response_recipes = RecipeListAdapter.validate_python(recipes, from_attributes=True)
+    for recipe_response in response_recipes:
+        recipe_response.is_favorite = recipe_response.id in favorited_recipe_ids
 
     # Calculate pagination metadata
     total_pages = (total + page_size - 1) // page_size if total > 0 else 0
 
-    return PaginatedRecipeResponse(
+    response = PaginatedRecipeResponse(
         items=response_recipes,
         pagination=PaginationMetadata(
             total=total,
@@ -395,6 +408,9 @@ async def list_recipes(
             has_previous=page > 1,
         ),
     )
+    # The page is already validated; encoding it here skips FastAPI's dump and
+    # re-validation against response_model, which stays for the OpenAPI schema
+    return Response(content=response.model_dump_json(), media_type="application/json")
 
 
 @router.get("/tags/all", response_model=dict)
@@ -415,11 +431,7 @@ async def get_all_tags(
         .join(Recipe, Recipe.id == RecipeTag.recipe_id)
         .where(
             Recipe.deleted_at.is_(None),
-            or_(
-                Recipe.owner_id == current_user.id,
-                Recipe.visibility == "public",
-                (Recipe.visibility == "group") & (Recipe.group_id.in_(user_group_ids)),
-            ),
+            or_(*_recipe_access_predicates(current_user, user_group_ids)),
         )
         .group_by(RecipeTag.tag_name, RecipeTag.tag_category)
         .order_by(RecipeTag.tag_name)
@@ -444,58 +456,28 @@ async def list_favorite_recipes(
     db: AsyncSession = Depends(get_db),
     skip: int = 0,
     limit: int = 100,
-) -> list[RecipeResponse]:
+) -> Response:
     """List user's favorite recipes."""
     result = await db.execute(
         select(Recipe)
         .join(UserFavorite, UserFavorite.recipe_id == Recipe.id)
         .where(
             UserFavorite.user_id == current_user.id,
-            Recipe.deleted_at.is_(None),
         )
         .options(selectinload(Recipe.tags))
         .offset(skip)
         .limit(limit)
     )
     recipes = result.scalars().all()
+    await _clean_recipes_ingredients(recipes)
 
-    # Convert to response format with is_favorite set to True
-    response_recipes = []
-    for recipe in recipes:
-        if recipe.ingredients:
-            recipe.ingredients = clean_ingredient_data(recipe.ingredients)
-
-        # Load tags eagerly to avoid lazy loading issues
-        tag_result = await db.execute(select(RecipeTag).where(RecipeTag.recipe_id == recipe.id))
-        recipe_tags = tag_result.scalars().all()
-
-        # Create RecipeResponse with all fields including is_favorite=True
-        recipe_response = RecipeResponse(
-            id=recipe.id,
-            owner_id=recipe.owner_id,
-            title=recipe.title,
-            description=recipe.description,
-            ingredients=recipe.ingredients,
-            instructions=recipe.instructions,
-            serving_size=recipe.serving_size,
-            prep_time=recipe.prep_time,
-            cook_time=recipe.cook_time,
-            difficulty=recipe.difficulty,
-            category=recipe.category,
-            nutritional_info=recipe.nutritional_info,
-            visibility=recipe.visibility,
-            group_id=recipe.group_id,
-            is_shared=recipe.is_shared,
-            is_public=recipe.is_public,
-            image_url=recipe.image_url,
-            created_at=recipe.created_at,
-            updated_at=recipe.updated_at,
-            is_favorite=True,  # All recipes in favorites are favorited
-            tags=[RecipeTagResponse.model_validate(tag) for tag in recipe_tags],
-        )
-        response_recipes.append(recipe_response)
+    response_recipes = RecipeListAdapter.validate_python(recipes, from_attributes=True)
+    for recipe_response in response_recipes:
+        recipe_response.is_favorite = True  # All recipes in favorites are favorited
 
-    return response_recipes
+    return Response(
+        content=RecipeListAdapter.dump_json(response_recipes), media_type="application/json"
+    )
 
 
 @router.get("/{recipe_id}", response_model=RecipeResponse)
@@ -507,11 +489,8 @@ async def get_recipe(
     """Get a recipe by ID."""
     result = await db.execute(
         select(Recipe)
-        .where(
-            Recipe.id == recipe_id,
-            Recipe.deleted_at.is_(None),
-        )
-        .options(selectinload(Recipe.tags))
+        .where(Recipe.id == recipe_id)
+        .options(selectinload(Recipe.tags), raiseload("*"))
     )
     recipe = result.scalar_one_or_none()
 
@@ -553,36 +532,8 @@ async def get_recipe(
     )
     is_favorited = favorite_result.scalar_one_or_none() is not None
 
-    # Load tags eagerly to avoid lazy loading issues
-    tag_result = await db.execute(select(RecipeTag).where(RecipeTag.recipe_id == recipe.id))
-    recipe_tags = tag_result.scalars().all()
-
-    # Create RecipeResponse with all fields including is_favorite
-    recipe_response = RecipeResponse(
-        id=recipe.id,
-        owner_id=recipe.owner_id,
-        title=recipe.title,
-        description=recipe.description,
-        ingredients=recipe.ingredients,
-        instructions=recipe.instructions,
-        serving_size=recipe.serving_size,
-        prep_time=recipe.prep_time,
-        cook_time=recipe.cook_time,
-        difficulty=recipe.difficulty,
-        category=recipe.category,
-        nutritional_info=recipe.nutritional_info,
-        visibility=recipe.visibility,
-        group_id=recipe.group_id,
-        is_shared=recipe.is_shared,
-        is_public=recipe.is_public,
-        image_url=recipe.image_url,
-        created_at=recipe.created_at,
-        updated_at=recipe.updated_at,
-        is_favorite=is_favorited,
-        tags=[RecipeTagResponse.model_validate(tag) for tag in recipe_tags],
-    )
-
-    return recipe_response
+    # Tags were selectin-loaded with the recipe, so validate the ORM object directly
+    return RecipeResponse.model_validate(recipe).model_copy(update={"is_favorite": is_favorited})
 
 
 @router.put("/{recipe_id}", response_model=RecipeResponse)
@@ -595,10 +546,9 @@ async def update_recipe(
     """Update a recipe."""
     logger.info("Updating recipe: recipe_id=%s, user_id=%s", recipe_id, current_user.id)
     result = await db.execute(
-        select(Recipe).where(
-            Recipe.id == recipe_id,
-            Recipe.deleted_at.is_(None),
-        )
+        select(Recipe)
+        .where(Recipe.id == recipe_id)
+        .options(raiseload("*"))
     )
     recipe = result.scalar_one_or_none()
 
@@ -632,50 +582,14 @@ async def update_recipe(
 
     # Update recipe fields
     update_data = recipe_data.model_dump(exclude_unset=True)
+    if recipe_data.nutritional_info is not None:
+        update_data["nutritional_info"] = recipe_data.nutritional_info.to_stored()
     for field, value in update_data.items():
         setattr(recipe, field, value)
 
     await db.commit()
-    await db.refresh(recipe)
-
-    # Check if recipe is favorited by current user
-    favorite_result = await db.execute(
-        select(UserFavorite).where(
-            UserFavorite.user_id == current_user.id, UserFavorite.recipe_id == recipe_id
-        )
-    )
-    is_favorited = favorite_result.scalar_one_or_none() is not None
 
-    # Load tags eagerly to avoid lazy loading issues
-    tag_result = await db.execute(select(RecipeTag).where(RecipeTag.recipe_id == recipe.id))
-    recipe_tags = tag_result.scalars().all()
-
-    # Create RecipeResponse with all fields including is_favorite
-    recipe_response = RecipeResponse(
-        id=recipe.id,
-        owner_id=recipe.owner_id,
-        title=recipe.title,
-        description=recipe.description,
-        ingredients=recipe.ingredients,
-        instructions=recipe.instructions,
-        serving_size=recipe.serving_size,
-        prep_time=recipe.prep_time,
-        cook_time=recipe.cook_time,
-        difficulty=recipe.difficulty,
-        category=recipe.category,
-        nutritional_info=recipe.nutritional_info,
-        visibility=recipe.visibility,
-        group_id=recipe.group_id,
-        is_shared=recipe.is_shared,
-        is_public=recipe.is_public,
-        image_url=recipe.image_url,
-        created_at=recipe.created_at,
-        updated_at=recipe.updated_at,
-        is_favorite=is_favorited,
-        tags=[RecipeTagResponse.model_validate(tag) for tag in recipe_tags],
-    )
-
-    return recipe_response
+    return await _reload_recipe_response(db, recipe.id, current_user.id)
 
 
 @router.delete("/{recipe_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -687,10 +601,9 @@ async def delete_recipe(
     """Soft delete a recipe."""
     logger.info("Deleting recipe: recipe_id=%s, user_id=%s", recipe_id, current_user.id)
     result = await db.execute(
-        select(Recipe).where(
-            Recipe.id == recipe_id,
-            Recipe.deleted_at.is_(None),
-        )
+        select(Recipe)
+        .where(Recipe.id == recipe_id)
+        .options(raiseload("*"))
     )
     recipe = result.scalar_one_or_none()
 
@@ -726,10 +639,9 @@ async def add_recipe_tag(
     """Add a tag to a recipe."""
     # Check if recipe exists and user has permission
     result = await db.execute(
-        select(Recipe).where(
-            Recipe.id == recipe_id,
-            Recipe.deleted_at.is_(None),
-        )
+        select(Recipe)
+        .where(Recipe.id == recipe_id)
+        .options(raiseload("*"))
     )
     recipe = result.scalar_one_or_none()
 
@@ -774,10 +686,9 @@ async def remove_recipe_tag(
     """Remove a tag from a recipe."""
     # Check if recipe exists and user has permission
     result = await db.execute(
-        select(Recipe).where(
-            Recipe.id == recipe_id,
-            Recipe.deleted_at.is_(None),
-        )
+        select(Recipe)
+        .where(Recipe.id == recipe_id)
+        .options(raiseload("*"))
     )
     recipe = result.scalar_one_or_none()
 
@@ -821,10 +732,9 @@ async def favorite_recipe(
     """Add a recipe to user's favorites."""
     # Check if recipe exists
     result = await db.execute(
-        select(Recipe).where(
-            Recipe.id == recipe_id,
-            Recipe.deleted_at.is_(None),
-        )
+        select(Recipe)
+        .where(Recipe.id == recipe_id)
+        .options(raiseload("*"))
     )
     recipe = result.scalar_one_or_none()
 
@@ -877,6 +787,11 @@ async def unfavorite_recipe(
     await db.commit()
 
 
+def is_image_header(head: bytes) -> bool:
+    """Check whether the leading bytes of a file match a supported image format."""
+    return head.startswith(_IMAGE_SIGNATURES) or (head[:4] == b"RIFF" and head[8:12] == b"WEBP")
+
+
 @router.post("/{recipe_id}/image", response_model=RecipeResponse)
 async def upload_recipe_image(
     recipe_id: int,
@@ -888,10 +803,9 @@ async def upload_recipe_image(
     logger.info("Uploading image for recipe: recipe_id=%s, user_id=%s", recipe_id, current_user.id)
     # Check if recipe exists and user has permission
     result = await db.execute(
-        select(Recipe).where(
-            Recipe.id == recipe_id,
-            Recipe.deleted_at.is_(None),
-        )
+        select(Recipe)
+        .where(Recipe.id == recipe_id)
+        .options(raiseload("*"))
     )
     recipe = result.scalar_one_or_none()
 
@@ -917,6 +831,15 @@ async def upload_recipe_image(
             detail="File must be an image",
         )
 
+    # Sniff the leading bytes rather than trusting the client-supplied content type
+    chunk = await file.read(UPLOAD_CHUNK_SIZE)
+    if not is_image_header(chunk[:12]):
+        logger.warning("Uploaded file for recipe_id=%s is not a recognized image", recipe_id)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="File must be an image",
+        )
+
     # Create uploads directory if it doesn't exist
     upload_dir = Path("uploads/recipes")
     upload_dir.mkdir(parents=True, exist_ok=True)
@@ -926,13 +849,33 @@ async def upload_recipe_image(
     filename = f"{uuid.uuid4()}{file_ext}"
     file_path = upload_dir / filename
 
-    # Save file
+    # Save file, streaming it in chunks so the whole upload is never held in memory.
+    # Disk writes run in a worker thread to keep the event loop free, and go to a
+    # temporary file that is renamed into place so a partial image is never served.
+    tmp_path = file_path.with_name(f"{filename}.tmp")
     try:
-        content = await file.read()
-        with open(file_path, "wb") as f:
-            f.write(content)
+        total_size = 0
+        f = await asyncio.to_thread(open, tmp_path, "wb")
+        try:
+            while chunk:
+                total_size += len(chunk)
+                if total_size > settings.MAX_UPLOAD_SIZE:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail="Image exceeds the maximum upload size",
+                    )
+                await asyncio.to_thread(f.write, chunk)
+                chunk = await file.read(UPLOAD_CHUNK_SIZE)
+        finally:
+            await asyncio.to_thread(f.close)
+        await asyncio.to_thread(os.replace, tmp_path, file_path)
         logger.info("Image saved successfully: recipe_id=%s, filename=%s", recipe_id, filename)
+    except HTTPException:
+        logger.warning("Image upload too large for recipe_id=%s", recipe_id)
+        tmp_path.unlink(missing_ok=True)
+        raise
     except Exception as e:
+        tmp_path.unlink(missing_ok=True)
         logger.error("Failed to save image for recipe_id=%s: %s", recipe_id, str(e), exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -942,44 +885,8 @@ async def upload_recipe_image(
     # Update recipe with image URL (use full backend URL)
     recipe.image_url = f"{settings.BACKEND_URL}/uploads/recipes/{filename}"
     await db.commit()
-    await db.refresh(recipe)
 
-    # Load tags eagerly to avoid lazy loading issues
-    tag_result = await db.execute(select(RecipeTag).where(RecipeTag.recipe_id == recipe.id))
-    recipe_tags = tag_result.scalars().all()
-
-    # Check if favorited
-    favorite_result = await db.execute(
-        select(UserFavorite).where(
-            UserFavorite.user_id == current_user.id, UserFavorite.recipe_id == recipe.id
-        )
-    )
-    is_favorited = favorite_result.scalar_one_or_none() is not None
-
-    # Return properly constructed response
-    return RecipeResponse(
-        id=recipe.id,
-        owner_id=recipe.owner_id,
-        title=recipe.title,
-        description=recipe.description,
-        ingredients=recipe.ingredients,
-        instructions=recipe.instructions,
-        serving_size=recipe.serving_size,
-        prep_time=recipe.prep_time,
-        cook_time=recipe.cook_time,
-        difficulty=recipe.difficulty,
-        category=recipe.category,
-        nutritional_info=recipe.nutritional_info,
-        visibility=recipe.visibility,
-        group_id=recipe.group_id,
-        is_shared=recipe.is_shared,
-        is_public=recipe.is_public,
-        image_url=recipe.image_url,
-        created_at=recipe.created_at,
-        updated_at=recipe.updated_at,
-        is_favorite=is_favorited,
-        tags=[RecipeTagResponse.model_validate(tag) for tag in recipe_tags],
-    )
+    return await _reload_recipe_response(db, recipe.id, current_user.id)
 
 
 @router.post(
@@ -996,10 +903,9 @@ async def rate_recipe(
     """Rate a recipe."""
     # Check if recipe exists
     result = await db.execute(
-        select(Recipe).where(
-            Recipe.id == recipe_id,
-            Recipe.deleted_at.is_(None),
-        )
+        select(Recipe)
+        .where(Recipe.id == recipe_id)
+        .options(raiseload("*"))
     )
     recipe = result.scalar_one_or_none()
 
@@ -1009,34 +915,27 @@ async def rate_recipe(
             detail="Recipe not found",
         )
 
-    # Check if user already rated this recipe
-    result = await db.execute(
-        select(RecipeRating).where(
-            RecipeRating.recipe_id == recipe_id,
-            RecipeRating.user_id == current_user.id,
-        )
-    )
-    existing_rating = result.scalar_one_or_none()
-
-    if existing_rating:
-        # Update existing rating
-        existing_rating.rating = rating_data.rating
-        existing_rating.review = rating_data.review
-        await db.commit()
-        await db.refresh(existing_rating)
-        return existing_rating
-    else:
-        # Create new rating
-        rating = RecipeRating(
+    # Insert or update the user's rating in a single statement
+    dialect_insert = pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+    stmt = (
+        dialect_insert(RecipeRating)
+        .values(
             recipe_id=recipe_id,
             user_id=current_user.id,
             rating=rating_data.rating,
             review=rating_data.review,
         )
-        db.add(rating)
-        await db.commit()
-        await db.refresh(rating)
-        return rating
+        .on_conflict_do_update(
+            index_elements=[RecipeRating.recipe_id, RecipeRating.user_id],
+            set_={"rating": rating_data.rating, "review": rating_data.review},
+        )
+        .returning(RecipeRating)
+        .execution_options(populate_existing=True)
+    )
+    result = await db.execute(stmt)
+    rating = result.scalar_one()
+    await db.commit()
+    return rating
 
 
 @router.get("/{recipe_id}/ratings", response_model=list[RecipeRatingResponse])
@@ -1049,7 +948,7 @@ async def get_recipe_ratings(
     """Get ratings for a recipe."""
     result = await db.execute(
         select(RecipeRating)
-        .options(selectinload(RecipeRating.user))
+        .options(selectinload(RecipeRating.user), raiseload("*"))
         .where(RecipeRating.recipe_id == recipe_id)
         .offset(skip)
         .limit(limit)
@@ -1089,7 +988,9 @@ async def calculate_nutrition(
     db: AsyncSession = Depends(get_db),
 ) -> dict:
     """Calculate nutrition information for a recipe."""
-    result = await db.execute(select(Recipe).where(Recipe.id == recipe_id))
+    result = await db.execute(
+        select(Recipe).where(Recipe.id == recipe_id).options(raiseload("*"))
+    )
     recipe = result.scalar_one_or_none()
 
     if not recipe:
@@ -1110,37 +1011,47 @@ async def calculate_nutrition(
 async def export_recipes(
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
-) -> Response:
-    """Export all user's recipes as JSON."""
-    result = await db.execute(
-        select(Recipe).where(
-            Recipe.owner_id == current_user.id,
-            Recipe.deleted_at.is_(None),
-        )
-    )
-    recipes = result.scalars().all()
+) -> StreamingResponse:
+    """Export all user's recipes as JSON.
 
-    export_data = []
-    for recipe in recipes:
-        export_data.append(
-            {
-                "title": recipe.title,
-                "description": recipe.description,
-                "ingredients": recipe.ingredients,
-                "instructions": recipe.instructions,
-                "serving_size": recipe.serving_size,
-                "prep_time": recipe.prep_time,
-                "cook_time": recipe.cook_time,
-                "difficulty": recipe.difficulty,
-                "category": recipe.category,
-                "nutritional_info": recipe.nutritional_info,
-            }
-        )
+    Rows are streamed from the database and written out one recipe at a time,
+    so memory stays bounded and the client receives bytes after the first row.
+    The body is still a single JSON array, compatible with ``/import``.
+    """
+    result = await db.stream_scalars(
+        select(Recipe)
+        .where(Recipe.owner_id == current_user.id)
+        # Tags are not part of the export; skip their per-batch selectin query
+        .options(noload(Recipe.tags))
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
 
-    json_content = json.dumps(export_data, indent=2)
+    # The generator reads from the request-scoped session after this function
+    # returns; FastAPI >= 0.118 keeps yield dependencies open until the response
+    # has been sent, which is why pyproject.toml pins that floor
+    async def generate_export() -> AsyncIterator[bytes]:
+        yield b"["
+        separator = b"\n"
+        async for recipe in result:
+            yield separator + orjson.dumps(
+                {
+                    "title": recipe.title,
+                    "description": recipe.description,
+                    "ingredients": recipe.ingredients,
+                    "instructions": recipe.instructions,
+                    "serving_size": recipe.serving_size,
+                    "prep_time": recipe.prep_time,
+                    "cook_time": recipe.cook_time,
+                    "difficulty": recipe.difficulty,
+                    "category": recipe.category,
+                    "nutritional_info": recipe.nutritional_info,
+                }
+            )
+            separator = b",\n"
+        yield b"\n]\n"
 
-    return Response(
-        content=json_content,
+    return StreamingResponse(
+        generate_export(),
         media_type="application/json",
         headers={
             "Content-Disposition": (
@@ -1158,32 +1069,42 @@ def get_default_image_url() -> None:
     return None
 
 
-async def get_or_create_seed_user(db: AsyncSession) -> User:
-    """Get or create the seed user for storing seed recipes.
+# The seed user row is never modified or hard-deleted once created, so its id is
+# resolved once per process and reused by every subsequent seed import.
+_seed_user_id: int | None = None
+
+
+async def get_or_create_seed_user_id(db: AsyncSession) -> int:
+    """Get or create the seed user for storing seed recipes and return its id.
 
     Admins can edit these recipes because the permission check includes:
     can_edit = recipe.owner_id == current_user.id or current_user.is_admin
     """
+    global _seed_user_id
+    if _seed_user_id is not None:
+        return _seed_user_id
+
     # Check if seed user exists
-    result = await db.execute(select(User).where(User.username == "_seed_recipes"))
-    seed_user = result.scalars().first()
+    result = await db.execute(select(User.id).where(User.username == "_seed_recipes"))
+    seed_user_id = result.scalars().first()
 
-    if seed_user:
-        return seed_user
+    if seed_user_id is None:
+        from app.utils.auth import get_password_hash
 
-    from app.utils.auth import get_password_hash
+        seed_user = User(
+            username="_seed_recipes",
+            email="seed@recipes.local",
+            password_hash=get_password_hash("seed_password_123"),
+            is_admin=False,
+        )
+        db.add(seed_user)
+        await db.flush()
+        seed_user_id = seed_user.id
+        await db.commit()
+        logger.info("Created seed user for seed recipes")
 
-    seed_user = User(
-        username="_seed_recipes",
-        email="seed@recipes.local",
-        password_hash=get_password_hash("seed_password_123"),
-        is_admin=False,
-    )
-    db.add(seed_user)
-    await db.commit()
-    await db.refresh(seed_user)
-    logger.info("Created seed user for seed recipes")
-    return seed_user
+    _seed_user_id = seed_user_id
+    return seed_user_id
 
 
 @router.post("/seed/import")
@@ -1197,15 +1118,14 @@ async def import_seed_recipes(
     """
     try:
         # Get the seed recipes file from the backend data directory
-        seed_file = Path(__file__).parent.parent.parent.parent / "data" / "seed_recipes.json"
+        seed_file = BACKEND_DIR / "data" / "seed_recipes.json"
         if not seed_file.exists():
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Seed recipes file not found on server",
             )
 
-        with open(seed_file, encoding="utf-8") as f:
-            seed_data = json.load(f)
+        seed_data = orjson.loads(seed_file.read_bytes())
 
         if not isinstance(seed_data, list):
             raise HTTPException(
@@ -1216,24 +1136,33 @@ async def import_seed_recipes(
         # Seed recipes will have a dedicated _seed_recipes user owner
         # but admins can still edit them due to the permission check:
         # can_edit = recipe.owner_id == current_user.id or current_user.is_admin
-        seed_user = await get_or_create_seed_user(db)
+        seed_user_id = await get_or_create_seed_user_id(db)
+
+        # Look up every seed title that already exists in one query, including
+        # soft-deleted ones so removed seed recipes are not re-imported
+        titles = {
+            recipe_data.get("title")
+            for recipe_data in seed_data
+            if isinstance(recipe_data, dict) and recipe_data.get("title")
+        }
+        existing_titles: set[str] = set()
+        if titles:
+            existing_result = await db.execute(
+                select(Recipe.title)
+                .where(Recipe.owner_id == seed_user_id, Recipe.title.in_(titles))
+                .execution_options(include_deleted=True)
+            )
+            existing_titles = set(existing_result.scalars().all())
 
         imported_count = 0
         skipped_count = 0
         errors = []
+        new_recipes: list[dict] = []
 
         for idx, recipe_data in enumerate(seed_data):
             try:
-                # Check if recipe already exists (by title and seed user)
-                result = await db.execute(
-                    select(Recipe).where(
-                        Recipe.title == recipe_data.get("title"),
-                        Recipe.owner_id == seed_user.id,
-                    )
-                )
-                existing = result.scalars().first()
-
-                if existing:
+                # Skip recipes that already exist (by title and seed user)
+                if recipe_data.get("title") in existing_titles:
                     skipped_count += 1
                     continue
 
@@ -1242,27 +1171,33 @@ async def import_seed_recipes(
                     errors.append(f"Recipe {idx + 1}: Missing title")
                     continue
 
-                recipe = Recipe(
-                    title=recipe_data.get("title"),
-                    description=recipe_data.get("description"),
-                    owner_id=seed_user.id,  # Owned by seed user, but admins can still edit
-                    ingredients=recipe_data.get("ingredients"),
-                    instructions=recipe_data.get("instructions"),
-                    serving_size=recipe_data.get("serving_size", 4),
-                    prep_time=recipe_data.get("prep_time"),
-                    cook_time=recipe_data.get("cook_time"),
-                    difficulty=recipe_data.get("difficulty"),
-                    category=recipe_data.get("category", "staple"),
-                    nutritional_info=recipe_data.get("nutritional_info"),
-                    visibility="public",
-                    image_url=None,  # Use default preview image
+                new_recipes.append(
+                    {
+                        "title": recipe_data.get("title"),
+                        "description": recipe_data.get("description"),
+                        # Owned by seed user, but admins can still edit
+                        "owner_id": seed_user_id,
+                        "ingredients": recipe_data.get("ingredients"),
+                        "instructions": recipe_data.get("instructions"),
+                        "serving_size": recipe_data.get("serving_size", 4),
+                        "prep_time": recipe_data.get("prep_time"),
+                        "cook_time": recipe_data.get("cook_time"),
+                        "difficulty": DifficultyLevel.parse(recipe_data.get("difficulty")),
+                        "category": recipe_data.get("category", "staple"),
+                        "nutritional_info": _import_nutritional_info(recipe_data),
+                        "visibility": "public",
+                        "image_url": None,  # Use default preview image
+                    }
                 )
-                db.add(recipe)
+                existing_titles.add(recipe_data.get("title"))
                 imported_count += 1
 
             except Exception as exc:  # noqa: BLE001, F841
                 errors.append(f"Recipe {idx + 1}: {str(exc)}")
 
+        # Insert all new recipes in one bulk statement
+        if new_recipes:
+            await db.execute(insert(Recipe), new_recipes)
         await db.commit()
 
         return {
@@ -1272,7 +1207,7 @@ async def import_seed_recipes(
             "message": f"Successfully imported {imported_count} seed recipes ({skipped_count} already existed)",
         }
 
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid JSON in seed file",
@@ -1296,7 +1231,7 @@ async def import_recipes(
     """Import recipes from JSON file."""
     try:
         content = await file.read()
-        recipes_data = json.loads(content)
+        recipes_data = orjson.loads(content)
 
         if not isinstance(recipes_data, list):
             raise HTTPException(
@@ -1306,6 +1241,7 @@ async def import_recipes(
 
         imported_count = 0
         errors = []
+        new_recipes: list[dict] = []
 
         for idx, recipe_data in enumerate(recipes_data):
             try:
@@ -1314,26 +1250,30 @@ async def import_recipes(
                     errors.append(f"Recipe {idx + 1}: Missing required field 'title'")
                     continue
 
-                recipe = Recipe(
-                    title=recipe_data.get("title"),
-                    description=recipe_data.get("description"),
-                    owner_id=current_user.id,
-                    ingredients=recipe_data.get("ingredients", []),
-                    instructions=recipe_data.get("instructions", []),
-                    serving_size=recipe_data.get("serving_size", 4),
-                    prep_time=recipe_data.get("prep_time"),
-                    cook_time=recipe_data.get("cook_time"),
-                    difficulty=recipe_data.get("difficulty"),
-                    category=recipe_data.get("category"),
-                    nutritional_info=recipe_data.get("nutritional_info"),
-                    visibility="private",
+                new_recipes.append(
+                    {
+                        "title": recipe_data.get("title"),
+                        "description": recipe_data.get("description"),
+                        "owner_id": current_user.id,
+                        "ingredients": recipe_data.get("ingredients", []),
+                        "instructions": recipe_data.get("instructions", []),
+                        "serving_size": recipe_data.get("serving_size", 4),
+                        "prep_time": recipe_data.get("prep_time"),
+                        "cook_time": recipe_data.get("cook_time"),
+                        "difficulty": DifficultyLevel.parse(recipe_data.get("difficulty")),
+                        "category": recipe_data.get("category"),
+                        "nutritional_info": _import_nutritional_info(recipe_data),
+                        "visibility": "private",
+                    }
                 )
-                db.add(recipe)
                 imported_count += 1
 
             except Exception as e:
                 errors.append(f"Recipe {idx + 1}: {str(e)}")
 
+        # Insert all imported recipes in one bulk statement
+        if new_recipes:
+            await db.execute(insert(Recipe), new_recipes)
         await db.commit()
 
         return {
@@ -1342,7 +1282,7 @@ async def import_recipes(
             "message": f"Successfully imported {imported_count} recipes",
         }
 
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid JSON file",
@@ -1366,22 +1306,29 @@ async def download_image_proxy(
     This endpoint fetches an image from an external URL and returns it to the client,
     bypassing CORS restrictions that would prevent direct client-side fetching.
     """
+    client = get_http_client()
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(image_url, follow_redirects=True)
-            response.raise_for_status()
-
-            # Get content type from response or default to jpeg
-            content_type = response.headers.get("content-type", "image/jpeg")
-
-            return Response(
-                content=response.content,
-                media_type=content_type,
-                headers={
-                    "Access-Control-Allow-Origin": "*",
-                    "Cache-Control": "public, max-age=3600",
-                },
-            )
+        upstream = await client.send(
+            client.build_request("GET", image_url), stream=True, follow_redirects=True
+        )
+        try:
+            upstream.raise_for_status()
+        except httpx.HTTPStatusError:
+            await upstream.aclose()
+            raise
+
+        # Get content type from response or default to jpeg
+        content_type = upstream.headers.get("content-type", "image/jpeg")
+
+        # Forward the image chunk by chunk instead of buffering it in memory
+        return stream_upstream_response(
+            upstream,
+            media_type=content_type,
+            headers={
+                "Access-Control-Allow-Origin": "*",
+                "Cache-Control": "public, max-age=3600",
+            },
+        )
     except httpx.HTTPError as e:
         logger.error("Failed to download image from %s: %s", image_url, str(e))
         raise HTTPException(
@@ -1,9 +1,14 @@
 """Application configuration."""
 
 import importlib.metadata
+import json
+import re
+from functools import cached_property
 from pathlib import Path
+from typing import Annotated, Any, ClassVar
 
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import field_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
 # Get the backend directory (parent of app directory)
 BACKEND_DIR = Path(__file__).parent.parent
@@ -18,6 +23,10 @@ def get_app_version() -> str:
         return "unknown"
 
 
+# Resolved once at import; package metadata does not change while the process runs
+APP_VERSION = get_app_version()
+
+
 class Settings(BaseSettings):
     """Application settings."""
 
@@ -30,6 +39,15 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str = "sqlite+aiosqlite:///./meal_planner.db"
+    # Connection pool (ignored for SQLite)
+    DB_POOL_SIZE: int = 25
+    DB_MAX_OVERFLOW: int = 25
+    DB_POOL_RECYCLE: int = 1800  # seconds
+    DB_POOL_TIMEOUT: int = 10  # seconds to wait for a free connection
+    DB_POOL_PRE_PING: bool = True
+    # Compiled SQL cache entries per engine; SQLAlchemy's default of 500 is small for the
+    # number of filter and loader-option combinations the list endpoints produce
+    DB_QUERY_CACHE_SIZE: int = 1200
 
     # Security
     SECRET_KEY: str = "your-secret-key-change-in-production"
@@ -37,8 +55,15 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
 
-    # CORS
-    BACKEND_CORS_ORIGINS: str = "http://localhost:3080,http://localhost:5173"
+    # CORS (JSON list or comma-separated string in the environment)
+    BACKEND_CORS_ORIGINS: Annotated[list[str], NoDecode] = [
+        "http://localhost:3080",
+        "http://localhost:5173",
+    ]
+
+    # Reverse proxies (IPs or CIDR ranges) whose X-Forwarded-For header is trusted
+    # when identifying clients; same formats as BACKEND_CORS_ORIGINS
+    TRUSTED_PROXIES: Annotated[list[str], NoDecode] = []
 
     # Backend URL for generating absolute URLs
     BACKEND_URL: str = "http://localhost:8180"
@@ -75,22 +100,51 @@ class Settings(BaseSettings):
     # Recipe Images
     DEFAULT_RECIPE_IMAGE: str = "/uploads/recipes/missing-image.jpg"
 
+    # Backward-compatible alias; a plain class attribute, not an env setting
+    APP_VERSION: ClassVar[str] = APP_VERSION
+
     model_config = SettingsConfigDict(
         env_file=str(ENV_FILE),
         env_file_encoding="utf-8",
         case_sensitive=True,
     )
 
+    @field_validator("BACKEND_CORS_ORIGINS", "TRUSTED_PROXIES", mode="before")
+    @classmethod
+    def parse_string_list(cls, value: Any) -> Any:
+        """Accept a list setting as a list, a JSON list or a comma-separated string."""
+        if isinstance(value, str):
+            try:
+                items = json.loads(value)
+            except json.JSONDecodeError:
+                items = value.split(",")
+            if isinstance(items, str):
+                items = [items]
+            if isinstance(items, list):
+                return [item.strip() for item in items if isinstance(item, str) and item.strip()]
+            return items
+        return value
+
+    @cached_property
+    def cors_origin_regex(self) -> str | None:
+        """Regex matching wildcard origins such as ``https://*.example.com``.
+
+        Starlette only matches ``allow_origins`` entries literally, so origins
+        with a ``*`` subdomain wildcard are compiled into a single pattern.
+        """
+        wildcard_origins = [
+            origin for origin in self.BACKEND_CORS_ORIGINS if "*" in origin and origin != "*"
+        ]
+        if not wildcard_origins:
+            return None
+        return "|".join(
+            re.escape(origin).replace(r"\*", r"[^./]+") for origin in wildcard_origins
+        )
+
     @property
     def app_version(self) -> str:
-        """Get the application version dynamically."""
-        return get_app_version()
-
-    def __getattr__(self, name: str) -> str:  # type: ignore[no-untyped-def]
-        """Handle backward compatibility for APP_VERSION attribute."""
-        if name == "APP_VERSION":
-            return self.app_version
-        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        """Get the application version."""
+        return APP_VERSION
 
 
 settings = Settings()
@@ -1,19 +1,57 @@
 """Database configuration."""
 
 from collections.abc import AsyncGenerator
+from typing import Any
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 
 from app.config import settings
 
+# Pool sizing only applies to server databases; SQLite uses its own pool classes
+engine_options: dict = {}
+if not settings.DATABASE_URL.startswith("sqlite"):
+    engine_options.update(
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
+if settings.DATABASE_URL.startswith("postgresql+asyncpg"):
+    # Timestamp columns are naive UTC and default to now() on the server, so pin
+    # the session time zone rather than relying on the server's configuration
+    engine_options["connect_args"] = {"server_settings": {"timezone": "UTC"}}
+
 # Create async engine
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
     future=True,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    **engine_options,
 )
 
+
+def set_sqlite_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+    """Tune each new SQLite connection for concurrent web traffic.
+
+    WAL lets readers proceed while a write is in progress, and synchronous=NORMAL
+    only fsyncs at WAL checkpoints instead of on every commit.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256MB
+    cursor.execute("PRAGMA journal_size_limit=67108864")  # 64MB
+    cursor.close()
+
+
+if settings.DATABASE_URL.startswith("sqlite"):
+    event.listen(engine.sync_engine, "connect", set_sqlite_pragmas)
+
 # Create async session factory
 AsyncSessionLocal = sessionmaker(
     engine,
@@ -23,8 +61,19 @@ AsyncSessionLocal = sessionmaker(
     autoflush=False,
 )
 
+
+class _EagerDefaultsBase:
+    """Mixin fetching server-generated defaults and ``onupdate`` values at flush time.
+
+    Without it those attributes are expired after INSERT or UPDATE and would need a lazy
+    refresh, which async sessions cannot do implicitly.
+    """
+
+    __mapper_args__ = {"eager_defaults": True}
+
+
 # Create declarative base
-Base = declarative_base()
+Base = declarative_base(cls=_EagerDefaultsBase)
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
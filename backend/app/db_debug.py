@@ -0,0 +1,43 @@
+"""Helpers that turn unplanned relationship loads into errors.
+
+Response schemas use ``from_attributes``, so a field that reads a relationship
+the query did not load silently issues one extra SELECT per object. These
+helpers make such loads raise instead, so N+1 regressions surface in tests.
+"""
+
+from typing import Any
+
+from sqlalchemy import Select, select
+from sqlalchemy.orm import ORMExecuteState, QueryableAttribute, raiseload, selectinload
+
+from app.models import CalendarMeal, Recipe, RecipeCollection, RecipeIngredient, RecipeRating
+
+# Relationships read by the from_attributes response schemas; queries that feed
+# those schemas must load these up front
+SERIALIZED_RELATIONSHIPS: dict[type, tuple[QueryableAttribute[Any], ...]] = {
+    Recipe: (Recipe.tags,),  # RecipeResponse.tags
+    RecipeRating: (RecipeRating.user,),  # RecipeRatingResponse.user
+    CalendarMeal: (CalendarMeal.recipe,),  # CalendarMealResponse.recipe_name
+    RecipeCollection: (RecipeCollection.items,),  # RecipeCollectionResponse.items
+    # RecipeIngredientResponse.ingredient_recipe
+    RecipeIngredient: (RecipeIngredient.ingredient_recipe,),
+}
+
+
+def safe_select(model: type, *loaded: QueryableAttribute[Any]) -> Select[Any]:
+    """Select ``model`` with ``loaded`` relationships eager-loaded and all others raising."""
+    return select(model).options(*(selectinload(rel) for rel in loaded), raiseload("*"))
+
+
+def raise_on_lazy_load(execute_state: ORMExecuteState) -> None:
+    """``do_orm_execute`` hook adding ``raiseload('*')`` to top-level ORM SELECTs.
+
+    Relationships loaded explicitly by the statement keep working; any other
+    relationship access raises ``InvalidRequestError`` instead of querying.
+    """
+    if (
+        execute_state.is_select
+        and not execute_state.is_column_load
+        and not execute_state.is_relationship_load
+    ):
+        execute_state.statement = execute_state.statement.options(raiseload("*"))
@@ -1,11 +1,16 @@
 """Logging configuration for the application."""
 
+import atexit
 import logging
 import logging.handlers
-import re
+import queue
 import sys
 from pathlib import Path
 
+# Translation table dropping control characters (0x00-0x1F and 0x7F-0x9F);
+# str.translate strips them in a single pass without a regex engine
+_CONTROL_CHARS_TABLE = dict.fromkeys([*range(0x00, 0x20), *range(0x7F, 0xA0)])
+
 
 class SanitizingFilter(logging.Filter):
     """Filter that sanitizes log record arguments to prevent log injection attacks."""
@@ -60,7 +65,7 @@ class SanitizingFilter(logging.Filter):
 
         # Remove all control characters (0x00-0x1F and 0x7F-0x9F)
         # This includes newlines, carriage returns, tabs, ANSI escape sequences, etc.
-        sanitized = re.sub(r'[\x00-\x1F\x7F-\x9F]', '', str_value)
+        sanitized = str_value.translate(_CONTROL_CHARS_TABLE)
         # Truncate to 1000 characters to prevent log flooding
         # (increased from 100 to allow for longer messages)
         return sanitized[:1000]
@@ -96,8 +101,6 @@ def setup_logging(debug: bool = False) -> logging.Logger:
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.DEBUG if debug else logging.INFO)
     console_handler.setFormatter(formatter)
-    console_handler.addFilter(sanitizing_filter)
-    logger.addHandler(console_handler)
 
     # File handler
     file_handler = logging.handlers.RotatingFileHandler(
@@ -107,8 +110,21 @@ def setup_logging(debug: bool = False) -> logging.Logger:
     )
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(formatter)
-    file_handler.addFilter(sanitizing_filter)
-    logger.addHandler(file_handler)
+
+    # Callers only enqueue records; a background listener thread does the
+    # console and file writes so request handlers never block on log I/O.
+    # The sanitizing filter sits on the queue handler because records are
+    # flattened (args and traceback merged into msg) before being enqueued.
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.addFilter(sanitizing_filter)
+    logger.addHandler(queue_handler)
+
+    listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
 
     return logger
 
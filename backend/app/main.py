@@ -1,12 +1,15 @@
-import json
+import asyncio
 import mimetypes
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import urlparse
 
 import httpx
-from fastapi import FastAPI, HTTPException, Query, Response, status
+from fastapi import FastAPI, HTTPException, Query, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy import select
+from fastapi.responses import FileResponse, ORJSONResponse
 
 from app.api.v1.endpoints import (
     admin,
@@ -19,50 +22,84 @@ from app.api.v1.endpoints import (
     groups,
     recipes,
 )
-from app.config import get_app_version, settings
+from app.config import APP_VERSION, settings
 from app.logging_config import setup_logging
+from app.middleware.gzip import SelectiveGZipMiddleware
 from app.middleware.rate_limit import RateLimitMiddleware
-from app.models import BlockedImageDomain
-
-# Get version dynamically
-app_version = get_app_version()
+from app.services.blocked_domains import block_domain, get_blocked_domains
+from app.utils.http_client import (
+    close_http_client,
+    get_http_client,
+    stream_upstream_response,
+)
 
 # Set up logging
 logger = setup_logging(debug=settings.DEBUG)
 
-logger.info(f"Starting {settings.APP_NAME} v{app_version}")
+logger.info(f"Starting {settings.APP_NAME} v{APP_VERSION}")
+
+# Upstream image fetches allowed to wait on external hosts at once; kept below
+# the shared client's max_connections so other outbound calls still get through
+IMAGE_PROXY_CONCURRENCY = 50
+IMAGE_PROXY_ACQUIRE_TIMEOUT = 0.5  # seconds
+_image_proxy_slots = asyncio.Semaphore(IMAGE_PROXY_CONCURRENCY)
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Release shared resources when the application shuts down."""
+    yield
+    await close_http_client()
+
 
 # Create FastAPI app
 app = FastAPI(
     title=settings.APP_NAME,
-    version=app_version,
+    version=APP_VERSION,
     description="API for meal planning and recipe management",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
+    # Encode JSON bodies with orjson instead of the stdlib json module
+    default_response_class=ORJSONResponse,
 )
 
-# Configure CORS
-try:
-    allow_origins = json.loads(settings.BACKEND_CORS_ORIGINS)
-except (json.JSONDecodeError, TypeError):
-    allow_origins = [origin.strip() for origin in settings.BACKEND_CORS_ORIGINS.split(",")]
+# Add rate limiting (increased for normal browsing usage)
+app.add_middleware(
+    RateLimitMiddleware,
+    requests_per_minute=300,  # Increased from 100 - allows for intensive browsing/filtering
+    requests_per_hour=10000,  # Increased from 2000 - allows for extended usage sessions
+    trusted_proxies=settings.TRUSTED_PROXIES,
+)
 
-logger.debug(f"BACKEND_CORS_ORIGINS raw value: {repr(settings.BACKEND_CORS_ORIGINS)}")
-logger.info(f"Parsed CORS allow_origins: {allow_origins}")
+# Configure CORS. Added after rate limiting so it wraps it: preflights are
+# answered before they count against a client's quota, and 429 responses
+# still carry CORS headers the browser can read
+logger.info(f"CORS allow_origins: {settings.BACKEND_CORS_ORIGINS}")
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=allow_origins,
+    allow_origins=settings.BACKEND_CORS_ORIGINS,
+    allow_origin_regex=settings.cors_origin_regex,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type", "Accept"],
+    # Let browsers cache preflight results for a day instead of re-sending
+    # OPTIONS before every non-simple request
+    max_age=86400,
 )
 
-# Add rate limiting (increased for normal browsing usage)
+# Compress JSON responses (recipe lists, exports); small bodies are sent as-is.
+# Added last so it wraps everything, skipping routes that serve images
 app.add_middleware(
-    RateLimitMiddleware,
-    requests_per_minute=300,  # Increased from 100 - allows for intensive browsing/filtering
-    requests_per_hour=10000,  # Increased from 2000 - allows for extended usage sessions
+    SelectiveGZipMiddleware,
+    minimum_size=1024,
+    skip_path_prefixes=(
+        "/uploads/",
+        "/image-proxy",
+        # Covers both /recipes/download-image and /recipes/download-image-proxy
+        f"{settings.API_V1_PREFIX}/recipes/download-image",
+    ),
 )
 
 # Create uploads directory and mount static files
@@ -89,8 +126,27 @@ async def health_check() -> dict[str, str]:
     return {"status": "healthy"}
 
 
+@lru_cache(maxsize=256)
+def _guess_content_type(suffix: str) -> str:
+    """Content type for an uploaded file extension, cached per suffix."""
+    content_type, _ = mimetypes.guess_type(f"file{suffix}")
+    return content_type or "application/octet-stream"
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag using weak comparison."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    etag = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == etag for candidate in if_none_match.split(",")
+    )
+
+
 @app.get("/uploads/{folder}/{filename}")
-async def serve_uploaded_file(folder: str, filename: str) -> Response:
+async def serve_uploaded_file(request: Request, folder: str, filename: str) -> Response:
     """Serve uploaded files with proper CORS headers."""
     file_path = Path("uploads") / folder / filename
 
@@ -100,23 +156,75 @@ async def serve_uploaded_file(folder: str, filename: str) -> Response:
             detail="File not found",
         )
 
-    # Read file content
-    content = file_path.read_bytes()
-
-    # Determine content type
-    content_type, _ = mimetypes.guess_type(str(file_path))
-    if not content_type:
-        content_type = "application/octet-stream"
+    content_type = _guess_content_type(file_path.suffix.lower())
 
-    return Response(
-        content=content,
+    # FileResponse streams the file (sendfile when the server supports it)
+    # instead of reading it into memory, and sets ETag/Last-Modified
+    response = FileResponse(
+        file_path,
         media_type=content_type,
         headers={
             "Access-Control-Allow-Origin": "*",
             "Cache-Control": "public, max-age=86400",
         },
+        stat_result=file_path.stat(),
     )
 
+    # Let browsers revalidate cached images without re-downloading them
+    if _etag_matches(request.headers.get("if-none-match"), response.headers["etag"]):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={
+                "ETag": response.headers["etag"],
+                "Access-Control-Allow-Origin": "*",
+                "Cache-Control": "public, max-age=86400",
+            },
+        )
+
+    return response
+
+
+async def _acquire_image_proxy_slot() -> None:
+    """Take one upstream image fetch slot, failing fast with 503 when all are busy.
+
+    The slot must be given back with ``_image_proxy_slots.release()``; streamed
+    fetches hand that to ``stream_upstream_response`` so the slot is held until
+    the body has been sent and the upstream connection returned to the pool.
+    """
+    try:
+        await asyncio.wait_for(_image_proxy_slots.acquire(), timeout=IMAGE_PROXY_ACQUIRE_TIMEOUT)
+    except TimeoutError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Image proxy is busy, please try again shortly",
+        ) from None
+
+
+@asynccontextmanager
+async def _image_proxy_slot() -> AsyncIterator[None]:
+    """Hold one upstream image fetch slot for a request that is read in full."""
+    await _acquire_image_proxy_slot()
+    try:
+        yield
+    finally:
+        _image_proxy_slots.release()
+
+
+async def _send_image_request(
+    client: httpx.AsyncClient, request: httpx.Request
+) -> httpx.Response:
+    """Open a streamed upstream response while holding an image fetch slot.
+
+    On success the slot stays taken; pass ``on_close=_image_proxy_slots.release``
+    to ``stream_upstream_response`` or release it when closing the response.
+    """
+    await _acquire_image_proxy_slot()
+    try:
+        return await client.send(request, stream=True, follow_redirects=True)
+    except BaseException:
+        _image_proxy_slots.release()
+        raise
+
 
 @app.get("/image-proxy")
 async def download_image_proxy_test(
@@ -138,16 +246,11 @@ async def download_image_proxy_test(
         )
 
     # Check if domain is blocked
-    from app.database import AsyncSessionLocal
-    async with AsyncSessionLocal() as db:
-        result = await db.execute(
-            select(BlockedImageDomain).where(BlockedImageDomain.domain == domain)
+    if domain in await get_blocked_domains():
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Domain {domain} is blocked. Images from this source cannot be downloaded."
         )
-        if result.scalar_one_or_none():
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Domain {domain} is blocked. Images from this source cannot be downloaded."
-            )
 
     try:
         headers = {
@@ -156,24 +259,26 @@ async def download_image_proxy_test(
             "Referer": "https://www.google.com/"
         }
 
-        async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
-            if validate_only:
-                # Only do a HEAD request to check if image is accessible
-                response = await client.head(image_url, headers=headers)
-            else:
-                response = await client.get(image_url, headers=headers)
-
+        client = get_http_client()
+        if validate_only:
+            # Only do a HEAD request to check if image is accessible
+            async with _image_proxy_slot():
+                response = await client.head(image_url, headers=headers, follow_redirects=True)
             response.raise_for_status()
 
-            if validate_only:
-                # Return validation success
-                return Response(
-                    content=json.dumps({"success": True, "domain": domain}),
-                    media_type="application/json",
-                    headers={"Access-Control-Allow-Origin": "*"},
-                )
+            # Return validation success
+            return ORJSONResponse(
+                {"success": True, "domain": domain},
+                headers={"Access-Control-Allow-Origin": "*"},
+            )
+
+        upstream = await _send_image_request(
+            client, client.build_request("GET", image_url, headers=headers)
+        )
+        try:
+            upstream.raise_for_status()
 
-            content_type = response.headers.get("content-type", "image/jpeg")
+            content_type = upstream.headers.get("content-type", "image/jpeg")
 
             # Verify it's actually an image
             logger.info("Image URL %s returned content-type: %s", image_url, content_type)
@@ -182,35 +287,28 @@ async def download_image_proxy_test(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="URL does not point to an image"
                 )
-
-            return Response(
-                content=response.content,
-                media_type=content_type,
-                headers={
-                    "Access-Control-Allow-Origin": "*",
-                    "Cache-Control": "public, max-age=3600",
-                },
-            )
+        except Exception:
+            await upstream.aclose()
+            _image_proxy_slots.release()
+            raise
+
+        return stream_upstream_response(
+            upstream,
+            media_type=content_type,
+            headers={
+                "Access-Control-Allow-Origin": "*",
+                "Cache-Control": "public, max-age=3600",
+            },
+            on_close=_image_proxy_slots.release,
+        )
     except httpx.HTTPStatusError as e:
         # Auto-block domains that return 403 or other HTTP errors
         logger.warning("Domain %s returned HTTP %s, auto-blocking", domain, e.response.status_code)
-        from app.database import AsyncSessionLocal
-        async with AsyncSessionLocal() as db:
-            # Check if already blocked
-            result = await db.execute(
-                select(BlockedImageDomain).where(BlockedImageDomain.domain == domain)
-            )
-            if not result.scalar_one_or_none():
-                if e.response.status_code == 403:
-                    reason = "Auto-blocked: Returned 403 Forbidden"
-                else:
-                    reason = f"Auto-blocked: Returned HTTP {e.response.status_code}"
-                blocked = BlockedImageDomain(
-                    domain=domain,
-                    reason=reason
-                )
-                db.add(blocked)
-                await db.commit()
+        if e.response.status_code == 403:
+            reason = "Auto-blocked: Returned 403 Forbidden"
+        else:
+            reason = f"Auto-blocked: Returned HTTP {e.response.status_code}"
+        await block_domain(domain, reason)
 
         logger.error("Failed to download image from %s: HTTP %s", image_url, e.response.status_code)
         raise HTTPException(
@@ -220,19 +318,7 @@ async def download_image_proxy_test(
     except httpx.HTTPError as e:
         # Auto-block domains that have connection/timeout errors
         logger.warning("Domain %s had connection error, auto-blocking: %s", domain, str(e))
-        from app.database import AsyncSessionLocal
-        async with AsyncSessionLocal() as db:
-            # Check if already blocked
-            result = await db.execute(
-                select(BlockedImageDomain).where(BlockedImageDomain.domain == domain)
-            )
-            if not result.scalar_one_or_none():
-                blocked = BlockedImageDomain(
-                    domain=domain,
-                    reason=f"Auto-blocked: Connection error ({type(e).__name__})"
-                )
-                db.add(blocked)
-                await db.commit()
+        await block_domain(domain, f"Auto-blocked: Connection error ({type(e).__name__})")
 
         logger.error("Failed to download image from %s: %s", image_url, str(e))
         raise HTTPException(
@@ -256,26 +342,34 @@ async def download_image_proxy_direct(
 ) -> Response:
     """Proxy endpoint to download images from external URLs to avoid CORS issues."""
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(image_url, follow_redirects=True)
-            response.raise_for_status()
-
-            content_type = response.headers.get("content-type", "image/jpeg")
-
-            return Response(
-                content=response.content,
-                media_type=content_type,
-                headers={
-                    "Access-Control-Allow-Origin": "*",
-                    "Cache-Control": "public, max-age=3600",
-                },
-            )
+        client = get_http_client()
+        upstream = await _send_image_request(client, client.build_request("GET", image_url))
+        try:
+            upstream.raise_for_status()
+        except httpx.HTTPStatusError:
+            await upstream.aclose()
+            _image_proxy_slots.release()
+            raise
+
+        content_type = upstream.headers.get("content-type", "image/jpeg")
+
+        return stream_upstream_response(
+            upstream,
+            media_type=content_type,
+            headers={
+                "Access-Control-Allow-Origin": "*",
+                "Cache-Control": "public, max-age=3600",
+            },
+            on_close=_image_proxy_slots.release,
+        )
     except httpx.HTTPError as e:
         logger.error("Failed to download image from %s: %s", image_url, str(e))
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Failed to download image: {str(e)}",
         )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("Unexpected error downloading image: %s", str(e))
         raise HTTPException(
@@ -289,6 +383,6 @@ async def root() -> dict[str, str]:
     """Root endpoint."""
     return {
         "message": "Meal Planner API",
-        "version": app_version,
+        "version": APP_VERSION,
         "docs": "/docs",
     }
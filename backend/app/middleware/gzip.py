@@ -0,0 +1,30 @@
+"""Response compression middleware."""
+
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class SelectiveGZipMiddleware:
+    """Gzip responses except on routes that serve already-compressed media.
+
+    Starlette's ``GZipMiddleware`` compresses every content type except event
+    streams, so images served from uploads or the image proxy would otherwise be
+    re-compressed for no size benefit.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 500,
+        skip_path_prefixes: tuple[str, ...] = (),
+    ) -> None:
+        self.app = app
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size)
+        self.skip_path_prefixes = skip_path_prefixes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Compress the response unless the path serves binary media."""
+        if scope["type"] == "http" and scope["path"].startswith(self.skip_path_prefixes):
+            await self.app(scope, receive, send)
+            return
+        await self.gzip(scope, receive, send)
@@ -1,91 +1,159 @@
 """Rate limiting middleware."""
 
+import ipaddress
 import logging
+import os
 import time
-from collections import defaultdict
-from collections.abc import Callable
+from collections import defaultdict, deque
+from collections.abc import Iterable
 
-from fastapi import HTTPException, Request, Response, status
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import status
+from fastapi.responses import ORJSONResponse
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
+# Health check and docs are never rate limited
+SKIP_PATHS = frozenset({"/health", "/docs", "/redoc", "/openapi.json"})
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Rate limiting middleware to prevent API abuse."""
+# Number of rate-limited requests between sweeps for idle client buckets
+BUCKET_SWEEP_INTERVAL = 10_000
+
+
+class RateLimitMiddleware:
+    """Rate limiting middleware to prevent API abuse.
+
+    Implemented as plain ASGI middleware rather than ``BaseHTTPMiddleware`` so
+    allowed requests pass straight through without per-request wrapper objects.
+    """
 
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         requests_per_minute: int = 60,
         requests_per_hour: int = 1000,
-    ):
-        super().__init__(app)
+        trusted_proxies: Iterable[str] = (),
+    ) -> None:
+        self.app = app
         self.requests_per_minute = requests_per_minute
         self.requests_per_hour = requests_per_hour
+        # X-Forwarded-For is only honored when the direct peer is one of these
+        self.trusted_networks = tuple(
+            ipaddress.ip_network(proxy, strict=False) for proxy in trusted_proxies
+        )
+        # Rate limiting is disabled during tests; read once rather than per request
+        self.enabled = not os.environ.get("TESTING")
 
-        # Store request timestamps for each IP
-        self.request_times: dict[str, list[float]] = defaultdict(list)
+        # Store request timestamps for each IP, oldest first
+        self.request_times: dict[str, deque[float]] = defaultdict(deque)
+        self._requests_since_sweep = 0
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process the request and apply rate limiting."""
-        # Disable rate limiting during tests
-        import os
-        if os.environ.get("TESTING"):
-            return await call_next(request)
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Skip rate limiting for health check and docs
-        if request.url.path in ["/health", "/docs", "/redoc", "/openapi.json"]:
-            return await call_next(request)
+        if not self.enabled or scope["path"] in SKIP_PATHS:
+            await self.app(scope, receive, send)
+            return
 
-        # Get client IP
-        client_ip = request.client.host if request.client else "unknown"
+        client_ip = self._client_ip(scope)
 
         current_time = time.time()
 
-        # Clean up old request times (older than 1 hour)
+        # Drop request times older than 1 hour from the front of the window
         one_hour_ago = current_time - 3600
-        self.request_times[client_ip] = [
-            t for t in self.request_times[client_ip] if t > one_hour_ago
-        ]
-
-        # Check rate limits
+        self._requests_since_sweep += 1
+        if self._requests_since_sweep >= BUCKET_SWEEP_INTERVAL:
+            self._evict_idle_buckets(one_hour_ago)
         recent_requests = self.request_times[client_ip]
+        while recent_requests and recent_requests[0] <= one_hour_ago:
+            recent_requests.popleft()
 
         # Check requests per hour
         if len(recent_requests) >= self.requests_per_hour:
             logger.warning("Rate limit exceeded (hourly) for IP: %s", client_ip)
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail="Too many requests. Please try again later.",
-                headers={"Retry-After": "3600"},
+            response = self._too_many_requests(
+                "Too many requests. Please try again later.", retry_after=3600
             )
+            await response(scope, receive, send)
+            return
 
-        # Check requests per minute
+        # Check requests per minute, counting back from the newest timestamp
         one_minute_ago = current_time - 60
-        recent_minute = [t for t in recent_requests if t > one_minute_ago]
-        if len(recent_minute) >= self.requests_per_minute:
+        recent_minute = 0
+        for t in reversed(recent_requests):
+            if t <= one_minute_ago:
+                break
+            recent_minute += 1
+        if recent_minute >= self.requests_per_minute:
             logger.warning("Rate limit exceeded (per minute) for IP: %s", client_ip)
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail="Rate limit exceeded. Please slow down.",
-                headers={"Retry-After": "60"},
+            response = self._too_many_requests(
+                "Rate limit exceeded. Please slow down.", retry_after=60
             )
+            await response(scope, receive, send)
+            return
 
         # Add current request
-        self.request_times[client_ip].append(current_time)
-
-        # Process request
-        response = await call_next(request)
-
-        # Add rate limit headers
-        response.headers["X-RateLimit-Limit-Minute"] = str(self.requests_per_minute)
-        response.headers["X-RateLimit-Limit-Hour"] = str(self.requests_per_hour)
-        response.headers["X-RateLimit-Remaining-Minute"] = str(
-            max(0, self.requests_per_minute - len(recent_minute) - 1)
-        )
-        response.headers["X-RateLimit-Remaining-Hour"] = str(
-            max(0, self.requests_per_hour - len(recent_requests))
+        recent_requests.append(current_time)
+
+        remaining_minute = max(0, self.requests_per_minute - recent_minute - 1)
+        remaining_hour = max(0, self.requests_per_hour - len(recent_requests))
+
+        async def send_with_rate_limit_headers(message: Message) -> None:
+            # Add rate limit headers
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-RateLimit-Limit-Minute"] = str(self.requests_per_minute)
+                headers["X-RateLimit-Limit-Hour"] = str(self.requests_per_hour)
+                headers["X-RateLimit-Remaining-Minute"] = str(remaining_minute)
+                headers["X-RateLimit-Remaining-Hour"] = str(remaining_hour)
+            await send(message)
+
+        await self.app(scope, receive, send_with_rate_limit_headers)
+
+    def _client_ip(self, scope: Scope) -> str:
+        """Identify the client, looking through trusted reverse proxies."""
+        client = scope.get("client")
+        peer = client[0] if client else "unknown"
+        if not self.trusted_networks or not self._is_trusted(peer):
+            return peer
+
+        hops: list[str] = []
+        for name, value in scope["headers"]:
+            if name == b"x-forwarded-for":
+                hops.extend(hop.strip() for hop in value.decode("latin-1").split(","))
+        hops = [hop for hop in hops if hop]
+        # Proxies append to the header, so the nearest untrusted hop is the real
+        # client; entries further left are client-supplied and can be spoofed
+        for hop in reversed(hops):
+            if not self._is_trusted(hop):
+                return hop
+        return hops[0] if hops else peer
+
+    def _is_trusted(self, ip: str) -> bool:
+        try:
+            address = ipaddress.ip_address(ip)
+        except ValueError:
+            return False
+        return any(address in network for network in self.trusted_networks)
+
+    def _evict_idle_buckets(self, cutoff: float) -> None:
+        """Forget clients with no requests since ``cutoff`` so memory stays bounded."""
+        idle_ips = [
+            ip for ip, times in self.request_times.items() if not times or times[-1] <= cutoff
+        ]
+        for ip in idle_ips:
+            del self.request_times[ip]
+        self._requests_since_sweep = 0
+
+    @staticmethod
+    def _too_many_requests(detail: str, retry_after: int) -> ORJSONResponse:
+        """Build the 429 response returned when a client exceeds a limit."""
+        return ORJSONResponse(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            content={"detail": detail},
+            headers={"Retry-After": str(retry_after)},
         )
-
-        return response
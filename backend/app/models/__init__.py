@@ -1,54 +1,133 @@
 """Database models."""
 
-from datetime import datetime
+import enum
+from collections.abc import Callable
+from typing import Any
 
 from sqlalchemy import (
     JSON,
     Boolean,
     Column,
     DateTime,
+    Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
+    delete,
+    event,
+    func,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import ORMExecuteState, Session, relationship, with_loader_criteria
 
 from app.database import Base
 from app.models.blocked_domain import BlockedImageDomain  # noqa: F401
 
+# Postgres stores JSONB pre-parsed instead of re-parsing JSON text on every read;
+# SQLite only has the text type
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+
+class MealType(enum.StrEnum):
+    """Meal slot a recipe is planned for on a calendar."""
+
+    breakfast = "breakfast"
+    lunch = "lunch"
+    dinner = "dinner"
+    snack = "snack"
+
+
+class DifficultyLevel(enum.StrEnum):
+    """Recipe difficulty level."""
+
+    easy = "easy"
+    medium = "medium"
+    hard = "hard"
+
+    @classmethod
+    def parse(cls, value: object) -> "DifficultyLevel | None":
+        """Map a free-form difficulty such as ``"Easy"`` to a member; empty values give None.
+
+        Raises ``ValueError`` for anything that is not a known difficulty, so
+        callers never write a value the enum column cannot load back.
+        """
+        if value is None or value == "":
+            return None
+        if isinstance(value, str):
+            try:
+                return cls(value.strip().lower())
+            except ValueError:
+                pass
+        raise ValueError(f"Invalid difficulty {value!r}; expected one of: {', '.join(cls)}")
+
+
+class GroupRole(enum.StrEnum):
+    """Role of a user within a group."""
+
+    admin = "admin"
+    member = "member"
+
+
+class Visibility(enum.StrEnum):
+    """Who can see a recipe, calendar or grocery list."""
+
+    private = "private"
+    group = "group"
+    public = "public"
+
+
+class SessionTtlUnit(enum.StrEnum):
+    """Unit of the configured session lifetime."""
+
+    minutes = "minutes"
+    hours = "hours"
+    days = "days"
+
 
 class User(Base):
     """User model."""
 
     __tablename__ = "users"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     username = Column(String(50), unique=True, nullable=False, index=True)
     email = Column(String(255), unique=True, nullable=False, index=True)
     password_hash = Column(String(255), nullable=False)
     is_admin = Column(Boolean, default=False, nullable=False)
     force_password_change = Column(Boolean, default=False, nullable=False)  # Admin-set password change flag
-    dietary_preferences = Column(JSON)  # List of preferences: vegan, vegetarian, keto, etc.
+    dietary_preferences = Column(JSONType)  # List of preferences: vegan, vegetarian, keto, etc.
     calorie_target = Column(Integer)  # Daily calorie target
     preferences = Column(
-        JSON
+        JSONType
     )  # Other user preferences: {calendar_start_day: 'monday', theme: 'dark'}
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     deleted_at = Column(DateTime, nullable=True)
 
     # Relationships
-    recipes = relationship("Recipe", back_populates="owner", foreign_keys="Recipe.owner_id")
-    favorites = relationship("UserFavorite", back_populates="user")
-    ratings = relationship("RecipeRating", back_populates="user")
-    calendars = relationship("Calendar", back_populates="owner", foreign_keys="Calendar.owner_id")
+    # A user's own content grows without bound, so these collections are write-only:
+    # iterating them raises, and reads go through .select() with filters and a limit
+    recipes = relationship(
+        "Recipe", back_populates="owner", foreign_keys="Recipe.owner_id", lazy="write_only"
+    )
+    favorites = relationship(
+        "UserFavorite", back_populates="user", lazy="write_only", passive_deletes=True
+    )
+    ratings = relationship("RecipeRating", back_populates="user", lazy="write_only")
+    calendars = relationship(
+        "Calendar", back_populates="owner", foreign_keys="Calendar.owner_id", lazy="write_only"
+    )
     groups_owned = relationship("Group", back_populates="owner", foreign_keys="Group.owner_id")
     group_memberships = relationship("GroupMember", back_populates="user")
-    grocery_lists = relationship("GroceryList", back_populates="user")
-    pantry_items = relationship("PantryInventory", back_populates="user")
+    grocery_lists = relationship(
+        "GroceryList", back_populates="user", lazy="write_only", passive_deletes=True
+    )
+    pantry_items = relationship("PantryInventory", back_populates="user", lazy="write_only")
 
 
 class Recipe(Base):
@@ -56,34 +135,42 @@ class Recipe(Base):
 
     __tablename__ = "recipes"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     title = Column(String(255), nullable=False)  # Only required field
     description = Column(Text)
     owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    ingredients = Column(JSON, nullable=True)  # Optional - List of {name, quantity, unit}
-    instructions = Column(JSON, nullable=True)  # Optional - List of steps
+    ingredients = Column(JSONType, nullable=True)  # Optional - List of {name, quantity, unit}
+    instructions = Column(JSONType, nullable=True)  # Optional - List of steps
     image_url = Column(String(500))
     serving_size = Column(Integer, default=4)
     prep_time = Column(Integer)  # minutes
     cook_time = Column(Integer)  # minutes
-    difficulty = Column(String(20))  # easy, medium, hard
+    difficulty = Column(Enum(DifficultyLevel, name="difficulty_level"))
     category = Column(String(50))  # breakfast, lunch, dinner, snack, dessert, staple, frozen
-    nutritional_info = Column(JSON)  # {calories, protein, carbs, fat, allergens}
-    visibility = Column(String(20), default="private", nullable=False)  # private, group, public
+    nutritional_info = Column(JSONType)  # {calories, protein, carbs, fat, allergens}
+    visibility = Column(Enum(Visibility, name="visibility"), default="private", nullable=False)
     group_id = Column(Integer, ForeignKey("groups.id"), nullable=True)
-    # Deprecated fields - kept for backward compatibility
-    is_shared = Column(Boolean, default=False)
-    is_public = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     deleted_at = Column(DateTime, nullable=True)
 
     # Relationships
     owner = relationship("User", back_populates="recipes", foreign_keys=[owner_id])
     group = relationship("Group", back_populates="recipes", foreign_keys=[group_id])
-    tags = relationship("RecipeTag", back_populates="recipe", cascade="all, delete-orphan")
-    ratings = relationship("RecipeRating", back_populates="recipe", cascade="all, delete-orphan")
-    favorites = relationship("UserFavorite", back_populates="recipe", cascade="all, delete-orphan")
+    # Tags are part of every recipe response, so load them alongside the recipes
+    tags = relationship(
+        "RecipeTag",
+        back_populates="recipe",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="selectin",
+    )
+    ratings = relationship(
+        "RecipeRating", back_populates="recipe", cascade="all, delete-orphan", passive_deletes=True
+    )
+    favorites = relationship(
+        "UserFavorite", back_populates="recipe", cascade="all, delete-orphan", passive_deletes=True
+    )
     calendar_meals = relationship("CalendarMeal", back_populates="recipe")
     recipe_ingredients = relationship(
         "RecipeIngredient",
@@ -97,13 +184,32 @@ class Recipe(Base):
         foreign_keys="RecipeIngredient.ingredient_recipe_id",
     )
 
+    # Partial indexes only cover live rows, keeping them small for the access-filtered lists
+    __table_args__ = (
+        Index(
+            "ix_recipes_active",
+            "owner_id",
+            "visibility",
+            "group_id",
+            postgresql_where=deleted_at.is_(None),
+            sqlite_where=deleted_at.is_(None),
+        ),
+        Index(
+            "ix_recipes_active_created",
+            created_at.desc(),
+            id.desc(),
+            postgresql_where=deleted_at.is_(None),
+            sqlite_where=deleted_at.is_(None),
+        ),
+    )
+
 
 class RecipeIngredient(Base):
     """Recipe ingredient model - supports both regular ingredients and staple recipes."""
 
     __tablename__ = "recipe_ingredients"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     recipe_id = Column(
         Integer, ForeignKey("recipes.id", ondelete="CASCADE"), nullable=False, index=True
     )
@@ -128,15 +234,20 @@ class RecipeTag(Base):
 
     __tablename__ = "recipe_tags"
 
-    id = Column(Integer, primary_key=True, index=True)
-    recipe_id = Column(Integer, ForeignKey("recipes.id"), nullable=False)
+    id = Column(Integer, primary_key=True)
+    recipe_id = Column(Integer, ForeignKey("recipes.id", ondelete="CASCADE"), nullable=False)
     tag_name = Column(String(50), nullable=False)
     tag_category = Column(String(50))  # dietary, meal_type, cuisine, etc.
 
     # Relationships
     recipe = relationship("Recipe", back_populates="tags")
 
-    __table_args__ = (UniqueConstraint("recipe_id", "tag_name", name="uq_recipe_tag"),)
+    # The unique constraint serves per-recipe tag lookups; the tag listings group
+    # and sort by name and category across all recipes
+    __table_args__ = (
+        UniqueConstraint("recipe_id", "tag_name", name="uq_recipe_tag"),
+        Index("ix_recipe_tags_name_category", "tag_name", "tag_category"),
+    )
 
 
 class RecipeRating(Base):
@@ -144,12 +255,12 @@ class RecipeRating(Base):
 
     __tablename__ = "recipe_ratings"
 
-    id = Column(Integer, primary_key=True, index=True)
-    recipe_id = Column(Integer, ForeignKey("recipes.id"), nullable=False)
+    id = Column(Integer, primary_key=True)
+    recipe_id = Column(Integer, ForeignKey("recipes.id", ondelete="CASCADE"), nullable=False)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     rating = Column(Integer, nullable=False)  # 1-5
     review = Column(Text)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
 
     # Relationships
     recipe = relationship("Recipe", back_populates="ratings")
@@ -163,10 +274,10 @@ class UserFavorite(Base):
 
     __tablename__ = "user_favorites"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    recipe_id = Column(Integer, ForeignKey("recipes.id"), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    recipe_id = Column(Integer, ForeignKey("recipes.id", ondelete="CASCADE"), nullable=False)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
 
     # Relationships
     user = relationship("User", back_populates="favorites")
@@ -180,20 +291,23 @@ class Calendar(Base):
 
     __tablename__ = "calendars"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     name = Column(String(100), nullable=False)
     owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     group_id = Column(Integer, ForeignKey("groups.id"), nullable=True)
-    visibility = Column(String(20), default="private", nullable=False)  # private, group, public
-    # Deprecated field - kept for backward compatibility
-    is_shared = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    visibility = Column(Enum(Visibility, name="visibility"), default="private", nullable=False)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
     # Relationships
     owner = relationship("User", back_populates="calendars", foreign_keys=[owner_id])
     group = relationship("Group", back_populates="calendars")
-    meals = relationship("CalendarMeal", back_populates="calendar", cascade="all, delete-orphan")
+    meals = relationship(
+        "CalendarMeal",
+        back_populates="calendar",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
 
 
 class CalendarMeal(Base):
@@ -201,37 +315,43 @@ class CalendarMeal(Base):
 
     __tablename__ = "calendar_meals"
 
-    id = Column(Integer, primary_key=True, index=True)
-    calendar_id = Column(Integer, ForeignKey("calendars.id"), nullable=False)
+    id = Column(Integer, primary_key=True)
+    calendar_id = Column(Integer, ForeignKey("calendars.id", ondelete="CASCADE"), nullable=False)
     recipe_id = Column(Integer, ForeignKey("recipes.id"), nullable=False)
     meal_date = Column(DateTime, nullable=False)
-    meal_type = Column(String(20), nullable=False)  # breakfast, lunch, dinner, snack
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    meal_type = Column(Enum(MealType, name="meal_type"), nullable=False)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
 
     # Relationships
     calendar = relationship("Calendar", back_populates="meals")
-    recipe = relationship("Recipe", back_populates="calendar_meals")
+    # Meals are always shown with their recipe (see recipe_name); a many-to-one join is cheap
+    recipe = relationship("Recipe", back_populates="calendar_meals", lazy="joined")
 
     @property
     def recipe_name(self) -> str | None:
         """Get the recipe name from the loaded relationship."""
         return self.recipe.title if self.recipe else None
 
+    # Calendar views load a date range of one calendar's meals
+    __table_args__ = (Index("ix_calendar_meal_cal_date", "calendar_id", "meal_date"),)
+
 
 class Group(Base):
     """Group model for sharing."""
 
     __tablename__ = "groups"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     name = Column(String(100), nullable=False)
     owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
     # Relationships
     owner = relationship("User", back_populates="groups_owned", foreign_keys=[owner_id])
-    members = relationship("GroupMember", back_populates="group", cascade="all, delete-orphan")
+    members = relationship(
+        "GroupMember", back_populates="group", cascade="all, delete-orphan", passive_deletes=True
+    )
     calendars = relationship("Calendar", back_populates="group")
     recipes = relationship("Recipe", back_populates="group", foreign_keys="Recipe.group_id")
     grocery_lists = relationship("GroceryList", back_populates="group")
@@ -242,18 +362,22 @@ class GroupMember(Base):
 
     __tablename__ = "group_members"
 
-    id = Column(Integer, primary_key=True, index=True)
-    group_id = Column(Integer, ForeignKey("groups.id"), nullable=False)
+    id = Column(Integer, primary_key=True)
+    group_id = Column(Integer, ForeignKey("groups.id", ondelete="CASCADE"), nullable=False)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    role = Column(String(20), default="member")  # admin, member
-    permissions = Column(JSON)  # {can_edit: bool, can_view: bool}
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    role = Column(Enum(GroupRole, name="group_role"), default=GroupRole.member)
+    permissions = Column(JSONType)  # {can_edit: bool, can_view: bool}
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
 
     # Relationships
     group = relationship("Group", back_populates="members")
     user = relationship("User", back_populates="group_memberships")
 
-    __table_args__ = (UniqueConstraint("group_id", "user_id", name="uq_group_member"),)
+    # The unique constraint leads with group_id; membership lookups by user need their own index
+    __table_args__ = (
+        UniqueConstraint("group_id", "user_id", name="uq_group_member"),
+        Index("ix_group_members_user", "user_id"),
+    )
 
 
 class GroceryList(Base):
@@ -261,15 +385,15 @@ class GroceryList(Base):
 
     __tablename__ = "grocery_lists"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     name = Column(String(100), nullable=False)
     date_from = Column(DateTime)
     date_to = Column(DateTime)
-    items = Column(JSON, nullable=False)  # List of consolidated items
-    visibility = Column(String(20), default="private", nullable=False)  # private, group, public
+    items = Column(JSONType, nullable=False)  # List of consolidated items
+    visibility = Column(Enum(Visibility, name="visibility"), default="private", nullable=False)
     group_id = Column(Integer, ForeignKey("groups.id"), nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
 
     # Relationships
     user = relationship("User", back_populates="grocery_lists")
@@ -281,12 +405,12 @@ class PantryInventory(Base):
 
     __tablename__ = "pantry_inventory"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     ingredient_name = Column(String(100), nullable=False)
     quantity = Column(Float, nullable=False)
     unit = Column(String(50))
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
     # Relationships
     user = relationship("User", back_populates="pantry_items")
@@ -299,13 +423,13 @@ class FeatureToggle(Base):
 
     __tablename__ = "feature_toggles"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     feature_key = Column(String(100), unique=True, nullable=False, index=True)
     feature_name = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
     is_enabled = Column(Boolean, default=False, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
 
 class OpenAISettings(Base):
@@ -320,7 +444,7 @@ class OpenAISettings(Base):
     max_tokens = Column(Integer, default=2000, nullable=False)
     system_prompt = Column(Text, nullable=True)
     searxng_url = Column(String(255), default="http://localhost:8085")  # SEARXNG URL
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
 
 class SessionSettings(Base):
@@ -330,8 +454,10 @@ class SessionSettings(Base):
 
     id = Column(Integer, primary_key=True)
     session_ttl_value = Column(Integer, default=90, nullable=False)  # Numeric value
-    session_ttl_unit = Column(String(20), default="days", nullable=False)  # minutes, hours, or days
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    session_ttl_unit = Column(
+        Enum(SessionTtlUnit, name="session_ttl_unit"), default="days", nullable=False
+    )
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
 
 class EmailSettings(Base):
@@ -342,7 +468,7 @@ class EmailSettings(Base):
     id = Column(Integer, primary_key=True)
     sendgrid_api_key = Column(String(255), nullable=True)
     admin_email = Column(String(255), default="admin@mealplanner.local", nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
 
 class PasswordResetToken(Base):
@@ -350,34 +476,47 @@ class PasswordResetToken(Base):
 
     __tablename__ = "password_reset_tokens"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     token = Column(String(255), unique=True, nullable=False, index=True)
     expires_at = Column(DateTime, nullable=False)
     used_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
 
     # Relationships
     user = relationship("User")
 
+    __table_args__ = (
+        # Requesting a reset invalidates the user's outstanding tokens
+        Index(
+            "ix_password_reset_tokens_unused_user",
+            "user_id",
+            postgresql_where=used_at.is_(None),
+            sqlite_where=used_at.is_(None),
+        ),
+    )
+
 
 class RecipeCollection(Base):
     """Recipe collection model for organizing recipes."""
 
     __tablename__ = "recipe_collections"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     name = Column(String(100), nullable=False)
     description = Column(Text, nullable=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     deleted_at = Column(DateTime, nullable=True)
 
     # Relationships
     user = relationship("User")
     items = relationship(
-        "RecipeCollectionItem", back_populates="collection", cascade="all, delete-orphan"
+        "RecipeCollectionItem",
+        back_populates="collection",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
 
@@ -386,13 +525,70 @@ class RecipeCollectionItem(Base):
 
     __tablename__ = "recipe_collection_items"
 
-    id = Column(Integer, primary_key=True, index=True)
-    collection_id = Column(Integer, ForeignKey("recipe_collections.id"), nullable=False)
+    id = Column(Integer, primary_key=True)
+    collection_id = Column(
+        Integer, ForeignKey("recipe_collections.id", ondelete="CASCADE"), nullable=False
+    )
     recipe_id = Column(Integer, ForeignKey("recipes.id"), nullable=False)
-    added_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    added_at = Column(DateTime, server_default=func.now(), nullable=False)
 
     # Relationships
     collection = relationship("RecipeCollection", back_populates="items")
-    recipe = relationship("Recipe")
+    # Items are always listed with their recipe's title and category
+    recipe = relationship("Recipe", lazy="joined")
 
     __table_args__ = (UniqueConstraint("collection_id", "recipe_id", name="uq_collection_recipe"),)
+
+
+# Built once and reused; the criteria carries no per-query state
+_ACTIVE_RECIPES_CRITERIA = with_loader_criteria(
+    Recipe, Recipe.deleted_at.is_(None), include_aliases=True
+)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _exclude_soft_deleted_recipes(execute_state: ORMExecuteState) -> None:
+    """Hide soft-deleted recipes from ORM SELECTs that query recipes directly.
+
+    Only statements whose selected entities include ``Recipe`` are filtered.
+    Statements that merely join to recipes, and relationship or column loads,
+    are left alone so related objects such as a calendar meal's recipe still
+    resolve. Queries that need deleted rows can opt out with
+    ``execution_options(include_deleted=True)``.
+    """
+    if (
+        not execute_state.is_select
+        or execute_state.is_column_load
+        or execute_state.is_relationship_load
+        or execute_state.execution_options.get("include_deleted", False)
+    ):
+        return
+
+    recipe_mapper = Recipe.__mapper__
+    if execute_state.bind_mapper is recipe_mapper or recipe_mapper in execute_state.all_mappers:
+        execute_state.statement = execute_state.statement.options(_ACTIVE_RECIPES_CRITERIA)
+
+
+def _delete_children(child_column: Any) -> Callable[[Any, Connection, Any], None]:
+    """Build a ``before_delete`` hook removing a parent's children in one statement.
+
+    The parent relationships use ``passive_deletes=True`` so the ORM does not
+    load children just to delete them one by one. PostgreSQL would also cascade
+    through ``ON DELETE CASCADE``, but SQLite does not enforce foreign keys here, so
+    the hook deletes them explicitly on every backend.
+    """
+
+    def delete_children(_mapper: Any, connection: Connection, target: Any) -> None:
+        connection.execute(delete(child_column.table).where(child_column == target.id))
+
+    return delete_children
+
+
+# Parents that are hard-deleted through the API; recipes are only soft-deleted
+event.listen(Calendar, "before_delete", _delete_children(CalendarMeal.__table__.c.calendar_id))
+event.listen(
+    RecipeCollection,
+    "before_delete",
+    _delete_children(RecipeCollectionItem.__table__.c.collection_id),
+)
+event.listen(Group, "before_delete", _delete_children(GroupMember.__table__.c.group_id))
@@ -1,8 +1,6 @@
 """Blocked image domain model."""
 
-from datetime import datetime
-
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, func
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -13,10 +11,10 @@ class BlockedImageDomain(Base):
 
     __tablename__ = "blocked_image_domains"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     domain = Column(String, unique=True, nullable=False, index=True)
     reason = Column(String, nullable=True)
-    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.now)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     created_by_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
 
     # Relationships
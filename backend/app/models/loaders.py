@@ -0,0 +1,29 @@
+"""Query builders that load a many-to-one parent through a single JOIN.
+
+Adding ``joinedload`` to a query that already joins the same table makes
+SQLAlchemy emit a second, aliased JOIN. These builders join once and populate
+the relationship from that join with ``contains_eager``; callers can filter on
+the joined table without joining it again. Outer joins keep rows whose parent
+is missing, matching what a lazy load would return. A many-to-one join never
+multiplies rows, so the statements are safe to combine with ``offset``/``limit``;
+for to-many relationships on paginated queries use ``selectinload`` instead.
+"""
+
+from sqlalchemy import Select, select
+from sqlalchemy.orm import contains_eager
+
+from app.models import CalendarMeal, Recipe
+
+
+def select_recipes_with_owner() -> Select[tuple[Recipe]]:
+    """Select recipes with ``Recipe.owner`` loaded from the same query."""
+    return select(Recipe).outerjoin(Recipe.owner).options(contains_eager(Recipe.owner))
+
+
+def select_meals_with_recipe() -> Select[tuple[CalendarMeal]]:
+    """Select calendar meals with ``CalendarMeal.recipe`` loaded from the same query."""
+    return (
+        select(CalendarMeal)
+        .outerjoin(CalendarMeal.recipe)
+        .options(contains_eager(CalendarMeal.recipe))
+    )
@@ -1,22 +1,63 @@
 """Pydantic schemas for API validation."""
 
+import re
 from datetime import datetime
-from typing import Any
-
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from typing import Annotated, Any, Literal
+
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    Field,
+    StringConstraints,
+    TypeAdapter,
+    field_validator,
+)
+from typing_extensions import TypedDict
 
 from app.schemas.blocked_domain import (  # noqa: F401
     BlockedDomainCreate,
     BlockedDomainResponse,
 )
 
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+# Leading number of a free-text amount such as "250 kcal" or "12.5g"
+_LEADING_NUMBER_RE = re.compile(r"\d+(?:\.\d+)?")
+_NUTRIENT_AMOUNT_KEYS = frozenset({"calories", "protein", "carbs", "fat", "fiber"})
+
+
+def _validate_email(value: str) -> str:
+    """Check the address shape and lowercase its domain, which is case-insensitive."""
+    # fullmatch, unlike a $ anchor, also rejects a trailing newline
+    if not _EMAIL_RE.fullmatch(value):
+        raise ValueError("value is not a valid email address")
+    local, _, domain = value.rpartition("@")
+    return f"{local}@{domain.lower()}"
+
+
+# Addresses are only used to contact users, so a shape check is enough here
+Email = Annotated[str, AfterValidator(_validate_email)]
+
+# Closed vocabularies stored in enum-typed columns (see the enums in app.models)
+DifficultyValue = Literal["easy", "medium", "hard"]
+VisibilityValue = Literal["private", "group", "public"]
+MealTypeValue = Literal["breakfast", "lunch", "dinner", "snack"]
+GroupRoleValue = Literal["admin", "member"]
+SessionTtlUnitValue = Literal["minutes", "hours", "days"]
+
+# Closed vocabularies validated at the API boundary only
+RecipeCategoryValue = Literal[
+    "breakfast", "lunch", "dinner", "snack", "dessert", "staple", "frozen"
+]
+CalendarPeriodValue = Literal["day", "week", "month"]
+
 
 # User Schemas
 class UserBase(BaseModel):
     """Base user schema."""
 
     username: str = Field(..., min_length=3, max_length=50)
-    email: EmailStr
+    email: Email
 
 
 class UserCreate(UserBase):
@@ -24,16 +65,20 @@ class UserCreate(UserBase):
 
     password: str = Field(..., min_length=8)
 
+    model_config = {"extra": "forbid", "frozen": True}
+
 
 class UserUpdate(BaseModel):
     """User update schema."""
 
-    email: EmailStr | None = None
+    email: Email | None = None
     password: str | None = Field(None, min_length=8)
     dietary_preferences: list[str] | None = None
     calorie_target: int | None = Field(None, gt=0)
     preferences: dict[str, Any] | None = None
 
+    model_config = {"extra": "forbid", "frozen": True}
+
 
 class UserResponse(UserBase):
     """User response schema."""
@@ -60,7 +105,7 @@ class UserLogin(BaseModel):
 class PasswordResetRequest(BaseModel):
     """Password reset request schema."""
 
-    email: EmailStr
+    email: Email
 
 
 class PasswordResetConfirm(BaseModel):
@@ -100,57 +145,29 @@ class TokenData(BaseModel):
 
 
 # Recipe Schemas
+# Words that, as the first word of an ingredient name, mean it carries a measurement
+_MEASUREMENT_UNITS = frozenset("tsp tbsp cup cups oz lb lbs g kg ml l qt gal pint quart".split())
+
+
 class IngredientSchema(BaseModel):
     """Ingredient schema."""
 
-    name: str
+    name: Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
     quantity: float
-    unit: str
+    unit: Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
 
     @field_validator("name")
     @classmethod
     def validate_name(cls, v: str) -> str:
         """Validate ingredient name doesn't contain measurements."""
-        if not v or not v.strip():
-            raise ValueError("Ingredient name cannot be empty")
-
-        # Check if name starts with a number or fraction (likely has measurement)
-        v = v.strip()
-        if v and (v[0].isdigit() or v.startswith("(")):
+        # A leading number or fraction ("1/2 tsp flour") or a unit as the first
+        # word ("tsp garlic") means the measurement was put in the name
+        first_word, _, _ = v.partition(" ")
+        if v[0].isdigit() or v[0] == "(" or first_word.lower() in _MEASUREMENT_UNITS:
             raise ValueError(
                 f'Ingredient name "{v}" appears to contain measurements. '
                 "Please put measurements in quantity/unit fields only."
             )
-
-        # Check for actual measurement units as standalone first words or second words
-        # Only flag if they appear as measurement units (e.g., "1/2 tsp flour" or "tsp garlic")
-        words = v.split()
-        if len(words) > 0:
-            first_word = words[0].lower()
-            # Check if first word is a measurement unit (not just contains the letters)
-            exact_measurement_units = [
-                "tsp",
-                "tbsp",
-                "cup",
-                "cups",
-                "oz",
-                "lb",
-                "lbs",
-                "g",
-                "kg",
-                "ml",
-                "l",
-                "qt",
-                "gal",
-                "pint",
-                "quart",
-            ]
-            if first_word in exact_measurement_units:
-                raise ValueError(
-                    f'Ingredient name "{v}" appears to contain measurements. '
-                    "Please put measurements in quantity/unit fields only."
-                )
-
         return v
 
     @field_validator("quantity")
@@ -164,17 +181,58 @@ class IngredientSchema(BaseModel):
     @field_validator("unit")
     @classmethod
     def validate_unit(cls, v: str) -> str:
-        """Validate unit is not empty and warn about generic units."""
-        if not v or not v.strip():
-            raise ValueError("Ingredient unit cannot be empty")
+        """Normalize the generic "serving" unit to lowercase."""
+        if v.lower() == "serving":
+            return "serving"
+        return v
 
-        v = v.strip()
-        # Warn about overly generic units
-        if v.lower() == "serving" and v != "serving":
-            # Normalize to lowercase
-            v = "serving"
 
-        return v
+def _clean_stored_nutrition(value: Any) -> Any:
+    """Coerce legacy ``nutritional_info`` JSON so stored recipes stay readable.
+
+    Older rows may hold free-text amounts such as ``"250 kcal"``. Amounts keep
+    their leading number and anything unparsable is dropped, so one bad entry
+    does not fail the whole recipe response. Other nutrients are passed through.
+    """
+    if value is None or isinstance(value, BaseModel):
+        return value
+    if not isinstance(value, dict):
+        return None
+    cleaned: dict[str, Any] = {}
+    for key, amount in value.items():
+        if key == "allergens":
+            if isinstance(amount, list):
+                cleaned[key] = [item for item in amount if isinstance(item, str)]
+        elif key not in _NUTRIENT_AMOUNT_KEYS:
+            cleaned[key] = amount
+        elif isinstance(amount, int | float) and not isinstance(amount, bool):
+            cleaned[key] = amount
+        elif isinstance(amount, str):
+            match = _LEADING_NUMBER_RE.match(amount.strip())
+            if match:
+                cleaned[key] = float(match.group())
+    return cleaned
+
+
+class NutritionalInfo(BaseModel):
+    """Per-serving nutrition facts stored with a recipe.
+
+    The common nutrients are typed; any others (sodium, sugar, ...) are kept
+    as given so they round-trip through export and import.
+    """
+
+    calories: float | None = None
+    protein: float | None = None
+    carbs: float | None = None
+    fat: float | None = None
+    fiber: float | None = None
+    allergens: list[str] = Field(default_factory=list)
+
+    model_config = {"from_attributes": True, "extra": "allow", "frozen": True}
+
+    def to_stored(self) -> dict[str, Any]:
+        """Dump the facts for the JSON column, leaving out values never given."""
+        return self.model_dump(exclude_unset=True, exclude_none=True)
 
 
 class RecipeBase(BaseModel):
@@ -187,16 +245,11 @@ class RecipeBase(BaseModel):
     serving_size: int = 4
     prep_time: int | None = None
     cook_time: int | None = None
-    difficulty: str | None = Field(None, pattern="^(easy|medium|hard)$")
-    category: str | None = Field(
-        None, pattern="^(breakfast|lunch|dinner|snack|dessert|staple|frozen)$"
-    )
-    nutritional_info: dict[str, Any] | None = None
-    visibility: str = Field("private", pattern="^(private|group|public)$")
+    difficulty: DifficultyValue | None = None
+    category: RecipeCategoryValue | None = None
+    nutritional_info: NutritionalInfo | None = None
+    visibility: VisibilityValue = "private"
     group_id: int | None = None
-    # Deprecated fields - kept for backward compatibility
-    is_shared: bool = False
-    is_public: bool = False
 
     @field_validator("ingredients", mode="before")
     @classmethod
@@ -207,33 +260,31 @@ class RecipeBase(BaseModel):
 
         result = []
         for item in v:
-            # If already a dict/object, use it
-            if isinstance(item, dict):
-                result.append(item)
-            # If it's a string, convert it to the expected format
-            elif isinstance(item, str):
-                # Try to parse simple format like "1 cup flour"
-                parts = item.split(maxsplit=2)
-                if len(parts) >= 3:
-                    try:
-                        quantity = float(parts[0])
-                        unit = parts[1]
-                        name = parts[2]
-                    except ValueError:
-                        # Can't parse quantity, use defaults
-                        quantity = 1.0
-                        unit = "serving"
-                        name = item
-                else:
-                    # Can't parse, use defaults
-                    quantity = 1.0
-                    unit = "serving"
-                    name = item
-
-                result.append({"name": name, "quantity": quantity, "unit": unit})
-            else:
-                # Already an IngredientSchema object
+            # Dicts and IngredientSchema objects are validated as they are
+            if not isinstance(item, str):
                 result.append(item)
+                continue
+
+            # Try to parse simple format like "1 cup flour"
+            quantity_str, _, rest = item.strip().partition(" ")
+            unit, _, name = rest.lstrip().partition(" ")
+            name = name.lstrip()
+            quantity = None
+            # Only attempt float() on something that looks numeric, so ordinary
+            # phrases ("salt and pepper") skip the exception and "nan"/"inf" are
+            # never taken as quantities
+            if name and quantity_str[0] in "0123456789.+-":
+                try:
+                    quantity = float(quantity_str)
+                except ValueError:
+                    pass
+            if quantity is None:
+                # Can't parse, use defaults
+                quantity = 1.0
+                unit = "serving"
+                name = item
+
+            result.append({"name": name, "quantity": quantity, "unit": unit})
 
         return result
 
@@ -241,16 +292,16 @@ class RecipeBase(BaseModel):
 class RecipeCreate(RecipeBase):
     """Recipe creation schema."""
 
-    pass
+    model_config = {"extra": "forbid", "frozen": True}
 
 
 class RecipeQuickAdd(BaseModel):
     """Quick-add menu item schema - minimal fields for rapid entry."""
 
     title: str = Field(..., min_length=1, max_length=255)
-    category: str | None = Field(
-        None, pattern="^(breakfast|lunch|dinner|snack|dessert|staple|frozen)$"
-    )
+    category: RecipeCategoryValue | None = None
+
+    model_config = {"extra": "forbid", "frozen": True}
 
 
 class RecipeUpdate(BaseModel):
@@ -263,15 +314,13 @@ class RecipeUpdate(BaseModel):
     serving_size: int | None = None
     prep_time: int | None = None
     cook_time: int | None = None
-    difficulty: str | None = Field(None, pattern="^(easy|medium|hard)$")
-    category: str | None = Field(
-        None, pattern="^(breakfast|lunch|dinner|snack|dessert|staple|frozen)$"
-    )
-    nutritional_info: dict[str, Any] | None = None
-    visibility: str | None = Field(None, pattern="^(private|group|public)$")
+    difficulty: DifficultyValue | None = None
+    category: RecipeCategoryValue | None = None
+    nutritional_info: NutritionalInfo | None = None
+    visibility: VisibilityValue | None = None
     group_id: int | None = None
-    is_shared: bool | None = None
-    is_public: bool | None = None
+
+    model_config = {"extra": "forbid", "frozen": True}
 
 
 class RecipeResponse(RecipeBase):
@@ -283,10 +332,16 @@ class RecipeResponse(RecipeBase):
     created_at: datetime
     updated_at: datetime | None = None
     is_favorite: bool = False
-    tags: list["RecipeTagResponse"] = []
+    tags: list["RecipeTagResponse"] = Field(default_factory=list)
 
     model_config = {"from_attributes": True}
 
+    @field_validator("nutritional_info", mode="before")
+    @classmethod
+    def clean_nutritional_info(cls, v: Any) -> Any:
+        """Tolerate legacy nutrition values in stored recipes."""
+        return _clean_stored_nutrition(v)
+
 
 # Recipe Tag Schemas
 class RecipeTagCreate(BaseModel):
@@ -359,25 +414,24 @@ class CalendarBase(BaseModel):
     """Base calendar schema."""
 
     name: str = Field(..., min_length=1, max_length=100)
-    visibility: str = Field("private", pattern="^(private|group|public)$")
+    visibility: VisibilityValue = "private"
     group_id: int | None = None
-    # Deprecated field - kept for backward compatibility
-    is_shared: bool = False
 
 
 class CalendarCreate(CalendarBase):
     """Calendar creation schema."""
 
-    pass
+    model_config = {"extra": "forbid", "frozen": True}
 
 
 class CalendarUpdate(BaseModel):
     """Calendar update schema."""
 
     name: str | None = Field(None, min_length=1, max_length=100)
-    visibility: str | None = Field(None, pattern="^(private|group|public)$")
+    visibility: VisibilityValue | None = None
     group_id: int | None = None
-    is_shared: bool | None = None
+
+    model_config = {"extra": "forbid", "frozen": True}
 
 
 class CalendarResponse(CalendarBase):
@@ -398,7 +452,7 @@ class CalendarMealCreate(BaseModel):
 
     recipe_id: int
     meal_date: datetime
-    meal_type: str = Field(..., pattern="^(breakfast|lunch|dinner|snack)$")
+    meal_type: MealTypeValue
 
 
 class CalendarMealResponse(CalendarMealCreate):
@@ -416,8 +470,10 @@ class CalendarPrepopulateRequest(BaseModel):
     """Calendar prepopulation request schema."""
 
     start_date: datetime
-    period: str = Field(..., pattern="^(day|week|month)$", description="Time period to prepopulate")
-    meal_types: list[str] = Field(..., description="Meal types to include")
+    period: CalendarPeriodValue = Field(..., description="Time period to prepopulate")
+    meal_types: list[Literal["breakfast", "lunch", "dinner"]] = Field(
+        ..., description="Meal types to include"
+    )
     snacks_per_day: int = Field(default=0, ge=0, le=5, description="Number of snacks per day")
     desserts_per_day: int = Field(default=0, ge=0, le=3, description="Number of desserts per day")
     use_dietary_preferences: bool = Field(
@@ -430,15 +486,7 @@ class CalendarPrepopulateRequest(BaseModel):
         default=None, description="Optional collection ID to limit recipes to collection"
     )
 
-    @field_validator("meal_types")
-    @classmethod
-    def validate_meal_types(cls, v: list[str]) -> list[str]:
-        """Validate meal types."""
-        valid_types = ["breakfast", "lunch", "dinner"]
-        for meal_type in v:
-            if meal_type not in valid_types:
-                raise ValueError(f"Invalid meal type: {meal_type}. Must be one of {valid_types}")
-        return v
+    model_config = {"extra": "forbid", "frozen": True}
 
 
 class CalendarPrepopulateResponse(BaseModel):
@@ -455,9 +503,11 @@ class CalendarCopyRequest(BaseModel):
 
     source_date: datetime = Field(..., description="Source date to copy from")
     target_date: datetime = Field(..., description="Target date to copy to")
-    period: str = Field(..., pattern="^(day|week|month)$", description="Time period to copy")
+    period: CalendarPeriodValue = Field(..., description="Time period to copy")
     overwrite: bool = Field(default=False, description="Whether to overwrite existing meals")
 
+    model_config = {"extra": "forbid", "frozen": True}
+
 
 class CalendarCopyResponse(BaseModel):
     """Calendar copy response schema."""
@@ -481,7 +531,7 @@ class GroupBase(BaseModel):
 class GroupCreate(GroupBase):
     """Group creation schema."""
 
-    pass
+    model_config = {"extra": "forbid", "frozen": True}
 
 
 class GroupUpdate(BaseModel):
@@ -489,6 +539,8 @@ class GroupUpdate(BaseModel):
 
     name: str | None = Field(None, min_length=1, max_length=100)
 
+    model_config = {"extra": "forbid", "frozen": True}
+
 
 class GroupResponse(GroupBase):
     """Group response schema."""
@@ -502,15 +554,30 @@ class GroupResponse(GroupBase):
 
 
 # Group Member Schemas
-class GroupMemberCreate(BaseModel):
-    """Group member creation schema."""
+class GroupPermissions(BaseModel):
+    """Per-member permission flags within a group."""
+
+    can_edit: bool = False
+    can_view: bool = False
+
+    model_config = {"from_attributes": True, "extra": "ignore", "frozen": True}
+
+
+class GroupMemberBase(BaseModel):
+    """Base group member schema."""
 
     user_id: int
-    role: str = "member"
-    permissions: dict[str, bool] | None = None
+    role: GroupRoleValue = "member"
+    permissions: GroupPermissions | None = None
+
 
+class GroupMemberCreate(GroupMemberBase):
+    """Group member creation schema."""
+
+    model_config = {"extra": "forbid", "frozen": True}
 
-class GroupMemberResponse(GroupMemberCreate):
+
+class GroupMemberResponse(GroupMemberBase):
     """Group member response schema."""
 
     id: int
@@ -538,7 +605,7 @@ class GroceryListCreate(BaseModel):
     name: str = Field(..., min_length=1, max_length=100)
     date_from: datetime | None = None
     date_to: datetime | None = None
-    visibility: str = Field("private", pattern="^(private|group|public)$")
+    visibility: VisibilityValue = "private"
     group_id: int | None = None
 
 
@@ -559,22 +626,30 @@ class GroceryListResponse(BaseModel):
 
 
 # Pantry Inventory Schemas
-class PantryInventoryCreate(BaseModel):
-    """Pantry inventory creation schema."""
+class PantryInventoryBase(BaseModel):
+    """Base pantry inventory schema."""
 
     ingredient_name: str = Field(..., min_length=1, max_length=100)
     quantity: float = Field(..., gt=0)
     unit: str | None = Field(None, max_length=50)
 
 
+class PantryInventoryCreate(PantryInventoryBase):
+    """Pantry inventory creation schema."""
+
+    model_config = {"extra": "forbid", "frozen": True}
+
+
 class PantryInventoryUpdate(BaseModel):
     """Pantry inventory update schema."""
 
     quantity: float = Field(..., gt=0)
     unit: str | None = Field(None, max_length=50)
 
+    model_config = {"extra": "forbid", "frozen": True}
 
-class PantryInventoryResponse(PantryInventoryCreate):
+
+class PantryInventoryResponse(PantryInventoryBase):
     """Pantry inventory response schema."""
 
     id: int
@@ -589,7 +664,7 @@ class AdminUserUpdate(BaseModel):
     """Admin user update schema."""
 
     is_admin: bool | None = None
-    email: EmailStr | None = None
+    email: Email | None = None
 
 
 class AdminStatsResponse(BaseModel):
@@ -633,7 +708,7 @@ class FeatureToggleBase(BaseModel):
 class FeatureToggleCreate(FeatureToggleBase):
     """Feature toggle creation schema."""
 
-    pass
+    model_config = {"extra": "forbid", "frozen": True}
 
 
 class FeatureToggleUpdate(BaseModel):
@@ -643,6 +718,8 @@ class FeatureToggleUpdate(BaseModel):
     description: str | None = None
     is_enabled: bool | None = None
 
+    model_config = {"extra": "forbid", "frozen": True}
+
 
 class FeatureToggleResponse(FeatureToggleBase):
     """Feature toggle response schema."""
@@ -675,6 +752,8 @@ class OpenAISettingsUpdate(BaseModel):
     system_prompt: str | None = None
     searxng_url: str | None = None  # SEARXNG URL
 
+    model_config = {"extra": "forbid", "frozen": True}
+
 
 class OpenAISettingsResponse(BaseModel):
     """OpenAI settings response schema (without API key)."""
@@ -722,14 +801,16 @@ class SessionSettingsBase(BaseModel):
     """Base session settings schema."""
 
     session_ttl_value: int = Field(default=90, ge=1, le=365)
-    session_ttl_unit: str = Field(default="days", pattern="^(minutes|hours|days)$")
+    session_ttl_unit: SessionTtlUnitValue = "days"
 
 
 class SessionSettingsUpdate(BaseModel):
     """Session settings update schema."""
 
     session_ttl_value: int | None = Field(None, ge=1, le=365)
-    session_ttl_unit: str | None = Field(None, pattern="^(minutes|hours|days)$")
+    session_ttl_unit: SessionTtlUnitValue | None = None
+
+    model_config = {"extra": "forbid", "frozen": True}
 
 
 class SessionSettingsResponse(BaseModel):
@@ -744,13 +825,21 @@ class SessionSettingsResponse(BaseModel):
 
 
 # AI Chat Schemas
+class AIToolCall(TypedDict):
+    """A tool call requested by the assistant, as returned by ``OpenAIService.chat``."""
+
+    id: str
+    name: str
+    arguments: dict[str, Any]
+
+
 class AIChatMessage(BaseModel):
     """AI chat message schema."""
 
-    role: str = Field(..., pattern="^(user|assistant|system|tool)$")
+    role: Literal["user", "assistant", "system", "tool"]
     content: str | None  # Can be None for assistant messages with tool_calls
     tool_call_id: str | None = None  # Required for tool role messages
-    tool_calls: list[dict[str, Any]] | None = None  # For assistant messages with tool calls
+    tool_calls: list[AIToolCall] | None = None  # For assistant messages with tool calls
 
 
 class AIChatRequest(BaseModel):
@@ -759,18 +848,20 @@ class AIChatRequest(BaseModel):
     messages: list[AIChatMessage]
     use_dietary_preferences: bool = True  # Toggle for using dietary preferences
 
+    model_config = {"extra": "forbid", "frozen": True}
+
 
 class AIChatResponse(BaseModel):
     """AI chat response schema."""
 
     message: str
-    tool_calls: list[dict[str, Any]] | None = None
+    tool_calls: list[AIToolCall] | None = None
 
 
 class AIRecipeValidation(BaseModel):
     """AI recipe validation schema for user confirmation."""
 
-    action: str = Field(..., pattern="^(create|update)$")
+    action: Literal["create", "update"]
     recipe_data: dict[str, Any]
     confirmation_message: str
 
@@ -797,6 +888,8 @@ class RecipeCollectionCreate(BaseModel):
     name: str = Field(..., min_length=1, max_length=100)
     description: str | None = None
 
+    model_config = {"extra": "forbid", "frozen": True}
+
 
 class RecipeCollectionUpdate(BaseModel):
     """Recipe collection update schema."""
@@ -804,6 +897,8 @@ class RecipeCollectionUpdate(BaseModel):
     name: str | None = Field(None, min_length=1, max_length=100)
     description: str | None = None
 
+    model_config = {"extra": "forbid", "frozen": True}
+
 
 class RecipeCollectionItemResponse(BaseModel):
     """Recipe collection item schema with basic recipe info."""
@@ -826,7 +921,7 @@ class RecipeCollectionResponse(BaseModel):
     user_id: int
     created_at: datetime
     updated_at: datetime | None = None
-    items: list["RecipeCollectionItemResponse"] = []
+    items: list["RecipeCollectionItemResponse"] = Field(default_factory=list)
 
     model_config = {"from_attributes": True}
 
@@ -854,7 +949,7 @@ class RecipeIngredientBase(BaseModel):
 class RecipeIngredientCreate(RecipeIngredientBase):
     """Recipe ingredient creation schema."""
 
-    pass
+    model_config = {"extra": "forbid", "frozen": True}
 
 
 class RecipeIngredientUpdate(BaseModel):
@@ -866,6 +961,8 @@ class RecipeIngredientUpdate(BaseModel):
     unit: str | None = Field(None, min_length=1)
     notes: str | None = None
 
+    model_config = {"extra": "forbid", "frozen": True}
+
 
 class RecipeIngredientResponse(RecipeIngredientBase):
     """Recipe ingredient response schema."""
@@ -876,3 +973,13 @@ class RecipeIngredientResponse(RecipeIngredientBase):
     ingredient_recipe: "RecipeResponse | None" = None
 
     model_config = {"from_attributes": True}
+
+
+# Resolve forward references now rather than on the first request that validates them
+RecipeResponse.model_rebuild()
+PaginatedRecipeResponse.model_rebuild()
+RecipeCollectionResponse.model_rebuild()
+RecipeIngredientResponse.model_rebuild()
+
+# Validates a whole page of ORM recipes in one call instead of one model per row
+RecipeListAdapter = TypeAdapter(list[RecipeResponse])
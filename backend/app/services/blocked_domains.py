@@ -0,0 +1,68 @@
+"""Cached lookup of blocked image domains."""
+
+import asyncio
+import time
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from app.models import BlockedImageDomain
+
+# Seconds a loaded block list is trusted before it is re-read from the database
+BLOCKED_DOMAINS_TTL = 30.0
+
+_blocked_domains: frozenset[str] = frozenset()
+_loaded_at: float | None = None
+_generation = 0
+_lock = asyncio.Lock()
+
+
+def _is_fresh() -> bool:
+    return _loaded_at is not None and time.monotonic() - _loaded_at < BLOCKED_DOMAINS_TTL
+
+
+async def get_blocked_domains() -> frozenset[str]:
+    """Return the blocked image domains, reloading them from the database when stale."""
+    global _blocked_domains, _loaded_at
+    if _is_fresh():
+        return _blocked_domains
+
+    async with _lock:
+        if not _is_fresh():
+            from app.database import AsyncSessionLocal
+
+            generation = _generation
+            async with AsyncSessionLocal() as db:
+                result = await db.execute(select(BlockedImageDomain.domain))
+                _blocked_domains = frozenset(result.scalars().all())
+            # Only trust the result if the list was not changed while loading it
+            if generation == _generation:
+                _loaded_at = time.monotonic()
+    return _blocked_domains
+
+
+def invalidate_blocked_domains() -> None:
+    """Force the next lookup to reload the block list; call after changing it."""
+    global _loaded_at, _generation
+    _loaded_at = None
+    _generation += 1
+
+
+async def block_domain(domain: str, reason: str) -> None:
+    """Record a blocked image domain, leaving an existing entry untouched.
+
+    Uses a single ``INSERT ... ON CONFLICT DO NOTHING`` so concurrent failures
+    for the same domain cannot race each other into a unique violation.
+    """
+    from app.database import AsyncSessionLocal
+
+    async with AsyncSessionLocal() as db:
+        dialect_insert = pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+        await db.execute(
+            dialect_insert(BlockedImageDomain)
+            .values(domain=domain, reason=reason)
+            .on_conflict_do_nothing(index_elements=[BlockedImageDomain.domain])
+        )
+        await db.commit()
+    invalidate_blocked_domains()
@@ -4,8 +4,9 @@ import logging
 import random
 from datetime import datetime, timedelta
 
-from sqlalchemy import or_, select
+from sqlalchemy import insert, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import noload
 
 from app.models import (
     CalendarMeal,
@@ -74,30 +75,17 @@ class CalendarPrepopulateService:
             logger.error("Invalid period specified: %s", period)
             raise ValueError(f"Invalid period: {period}")
 
-        # Get available recipes for each category
-        recipes_by_category = {}
-
-        # Get regular meal recipes
-        for meal_type in meal_types:
-            recipes = await self._get_recipes_for_category(
-                user, meal_type, use_dietary_preferences, collection_id
-            )
-            recipes_by_category[meal_type] = recipes
-            logger.debug("Found %d recipes for meal_type=%s", len(recipes), meal_type)
-
-        # Get snack recipes if needed
+        # Get available recipes for every category needed, in one query
+        categories = list(meal_types)
         if snacks_per_day > 0:
-            snack_recipes = await self._get_recipes_for_category(
-                user, "snack", use_dietary_preferences, collection_id
-            )
-            recipes_by_category["snack"] = snack_recipes
-
-        # Get dessert recipes if needed
+            categories.append("snack")
         if desserts_per_day > 0:
-            dessert_recipes = await self._get_recipes_for_category(
-                user, "dessert", use_dietary_preferences, collection_id
-            )
-            recipes_by_category["dessert"] = dessert_recipes
+            categories.append("dessert")
+        recipes_by_category = await self._get_recipes_for_categories(
+            user, categories, use_dietary_preferences, collection_id
+        )
+        for category, recipes in recipes_by_category.items():
+            logger.debug("Found %d recipes for category=%s", len(recipes), category)
 
         # Check if we have enough recipes
         for category, recipes in recipes_by_category.items():
@@ -106,64 +94,75 @@ class CalendarPrepopulateService:
                     f"No recipes found for category '{category}'. Please add some recipes first."
                 )
 
-        # Generate meal plan
-        meals_created = 0
+        # Generate meal plan; rows are collected and inserted in one statement
+        meals_to_create: list[dict] = []
         current_date = start_date
-        used_recipe_ids = set() if avoid_duplicates else None
+        # Per-category recipes not yet used in this pass, in random order
+        unused_by_category: dict[str, list[Recipe]] = {c: [] for c in recipes_by_category}
 
         while current_date <= end_date:
+            # Convert timezone-aware datetime to naive (UTC) for storage
+            meal_date = current_date.replace(tzinfo=None) if current_date.tzinfo else current_date
+
             # Add regular meals
             for meal_type in meal_types:
                 recipe = self._select_recipe(
-                    recipes_by_category[meal_type], used_recipe_ids, avoid_duplicates
+                    recipes_by_category[meal_type], unused_by_category[meal_type], avoid_duplicates
+                )
+                meals_to_create.append(
+                    self._meal_row(calendar_id, int(recipe.id), meal_date, meal_type)
                 )
-                if recipe:
-                    await self._create_meal(calendar_id, int(recipe.id), current_date, meal_type)
-                    meals_created += 1
 
             # Add snacks
             for _ in range(snacks_per_day):
                 if "snack" in recipes_by_category:
                     recipe = self._select_recipe(
-                        recipes_by_category["snack"], used_recipe_ids, avoid_duplicates
+                        recipes_by_category["snack"],
+                        unused_by_category["snack"],
+                        avoid_duplicates,
+                    )
+                    meals_to_create.append(
+                        self._meal_row(calendar_id, int(recipe.id), meal_date, "snack")
                     )
-                    if recipe:
-                        await self._create_meal(calendar_id, int(recipe.id), current_date, "snack")
-                        meals_created += 1
 
             # Add desserts (as snack type since dessert is a category, not meal type)
             for _ in range(desserts_per_day):
                 if "dessert" in recipes_by_category:
                     recipe = self._select_recipe(
-                        recipes_by_category["dessert"], used_recipe_ids, avoid_duplicates
+                        recipes_by_category["dessert"],
+                        unused_by_category["dessert"],
+                        avoid_duplicates,
+                    )
+                    meals_to_create.append(
+                        self._meal_row(calendar_id, int(recipe.id), meal_date, "snack")
                     )
-                    if recipe:
-                        await self._create_meal(calendar_id, int(recipe.id), current_date, "snack")
-                        meals_created += 1
 
             current_date += timedelta(days=1)
 
+        # Insert all planned meals in one bulk statement
+        if meals_to_create:
+            await self.db.execute(insert(CalendarMeal), meals_to_create)
         await self.db.commit()
-        return meals_created, end_date
+        return len(meals_to_create), end_date
 
-    async def _get_recipes_for_category(
+    async def _get_recipes_for_categories(
         self,
         user: User,
-        category: str,
+        categories: list[str],
         use_dietary_preferences: bool,
         collection_id: int | None = None,
-    ) -> list[Recipe]:
+    ) -> dict[str, list[Recipe]]:
         """
-        Get recipes for a specific category.
+        Get recipes for several categories with a single recipe query.
 
         Args:
             user: The user making the request
-            category: The recipe category
+            categories: The recipe categories
             use_dietary_preferences: Whether to filter by dietary preferences
             collection_id: Optional collection ID to limit recipes to collection
 
         Returns:
-            List of recipes
+            Recipes grouped by category, with an entry for every requested category
         """
         # Get user's group IDs
         group_result = await self.db.execute(
@@ -197,17 +196,15 @@ class CalendarPrepopulateService:
             )
             collection_recipe_ids = [row[0] for row in items_result.all()]
 
-            # Build query for recipes in collection with matching category
+            # Build query for recipes in collection with matching categories
             query = select(Recipe).where(
                 Recipe.id.in_(collection_recipe_ids),
-                Recipe.category == category,
-                Recipe.deleted_at.is_(None),
+                Recipe.category.in_(categories),
             )
         else:
             # Build query for accessible recipes
             query = select(Recipe).where(
-                Recipe.deleted_at.is_(None),
-                Recipe.category == category,
+                Recipe.category.in_(categories),
                 or_(
                     Recipe.owner_id == user.id,  # User's own recipes
                     Recipe.visibility == "public",  # Public recipes
@@ -223,78 +220,56 @@ class CalendarPrepopulateService:
                 user.dietary_preferences if isinstance(user.dietary_preferences, list) else []
             )
             if dietary_prefs:
-                # Join with RecipeTag to filter
-                query = (
-                    query.join(RecipeTag, RecipeTag.recipe_id == Recipe.id)
-                    .where(RecipeTag.tag_name.in_(dietary_prefs))
-                    .distinct()
+                # Keep recipes with at least one matching tag
+                query = query.where(
+                    select(RecipeTag.id)
+                    .where(
+                        RecipeTag.recipe_id == Recipe.id,
+                        RecipeTag.tag_name.in_(dietary_prefs),
+                    )
+                    .exists()
                 )
 
-        result = await self.db.execute(query)
-        recipes = result.scalars().all()
-        return list(recipes)
+        # Only ids and categories are used here, so skip the selectin load of tags
+        result = await self.db.execute(query.options(noload(Recipe.tags)))
+        recipes_by_category: dict[str, list[Recipe]] = {category: [] for category in categories}
+        for recipe in result.scalars():
+            recipes_by_category[recipe.category].append(recipe)
+        return recipes_by_category
 
     def _select_recipe(
         self,
         recipes: list[Recipe],
-        used_recipe_ids: set | None,
+        unused: list[Recipe],
         avoid_duplicates: bool,
-    ) -> Recipe | None:
+    ) -> Recipe:
         """
         Select a recipe from the list.
 
         Args:
-            recipes: List of available recipes
-            used_recipe_ids: Set of already used recipe IDs
+            recipes: Non-empty list of available recipes
+            unused: Recipes of this list not yet used in the current pass; updated in place
             avoid_duplicates: Whether to avoid duplicates
 
         Returns:
-            Selected recipe or None if no recipes available
+            Selected recipe
         """
-        if not recipes:
-            return None
-
-        # Filter out used recipes if avoiding duplicates
-        if avoid_duplicates and used_recipe_ids:
-            available_recipes = [r for r in recipes if r.id not in used_recipe_ids]
-            # If no unused recipes, fall back to all recipes
-            if not available_recipes:
-                available_recipes = recipes
-        else:
-            available_recipes = recipes
-
-        # Randomly select a recipe
-        recipe = random.choice(available_recipes)
-
-        # Mark as used if avoiding duplicates
-        if avoid_duplicates and used_recipe_ids is not None:
-            used_recipe_ids.add(int(recipe.id))
-
-        return recipe
-
-    async def _create_meal(
-        self,
-        calendar_id: int,
-        recipe_id: int,
-        meal_date: datetime,
-        meal_type: str,
-    ) -> None:
-        """
-        Create a calendar meal entry.
-
-        Args:
-            calendar_id: The calendar ID
-            recipe_id: The recipe ID
-            meal_date: The date for the meal
-            meal_type: The type of meal
-        """
-        # Convert timezone-aware datetime to naive (UTC) for storage
-        meal_date_naive = meal_date.replace(tzinfo=None) if meal_date.tzinfo else meal_date
-
-        meal = CalendarMeal(
-            calendar_id=calendar_id,
-            recipe_id=recipe_id,
-            meal_date=meal_date_naive,
-            meal_type=meal_type,
-        )
-        self.db.add(meal)
+        if not avoid_duplicates:
+            return random.choice(recipes)
+
+        # Draw from a shuffled copy so each pick is O(1); once every recipe has
+        # been used, start another pass over all of them
+        if not unused:
+            unused.extend(recipes)
+            random.shuffle(unused)
+        return unused.pop()
+
+    @staticmethod
+    def _meal_row(calendar_id: int, recipe_id: int, meal_date: datetime, meal_type: str) -> dict:
+        """Build the column values of one calendar meal for the bulk insert."""
+        return {
+            "calendar_id": calendar_id,
+            "recipe_id": recipe_id,
+            "meal_date": meal_date,
+            "meal_type": meal_type,
+        }
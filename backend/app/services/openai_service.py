@@ -11,7 +11,8 @@ from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
-from app.models import FeatureToggle, GroupMember, OpenAISettings, Recipe, RecipeTag, User
+from app.models import DifficultyLevel, GroupMember, OpenAISettings, Recipe, RecipeTag, User
+from app.services.settings_cache import get_openai_settings, is_feature_enabled
 
 logger = logging.getLogger(__name__)
 
@@ -29,18 +30,11 @@ class OpenAIService:
     async def initialize(self) -> None:
         """Initialize the OpenAI client with settings from database."""
         # Check if AI feature is enabled
-        result = await self.db.execute(
-            select(FeatureToggle).where(FeatureToggle.feature_key == "ai_recipe_creation")
-        )
-        toggle = result.scalar_one_or_none()
-        if not toggle or not toggle.is_enabled:
+        if not await is_feature_enabled(self.db, "ai_recipe_creation"):
             raise ValueError("AI recipe creation feature is not enabled")
 
         # Get OpenAI settings
-        settings_result = await self.db.execute(
-            select(OpenAISettings).where(OpenAISettings.id == 1)
-        )
-        self.settings = settings_result.scalar_one_or_none()
+        self.settings = await get_openai_settings(self.db)
         if not self.settings or not self.settings.api_key:
             raise ValueError("OpenAI API key is not configured")
 
@@ -642,7 +636,7 @@ Create recipes based solely on their requests without dietary restrictions.
             prep_time=recipe_data.get("prep_time"),  # Optional
             cook_time=recipe_data.get("cook_time"),  # Optional
             serving_size=recipe_data.get("servings", 4),  # Default to 4
-            difficulty=recipe_data.get("difficulty"),
+            difficulty=DifficultyLevel.parse(recipe_data.get("difficulty")),
             category=recipe_data.get("category"),  # Add category field
             visibility="private",  # Default to private
             image_url=image_url,
@@ -686,9 +680,16 @@ Create recipes based solely on their requests without dietary restrictions.
         if not recipe_id:
             raise ValueError("recipe_id is required for updating a recipe")
 
+        if "difficulty" in recipe_data:
+            # Reject unknown difficulties before anything on the recipe is changed
+            recipe_data = {
+                **recipe_data,
+                "difficulty": DifficultyLevel.parse(recipe_data["difficulty"]),
+            }
+
         result = await self.db.execute(
             select(Recipe).where(
-                Recipe.id == recipe_id, Recipe.owner_id == user.id, Recipe.deleted_at.is_(None)
+                Recipe.id == recipe_id, Recipe.owner_id == user.id
             )
         )
         recipe = result.scalar_one_or_none()
@@ -756,7 +757,7 @@ Create recipes based solely on their requests without dietary restrictions.
         """
         result = await self.db.execute(
             select(Recipe)
-            .where(Recipe.owner_id == user.id, Recipe.deleted_at.is_(None))
+            .where(Recipe.owner_id == user.id)
             .limit(limit)
         )
         recipes = result.scalars().all()
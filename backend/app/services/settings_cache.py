@@ -0,0 +1,116 @@
+"""Cached lookups of admin-managed settings read on hot paths.
+
+Feature toggles are checked by public endpoints on every page load, the
+session TTL on every login and the OpenAI settings on every AI request, but all
+of them change only through the admin API. Values
+are kept in-process for ``SETTINGS_TTL`` seconds; the admin endpoints that
+change them call ``invalidate_settings_cache`` so their own worker sees the
+change immediately and other workers within the TTL.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+from typing import Generic, TypeVar
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import FeatureToggle, OpenAISettings, SessionSettings
+
+# Seconds a loaded value is trusted before it is re-read from the database
+SETTINGS_TTL = 30.0
+
+DEFAULT_SESSION_TTL = timedelta(days=90)
+
+T = TypeVar("T")
+
+
+class _CachedValue(Generic[T]):
+    """A single value loaded on demand and trusted for ``SETTINGS_TTL`` seconds."""
+
+    def __init__(self, default: T) -> None:
+        self.value = default
+        self.loaded_at: float | None = None
+        self.generation = 0
+        self.lock = asyncio.Lock()
+
+    def is_fresh(self) -> bool:
+        return self.loaded_at is not None and time.monotonic() - self.loaded_at < SETTINGS_TTL
+
+    async def get(self, load: Callable[[], Awaitable[T]]) -> T:
+        if self.is_fresh():
+            return self.value
+
+        async with self.lock:
+            if not self.is_fresh():
+                generation = self.generation
+                self.value = await load()
+                # Only trust the result if the setting was not changed while loading it
+                if generation == self.generation:
+                    self.loaded_at = time.monotonic()
+        return self.value
+
+    def invalidate(self) -> None:
+        self.loaded_at = None
+        self.generation += 1
+
+
+_feature_flags: _CachedValue[dict[str, bool]] = _CachedValue({})
+_session_ttl: _CachedValue[timedelta] = _CachedValue(DEFAULT_SESSION_TTL)
+_openai_settings: _CachedValue[OpenAISettings | None] = _CachedValue(None)
+
+
+async def get_feature_flags(db: AsyncSession) -> dict[str, bool]:
+    """Return every feature toggle's enabled state keyed by feature key."""
+
+    async def load() -> dict[str, bool]:
+        result = await db.execute(select(FeatureToggle.feature_key, FeatureToggle.is_enabled))
+        return {key: bool(enabled) for key, enabled in result.all()}
+
+    return await _feature_flags.get(load)
+
+
+async def is_feature_enabled(db: AsyncSession, feature_key: str) -> bool:
+    """Return whether a feature toggle exists and is enabled."""
+    return (await get_feature_flags(db)).get(feature_key, False)
+
+
+async def get_session_ttl(db: AsyncSession) -> timedelta:
+    """Return the configured session lifetime, or 90 days when none is configured."""
+
+    async def load() -> timedelta:
+        result = await db.execute(
+            select(SessionSettings.session_ttl_value, SessionSettings.session_ttl_unit).where(
+                SessionSettings.id == 1
+            )
+        )
+        row = result.one_or_none()
+        if row is None:
+            return DEFAULT_SESSION_TTL
+        value, unit = row
+        return timedelta(**{str(unit): value})
+
+    return await _session_ttl.get(load)
+
+
+async def get_openai_settings(db: AsyncSession) -> OpenAISettings | None:
+    """Return the OpenAI settings row as a detached, read-only instance, if configured."""
+
+    async def load() -> OpenAISettings | None:
+        openai_settings = await db.get(OpenAISettings, 1, populate_existing=True)
+        if openai_settings is not None:
+            # Detached instances keep their loaded columns and are never expired or
+            # flushed by the sessions of later requests that read the cached value
+            db.expunge(openai_settings)
+        return openai_settings
+
+    return await _openai_settings.get(load)
+
+
+def invalidate_settings_cache() -> None:
+    """Force the next lookups to reload from the database; call after changing settings."""
+    _feature_flags.invalidate()
+    _session_ttl.invalidate()
+    _openai_settings.invalidate()
@@ -5,7 +5,6 @@ from typing import Any
 
 import bcrypt
 from jose import JWTError, jwt
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
@@ -30,22 +29,9 @@ async def get_session_ttl_timedelta(db: AsyncSession | None = None) -> timedelta
         return timedelta(days=90)
 
     try:
-        from app.models import SessionSettings
-
-        result = await db.execute(select(SessionSettings).where(SessionSettings.id == 1))
-        session_settings = result.scalar_one_or_none()
-
-        if not session_settings:
-            # Return default if not configured
-            return timedelta(days=90)
-
-        # Convert the configured value to timedelta
-        if session_settings.session_ttl_unit == "minutes":
-            return timedelta(minutes=session_settings.session_ttl_value)
-        elif session_settings.session_ttl_unit == "hours":
-            return timedelta(hours=session_settings.session_ttl_value)
-        else:  # days
-            return timedelta(days=session_settings.session_ttl_value)
+        from app.services.settings_cache import get_session_ttl
+
+        return await get_session_ttl(db)
     except Exception:
         # Fallback to default on any error
         return timedelta(days=90)
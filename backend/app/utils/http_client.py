@@ -0,0 +1,101 @@
+"""Shared outbound HTTP client."""
+
+from collections.abc import AsyncGenerator, Callable
+from typing import Any
+
+import anyio
+import httpx
+from fastapi.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+STREAM_CHUNK_SIZE = 64 * 1024  # 64KB
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide client used for fetching external resources.
+
+    Reusing one client keeps connections to frequently used hosts alive instead
+    of paying a new TCP/TLS handshake on every request.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(
+                max_connections=100, max_keepalive_connections=50, keepalive_expiry=30.0
+            ),
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared client and its pooled connections."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+class _UpstreamStreamingResponse(StreamingResponse):
+    """Streaming response that closes the upstream response however streaming ends.
+
+    Starlette stops iterating without closing the body iterator when the client
+    disconnects or sending fails, and never starts it if the disconnect comes
+    before the first chunk, so closing is also done once the response is sent.
+    """
+
+    def __init__(
+        self,
+        upstream: httpx.Response,
+        on_close: Callable[[], None] | None,
+        **kwargs: Any,
+    ) -> None:
+        self._upstream = upstream
+        self._on_close = on_close
+        self._closed = False
+        self._body = self._iter_body()
+        super().__init__(self._body, **kwargs)
+
+    async def _iter_body(self) -> AsyncGenerator[bytes, None]:
+        try:
+            async for chunk in self._upstream.aiter_bytes(STREAM_CHUNK_SIZE):
+                yield chunk
+        finally:
+            await self._close()
+
+    async def _close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        # Shielded so a cancelled request still returns its pooled connection
+        with anyio.CancelScope(shield=True):
+            await self._upstream.aclose()
+        if self._on_close is not None:
+            self._on_close()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            await self._body.aclose()
+            await self._close()
+
+
+def stream_upstream_response(
+    upstream: httpx.Response,
+    media_type: str,
+    headers: dict[str, str],
+    on_close: Callable[[], None] | None = None,
+) -> StreamingResponse:
+    """Forward a response opened with ``stream=True`` to the client chunk by chunk.
+
+    The upstream response is closed once the body has been sent, the client
+    disconnects or streaming fails, so memory use stays at one chunk regardless
+    of the size of the proxied file and the pooled connection is always
+    returned. ``on_close`` runs right after the upstream response is closed.
+    """
+    return _UpstreamStreamingResponse(
+        upstream, on_close, media_type=media_type, headers=headers
+    )
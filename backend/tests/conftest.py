@@ -2,12 +2,17 @@
 
 import os
 
+import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
 
 from app.database import Base, get_db
+from app.db_debug import raise_on_lazy_load
 from app.main import app
+from app.services.settings_cache import invalidate_settings_cache
 
 # Test database URL
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
@@ -17,6 +22,8 @@ TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 async def test_engine():
     """Create a test database engine."""
     engine = create_async_engine(TEST_DATABASE_URL, echo=False, pool_pre_ping=True)
+    # Cached settings outlive the per-test database, so start every test without them
+    invalidate_settings_cache()
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -44,6 +51,15 @@ async def db_session(test_engine):
 
 os.environ.setdefault("TESTING", "1")
 
+
+@pytest.fixture
+def strict_loading():
+    """Make relationships a query did not load raise instead of lazy loading."""
+    event.listen(Session, "do_orm_execute", raise_on_lazy_load)
+    yield
+    event.remove(Session, "do_orm_execute", raise_on_lazy_load)
+
+
 @pytest_asyncio.fixture(scope="function")
 async def client(test_engine):
     """Create test client."""
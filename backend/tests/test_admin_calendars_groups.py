@@ -33,6 +33,10 @@ async def test_admin_list_and_manage_calendars(client, db_session):
     assert resp3.status_code == 200
     assert resp3.json()["name"] == "Cnew"
 
+    # visibility is an enum column, so unknown values are rejected up front
+    resp_bad = await client.patch(f"/api/v1/admin/calendars/{cal.id}", json={"visibility": "everyone"}, headers={"Authorization": f"Bearer {token}"})
+    assert resp_bad.status_code == 400
+
     # delete
     resp4 = await client.delete(f"/api/v1/admin/calendars/{cal.id}", headers={"Authorization": f"Bearer {token}"})
     assert resp4.status_code == 204
@@ -128,3 +128,45 @@ async def test_session_settings_get_and_patch(client, db_session):
     resp = await client.patch("/api/v1/admin/session-settings", json={"session_ttl_value": 30, "session_ttl_unit": "minutes"}, headers={"Authorization": f"Bearer {token}"})
     assert resp.status_code == 200
     assert resp.json()["session_ttl_value"] == 30
+
+
+@pytest.mark.asyncio
+async def test_feature_toggle_changes_reach_cached_public_lookup(client, db_session):
+    from app.models import FeatureToggle, User
+
+    admin = User(username="ftcache", email="ftcache@example.com", password_hash="x", is_admin=True)
+    db_session.add_all([admin, FeatureToggle(feature_key="cached", feature_name="Cached", is_enabled=True)])
+    await db_session.commit()
+    token = create_access_token({"sub": str(admin.id)})
+
+    resp = await client.get("/api/v1/features/enabled")
+    assert resp.json() == {"cached": True}
+
+    # Admin changes invalidate the cached flags instead of waiting for the TTL
+    resp = await client.patch("/api/v1/admin/feature-toggles/cached", json={"is_enabled": False}, headers={"Authorization": f"Bearer {token}"})
+    assert resp.status_code == 200
+    resp = await client.get("/api/v1/features/cached")
+    assert resp.json() == {"enabled": False}
+    resp = await client.get("/api/v1/features/enabled")
+    assert resp.json() == {}
+
+
+@pytest.mark.asyncio
+async def test_openai_settings_changes_reach_cached_service(client, db_session):
+    from app.models import OpenAISettings, User
+    from app.services.settings_cache import get_openai_settings
+
+    admin = User(username="oacache", email="oacache@example.com", password_hash="x", is_admin=True)
+    db_session.add_all([admin, OpenAISettings(id=1, api_key="sk-old", model="gpt-4")])
+    await db_session.commit()
+    token = create_access_token({"sub": str(admin.id)})
+
+    cached = await get_openai_settings(db_session)
+    assert cached.model == "gpt-4"
+    assert await get_openai_settings(db_session) is cached
+
+    resp = await client.patch("/api/v1/admin/openai-settings", json={"model": "gpt-4o"}, headers={"Authorization": f"Bearer {token}"})
+    assert resp.status_code == 200
+    refreshed = await get_openai_settings(db_session)
+    assert refreshed.model == "gpt-4o"
+    assert refreshed.api_key == "sk-old"
@@ -50,6 +50,20 @@ async def test_ai_chat_success(client, test_user, monkeypatch: MonkeyPatch):
     assert isinstance(data.get("tool_calls"), list)
 
 
+@pytest.mark.asyncio
+async def test_ai_chat_rejects_malformed_tool_calls(client, test_user):
+    token = await _get_token(client, test_user)
+    payload = {
+        "messages": [
+            {"role": "user", "content": "Hi"},
+            {"role": "assistant", "content": None, "tool_calls": [{"id": "1", "arguments": {}}]},
+        ],
+        "use_dietary_preferences": False,
+    }
+    resp = await client.post("/api/v1/ai/chat", json=payload, headers={"Authorization": f"Bearer {token}"})
+    assert resp.status_code == 422
+
+
 @pytest.mark.asyncio
 async def test_execute_tool_list_and_unknown(client, test_user, monkeypatch: MonkeyPatch):
     from app.api.v1.endpoints import ai as ai_module
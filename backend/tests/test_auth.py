@@ -22,6 +22,34 @@ async def test_register_user(client: AsyncClient):
     assert "id" in data
 
 
+@pytest.mark.asyncio
+async def test_register_validates_email(client: AsyncClient):
+    """Test that emails are shape-checked and their domain lowercased."""
+    response = await client.post(
+        "/api/v1/auth/register",
+        json={
+            "username": "mixedcase",
+            "email": "Mixed.Case@Example.COM",
+            "password": "testpassword123",
+        },
+    )
+    assert response.status_code == 201
+    assert response.json()["email"] == "Mixed.Case@example.com"
+
+    for email in [
+        "not-an-email",
+        "a@b",
+        "a b@example.com",
+        "a@@example.com",
+        "a@example.com\n",
+    ]:
+        response = await client.post(
+            "/api/v1/auth/register",
+            json={"username": "bademail", "email": email, "password": "testpassword123"},
+        )
+        assert response.status_code == 422, email
+
+
 @pytest.mark.asyncio
 async def test_register_duplicate_username(client: AsyncClient):
     """Test registration with duplicate username."""
@@ -3,8 +3,9 @@
 from datetime import datetime
 
 import pytest
+from sqlalchemy import event, func, select
 
-from app.models import Calendar, Recipe, User
+from app.models import Calendar, CalendarMeal, Recipe, User
 from app.services.calendar_prepopulate import CalendarPrepopulateService
 from app.utils.auth import get_password_hash
 
@@ -50,18 +51,38 @@ async def test_prepopulate_success_week(db_session):
     service = CalendarPrepopulateService(db_session)
     start = datetime.now().replace(hour=12, minute=0, second=0, microsecond=0)
 
-    meals_created, end_date = await service.prepopulate_calendar(
-        calendar.id,
-        user,
-        start,
-        "week",
-        ["breakfast", "lunch", "dinner"],
-        snacks_per_day=0,
-        desserts_per_day=0,
-        use_dietary_preferences=False,
-        avoid_duplicates=True,
-    )
+    statements = []
+    sync_engine = db_session.bind.sync_engine
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(sync_engine, "before_cursor_execute", record)
+    try:
+        meals_created, end_date = await service.prepopulate_calendar(
+            calendar.id,
+            user,
+            start,
+            "week",
+            ["breakfast", "lunch", "dinner"],
+            snacks_per_day=0,
+            desserts_per_day=0,
+            use_dietary_preferences=False,
+            avoid_duplicates=True,
+        )
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", record)
 
     # 7 days * 3 meals = 21
     assert meals_created == 21
     assert end_date >= start
+    # Recipes for every meal type are loaded by a single query
+    assert len([s for s in statements if "FROM recipes" in s]) == 1
+    # Tags are not needed to pick recipes, so they are never loaded
+    assert not [s for s in statements if "FROM recipe_tags" in s]
+    # All meals are written by a single bulk INSERT
+    assert len([s for s in statements if s.lstrip().upper().startswith("INSERT")]) == 1
+    stored = await db_session.scalar(
+        select(func.count(CalendarMeal.id)).where(CalendarMeal.calendar_id == calendar.id)
+    )
+    assert stored == 21
@@ -1,8 +1,9 @@
 from datetime import datetime, timedelta
 
 import pytest
+from sqlalchemy import select
 
-from app.models import Calendar, Recipe, RecipeTag, User
+from app.models import Calendar, CalendarMeal, Recipe, RecipeTag, User
 from app.services.calendar_prepopulate import CalendarPrepopulateService
 
 
@@ -116,3 +117,47 @@ async def test_prepopulate_raises_when_no_recipes(db_session):
             use_dietary_preferences=False,
             avoid_duplicates=True,
         )
+
+
+@pytest.mark.asyncio
+async def test_prepopulate_avoid_duplicates_cycles_through_all_recipes(db_session):
+    user = User(username="cycleu", email="cycle@example.com", password_hash="x")
+    db_session.add(user)
+    await db_session.commit()
+    await db_session.refresh(user)
+
+    cal = Calendar(name="CycleCal", owner_id=user.id)
+    db_session.add(cal)
+    await db_session.commit()
+    await db_session.refresh(cal)
+
+    recipes = [
+        Recipe(title=f"Dinner{i}", owner_id=user.id, category="dinner", visibility="public")
+        for i in range(3)
+    ]
+    db_session.add_all(recipes)
+    await db_session.commit()
+
+    service = CalendarPrepopulateService(db_session)
+
+    meals_created, _ = await service.prepopulate_calendar(
+        calendar_id=cal.id,
+        user=user,
+        start_date=datetime.utcnow(),
+        period="week",
+        meal_types=["dinner"],
+        use_dietary_preferences=False,
+        avoid_duplicates=True,
+    )
+    assert meals_created == 7
+
+    result = await db_session.execute(
+        select(CalendarMeal.recipe_id)
+        .where(CalendarMeal.calendar_id == cal.id)
+        .order_by(CalendarMeal.meal_date)
+    )
+    recipe_ids = result.scalars().all()
+    # Every recipe is used once before any is repeated
+    all_ids = {recipe.id for recipe in recipes}
+    assert set(recipe_ids[:3]) == all_ids
+    assert set(recipe_ids[3:6]) == all_ids
@@ -0,0 +1,54 @@
+"""Tests for application settings."""
+
+import re
+
+import pytest
+
+from app.config import Settings
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "http://localhost:3080,http://localhost:5173",
+        " http://localhost:3080 , http://localhost:5173 ,",
+        '["http://localhost:3080","http://localhost:5173"]',
+    ],
+)
+def test_cors_origins_parses_comma_separated_and_json(raw):
+    settings = Settings(BACKEND_CORS_ORIGINS=raw)
+    assert settings.BACKEND_CORS_ORIGINS == ["http://localhost:3080", "http://localhost:5173"]
+    assert settings.cors_origin_regex is None
+
+
+def test_cors_origins_parsed_from_environment(monkeypatch):
+    monkeypatch.setenv("BACKEND_CORS_ORIGINS", "http://a.example, http://b.example")
+    assert Settings().BACKEND_CORS_ORIGINS == ["http://a.example", "http://b.example"]
+
+    monkeypatch.setenv("BACKEND_CORS_ORIGINS", '["http://a.example"]')
+    assert Settings().BACKEND_CORS_ORIGINS == ["http://a.example"]
+
+
+def test_cors_origin_regex_matches_wildcard_subdomains():
+    settings = Settings(BACKEND_CORS_ORIGINS="http://localhost:3080,https://*.example.com")
+    pattern = re.compile(settings.cors_origin_regex)
+
+    assert pattern.fullmatch("https://app.example.com")
+    assert not pattern.fullmatch("https://example.com")
+    assert not pattern.fullmatch("https://evil.com/.example.com")
+    assert not pattern.fullmatch("http://app.example.com")
+
+
+def test_app_version_is_resolved_once(monkeypatch):
+    import importlib.metadata
+
+    from app import config
+
+    def fail(_name):
+        raise AssertionError("package metadata should not be read after import")
+
+    monkeypatch.setattr(importlib.metadata, "version", fail)
+
+    settings = Settings()
+    assert settings.APP_VERSION == config.APP_VERSION
+    assert settings.app_version == config.APP_VERSION
@@ -0,0 +1,144 @@
+"""Tests for database engine configuration."""
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.database import set_sqlite_pragmas
+
+
+@pytest.mark.asyncio
+async def test_sqlite_pragmas_enable_wal(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'wal.db'}")
+    event.listen(engine.sync_engine, "connect", set_sqlite_pragmas)
+
+    try:
+        async with engine.connect() as conn:
+            journal_mode = (await conn.execute(text("PRAGMA journal_mode"))).scalar()
+            synchronous = (await conn.execute(text("PRAGMA synchronous"))).scalar()
+    finally:
+        await engine.dispose()
+
+    assert journal_mode == "wal"
+    assert synchronous == 1  # NORMAL
+
+
+@pytest.mark.asyncio
+async def test_safe_select_raises_on_unloaded_relationships(db_session, strict_loading):
+    from sqlalchemy import select
+    from sqlalchemy.exc import InvalidRequestError
+
+    from app.db_debug import safe_select
+    from app.models import Recipe, RecipeTag, User
+
+    user = User(username="loader", email="loader@example.com", password_hash="x")
+    db_session.add(user)
+    await db_session.flush()
+    recipe = Recipe(title="Soup", owner_id=user.id)
+    db_session.add(recipe)
+    await db_session.flush()
+    db_session.add(RecipeTag(recipe_id=recipe.id, tag_name="warm"))
+    await db_session.commit()
+    db_session.expunge_all()
+
+    loaded = (await db_session.execute(safe_select(Recipe, Recipe.tags))).scalar_one()
+    assert [tag.tag_name for tag in loaded.tags] == ["warm"]
+    with pytest.raises(InvalidRequestError):
+        _ = loaded.owner
+
+    # strict_loading applies the same guard to plain selects
+    db_session.expunge_all()
+    plain = (await db_session.execute(select(Recipe))).scalar_one()
+    with pytest.raises(InvalidRequestError):
+        _ = plain.owner
+
+
+@pytest.mark.asyncio
+async def test_timestamps_are_generated_by_the_database(db_session):
+    from app.models import User
+
+    user = User(username="stamped", email="stamped@example.com", password_hash="x")
+    db_session.add(user)
+    await db_session.flush()
+    # Both values are fetched at flush time, so reading them needs no refresh
+    assert user.created_at is not None
+    assert user.updated_at is not None
+
+    user.calorie_target = 2000
+    await db_session.flush()
+    assert user.updated_at is not None
+
+
+@pytest.mark.asyncio
+async def test_user_content_collections_are_write_only(db_session):
+    from app.models import Recipe, User
+
+    user = User(username="prolific", email="prolific@example.com", password_hash="x")
+    db_session.add(user)
+    await db_session.flush()
+    db_session.add_all([Recipe(title=f"Dish {i}", owner_id=user.id) for i in range(3)])
+    await db_session.commit()
+
+    # Loading every recipe a user owns has to be asked for explicitly, with a limit
+    with pytest.raises(TypeError):
+        list(user.recipes)
+    page = await db_session.scalars(user.recipes.select().order_by(Recipe.id).limit(2))
+    assert [recipe.title for recipe in page] == ["Dish 0", "Dish 1"]
+
+
+@pytest.mark.asyncio
+async def test_deleting_a_calendar_removes_meals_without_loading_them(db_session):
+    from datetime import datetime
+
+    from sqlalchemy import func, select
+
+    from app.models import Calendar, CalendarMeal, Recipe, User
+
+    user = User(username="planner", email="planner@example.com", password_hash="x")
+    db_session.add(user)
+    await db_session.flush()
+    recipe = Recipe(title="Stew", owner_id=user.id)
+    calendar = Calendar(name="Week", owner_id=user.id)
+    db_session.add_all([recipe, calendar])
+    await db_session.flush()
+    db_session.add_all(
+        [
+            CalendarMeal(calendar_id=calendar.id, recipe_id=recipe.id, meal_date=datetime(2026, 1, d), meal_type="dinner")
+            for d in (1, 2, 3)
+        ]
+    )
+    await db_session.commit()
+    db_session.expunge_all()
+
+    statements = []
+    sync_engine = db_session.bind.sync_engine
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    calendar = await db_session.get(Calendar, calendar.id)
+    event.listen(sync_engine, "before_cursor_execute", record)
+    try:
+        await db_session.delete(calendar)
+        await db_session.commit()
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", record)
+
+    # One DELETE for the meals and one for the calendar, with no SELECT of the meals
+    assert not [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+    remaining = await db_session.scalar(select(func.count(CalendarMeal.id)))
+    assert remaining == 0
+
+
+def test_primary_keys_have_no_duplicate_index():
+    import app.models  # noqa: F401  # registers every table on the metadata
+    from app.database import Base
+
+    for table in Base.metadata.tables.values():
+        primary_key = [column.name for column in table.primary_key.columns]
+        # The primary key constraint already provides this index
+        assert not [
+            index.name
+            for index in table.indexes
+            if [column.name for column in index.columns] == primary_key
+        ], table.name
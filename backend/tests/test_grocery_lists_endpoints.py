@@ -72,3 +72,26 @@ async def test_grocery_list_access_control(client: AsyncClient, test_user, test_
     # Other cannot access
     resp = await client.get(f"/api/v1/grocery-lists/{gl.id}", headers={"Authorization": f"Bearer {token_other}"})
     assert resp.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_grocery_list_skips_menu_items_and_deleted_recipes(client: AsyncClient, test_user, test_token, db_session: AsyncSession):
+    cal = Calendar(name="MenuCal", owner_id=test_user.id)
+    menu_item = Recipe(title="Takeout", owner_id=test_user.id, ingredients=None)
+    soup = Recipe(title="Soup", owner_id=test_user.id, ingredients=[{"name": "leek", "quantity": 2, "unit": "pcs"}])
+    deleted = Recipe(title="Gone", owner_id=test_user.id, ingredients=[{"name": "lard", "quantity": 1, "unit": "kg"}], deleted_at=datetime.utcnow())
+    db_session.add_all([cal, menu_item, soup, deleted])
+    await db_session.commit()
+
+    meal_date = datetime.now().replace(hour=12, minute=0, second=0, microsecond=0)
+    db_session.add_all(
+        [
+            CalendarMeal(calendar_id=cal.id, recipe_id=recipe.id, meal_date=meal_date, meal_type="dinner")
+            for recipe in (menu_item, soup, deleted)
+        ]
+    )
+    await db_session.commit()
+
+    resp = await client.post(f"/api/v1/grocery-lists?calendar_id={cal.id}", json={"name": "Menu"}, headers={"Authorization": f"Bearer {test_token}"})
+    assert resp.status_code == 201
+    assert [item["name"] for item in resp.json()["items"]] == ["leek"]
@@ -219,3 +219,36 @@ class TestSanitizingFilter:
         expected = "beforeafter"
         result = self.sanitizing_filter._sanitize(test_input)
         assert result == expected, f"Failed to sanitize control character {repr(control_char)}"
+
+
+def test_setup_logging_enqueues_sanitized_records(tmp_path, monkeypatch):
+    """Test that app log records are sanitized and handed off to a queue."""
+    import logging.handlers
+    import queue
+
+    from app.logging_config import setup_logging
+
+    monkeypatch.chdir(tmp_path)
+    app_logger = logging.getLogger("app")
+    original_handlers = app_logger.handlers[:]
+    original_level = app_logger.level
+
+    try:
+        setup_logging(debug=True)
+        new_handlers = [h for h in app_logger.handlers if h not in original_handlers]
+        assert len(new_handlers) == 1
+        queue_handler = new_handlers[0]
+        assert isinstance(queue_handler, logging.handlers.QueueHandler)
+        assert any(isinstance(f, SanitizingFilter) for f in queue_handler.filters)
+
+        # Route the next record to a private queue so the listener thread
+        # does not consume it before we can inspect it
+        captured: queue.SimpleQueue = queue.SimpleQueue()
+        monkeypatch.setattr(queue_handler, "queue", captured)
+        app_logger.info("user %s", "evil\nFAKE ENTRY")
+
+        record = captured.get_nowait()
+        assert record.getMessage() == "user evilFAKE ENTRY"
+    finally:
+        app_logger.handlers[:] = original_handlers
+        app_logger.setLevel(original_level)
@@ -21,3 +21,398 @@ async def test_root_endpoint(client: AsyncClient):
     data = response.json()
     assert "message" in data
     assert "version" in data
+
+
+@pytest.mark.asyncio
+async def test_cors_preflight_is_cacheable(client: AsyncClient):
+    """Test that CORS preflight responses carry a max-age and explicit allow lists."""
+    response = await client.options(
+        "/health",
+        headers={
+            "Origin": "http://localhost:5173",
+            "Access-Control-Request-Method": "PUT",
+            "Access-Control-Request-Headers": "Authorization, Content-Type",
+        },
+    )
+    assert response.status_code == 200
+    assert response.headers["access-control-max-age"] == "86400"
+    assert response.headers["access-control-allow-origin"] == "http://localhost:5173"
+    assert "PUT" in response.headers["access-control-allow-methods"]
+    assert "Authorization" in response.headers["access-control-allow-headers"]
+
+
+def test_cors_middleware_wraps_rate_limiter():
+    """Test that CORS runs outside rate limiting so preflights are not counted."""
+    from fastapi.middleware.cors import CORSMiddleware
+
+    from app.main import app
+    from app.middleware.rate_limit import RateLimitMiddleware
+
+    # user_middleware is ordered outermost first
+    middleware_classes = [middleware.cls for middleware in app.user_middleware]
+    assert middleware_classes.index(CORSMiddleware) < middleware_classes.index(
+        RateLimitMiddleware
+    )
+
+
+@pytest.mark.asyncio
+async def test_shutdown_closes_shared_http_client():
+    """Test that the shared outbound HTTP client is closed on shutdown."""
+    from app.main import app, lifespan
+    from app.utils.http_client import get_http_client
+
+    http_client = get_http_client()
+    assert get_http_client() is http_client
+
+    async with lifespan(app):
+        pass
+
+    assert http_client.is_closed
+    assert get_http_client() is not http_client
+
+
+@pytest.mark.asyncio
+async def test_serve_uploaded_file_supports_etag_revalidation(client: AsyncClient):
+    """Test that uploaded files are served with an ETag and honor If-None-Match."""
+    import uuid
+    from pathlib import Path
+
+    folder = Path("uploads") / f"test-{uuid.uuid4().hex[:8]}"
+    folder.mkdir(parents=True)
+    image = folder / "photo.png"
+    image.write_bytes(b"\x89PNG\r\n\x1a\n" + b"0" * 64)
+
+    try:
+        response = await client.get(f"/uploads/{folder.name}/photo.png")
+        assert response.status_code == 200
+        assert response.content == image.read_bytes()
+        assert response.headers["content-type"] == "image/png"
+        assert response.headers["access-control-allow-origin"] == "*"
+        etag = response.headers["etag"]
+
+        response = await client.get(
+            f"/uploads/{folder.name}/photo.png", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert response.content == b""
+
+        # Browsers may send several validators, possibly as weak ETags
+        response = await client.get(
+            f"/uploads/{folder.name}/photo.png",
+            headers={"If-None-Match": f'"stale", W/{etag.removeprefix("W/")}'},
+        )
+        assert response.status_code == 304
+
+        response = await client.get(
+            f"/uploads/{folder.name}/photo.png", headers={"If-None-Match": '"stale"'}
+        )
+        assert response.status_code == 200
+
+        response = await client.get(f"/uploads/{folder.name}/missing.png")
+        assert response.status_code == 404
+    finally:
+        image.unlink()
+        folder.rmdir()
+
+
+@pytest.mark.asyncio
+async def test_uploaded_images_are_not_gzipped(client: AsyncClient):
+    """Test that already-compressed uploads bypass response compression."""
+    import uuid
+    from pathlib import Path
+
+    folder = Path("uploads") / f"test-{uuid.uuid4().hex[:8]}"
+    folder.mkdir(parents=True)
+    image = folder / "photo.png"
+    image.write_bytes(b"\x89PNG\r\n\x1a\n" + b"0" * 8192)
+
+    try:
+        response = await client.get(
+            f"/uploads/{folder.name}/photo.png", headers={"Accept-Encoding": "gzip"}
+        )
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+        assert response.content == image.read_bytes()
+    finally:
+        image.unlink()
+        folder.rmdir()
+
+
+@pytest.mark.asyncio
+async def test_image_proxy_uses_shared_http_client(monkeypatch, client: AsyncClient, test_engine):
+    """Test that the image proxy fetches through the shared outbound client."""
+    import httpx
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    import app.database
+    import app.main
+    from app.services.blocked_domains import invalidate_blocked_domains
+
+    monkeypatch.setattr(
+        app.database,
+        "AsyncSessionLocal",
+        async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False),
+    )
+    invalidate_blocked_domains()
+
+    requests_seen = []
+
+    image_bytes = b"GIF89a" + b"x" * 200_000
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request.method)
+        if request.url.path == "/page.html":
+            return httpx.Response(200, content=b"<html></html>", headers={"content-type": "text/html"})
+        return httpx.Response(200, content=image_bytes, headers={"content-type": "image/gif"})
+
+    upstream = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(app.main, "get_http_client", lambda: upstream)
+
+    image_url = "https://cdn.example.com/a.gif"
+    response = await client.get("/image-proxy", params={"image_url": image_url, "validate_only": True})
+    assert response.status_code == 200
+    assert response.json() == {"success": True, "domain": "cdn.example.com"}
+
+    response = await client.get("/image-proxy", params={"image_url": image_url})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/gif"
+    assert response.content == image_bytes
+    assert requests_seen == ["HEAD", "GET"]
+
+    response = await client.get(
+        "/image-proxy", params={"image_url": "https://cdn.example.com/page.html"}
+    )
+    assert response.status_code == 400
+
+    await upstream.aclose()
+
+
+@pytest.mark.asyncio
+async def test_image_proxy_blocked_domains_are_cached(monkeypatch, client: AsyncClient, test_engine, db_session):
+    """Test that blocked domains are served from cache and refreshed on admin changes."""
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    import app.database
+    from app.models import BlockedImageDomain, User
+    from app.services import blocked_domains
+    from app.utils.auth import create_access_token
+
+    sessions_opened = []
+    session_factory = async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
+
+    def counting_session_factory():
+        sessions_opened.append(1)
+        return session_factory()
+
+    monkeypatch.setattr(app.database, "AsyncSessionLocal", counting_session_factory)
+    blocked_domains.invalidate_blocked_domains()
+
+    db_session.add(BlockedImageDomain(domain="blocked.example.com", reason="test"))
+    admin = User(username="admin", email="admin@example.com", password_hash="x", is_admin=True)
+    db_session.add(admin)
+    await db_session.commit()
+
+    for _ in range(3):
+        response = await client.get(
+            "/image-proxy", params={"image_url": "https://www.blocked.example.com/a.png"}
+        )
+        assert response.status_code == 403
+    assert len(sessions_opened) == 1
+
+    # Blocking a domain through the admin API takes effect immediately
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': str(admin.id)})}"}
+    response = await client.post(
+        "/api/v1/admin/blocked-domains", json={"domain": "other.example.com"}, headers=headers
+    )
+    assert response.status_code == 201
+    response = await client.get(
+        "/image-proxy", params={"image_url": "https://other.example.com/a.png"}
+    )
+    assert response.status_code == 403
+    assert len(sessions_opened) == 2
+
+
+@pytest.mark.asyncio
+async def test_image_proxy_auto_blocks_failing_domain_once(
+    monkeypatch, client: AsyncClient, test_engine, db_session
+):
+    """Test that repeated upstream failures record a single blocked domain row."""
+    import httpx
+    from sqlalchemy import select
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    import app.database
+    import app.main
+    from app.models import BlockedImageDomain
+    from app.services.blocked_domains import block_domain, invalidate_blocked_domains
+
+    monkeypatch.setattr(
+        app.database,
+        "AsyncSessionLocal",
+        async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False),
+    )
+    invalidate_blocked_domains()
+
+    upstream = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(403))
+    )
+    monkeypatch.setattr(app.main, "get_http_client", lambda: upstream)
+
+    response = await client.get(
+        "/image-proxy", params={"image_url": "https://forbidden.example.com/a.png"}
+    )
+    assert response.status_code == 400
+
+    # A concurrent failure for the same domain must not violate the unique index
+    await block_domain("forbidden.example.com", "Auto-blocked: Returned HTTP 500")
+
+    result = await db_session.execute(
+        select(BlockedImageDomain).where(BlockedImageDomain.domain == "forbidden.example.com")
+    )
+    blocked = result.scalars().all()
+    assert len(blocked) == 1
+    assert blocked[0].reason == "Auto-blocked: Returned 403 Forbidden"
+
+    response = await client.get(
+        "/image-proxy", params={"image_url": "https://forbidden.example.com/a.png"}
+    )
+    assert response.status_code == 403
+
+    await upstream.aclose()
+
+
+@pytest.mark.asyncio
+async def test_image_proxy_fails_fast_when_saturated(monkeypatch, client: AsyncClient):
+    """Test that the image proxy returns 503 when every upstream fetch slot is busy."""
+    import asyncio
+
+    import app.main
+
+    async def no_blocked_domains() -> frozenset[str]:
+        return frozenset()
+
+    monkeypatch.setattr(app.main, "get_blocked_domains", no_blocked_domains)
+    monkeypatch.setattr(app.main, "_image_proxy_slots", asyncio.Semaphore(0))
+    monkeypatch.setattr(app.main, "IMAGE_PROXY_ACQUIRE_TIMEOUT", 0.01)
+
+    response = await client.get(
+        "/image-proxy", params={"image_url": "https://slow.example.com/a.png"}
+    )
+    assert response.status_code == 503
+
+
+def test_api_routes_default_to_orjson_responses():
+    """Test that routes without an explicit response class encode JSON with orjson."""
+    from fastapi.responses import ORJSONResponse
+    from fastapi.routing import APIRoute
+
+    from app.main import app
+
+    route = next(
+        route
+        for route in app.routes
+        if isinstance(route, APIRoute) and route.path == "/api/v1/recipes/tags/all"
+    )
+    assert route.response_class is ORJSONResponse
+
+
+@pytest.mark.asyncio
+async def test_streamed_upstream_is_closed_when_client_disconnects():
+    """Test that a proxied upstream response is closed even if sending the body fails."""
+    import httpx
+    from starlette.requests import ClientDisconnect
+
+    from app.utils.http_client import stream_upstream_response
+
+    async def body():
+        for _ in range(4):
+            yield b"x" * 65536
+
+    upstream_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, content=body()))
+    )
+    upstream = await upstream_client.send(
+        upstream_client.build_request("GET", "https://cdn.example.com/a.png"), stream=True
+    )
+    response = stream_upstream_response(upstream, media_type="image/png", headers={})
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            raise OSError("client went away")
+
+    scope = {"type": "http", "asgi": {"spec_version": "2.4"}}
+    with pytest.raises(ClientDisconnect):
+        await response(scope, receive, send)
+    assert upstream.is_closed
+
+    await upstream_client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_image_proxy_slot_is_held_until_body_is_sent(monkeypatch):
+    """Test that an image fetch slot stays taken while the upstream body streams."""
+    import asyncio
+
+    import httpx
+    from starlette.requests import ClientDisconnect
+
+    import app.main
+
+    async def no_blocked_domains() -> frozenset[str]:
+        return frozenset()
+
+    slots = asyncio.Semaphore(1)
+    monkeypatch.setattr(app.main, "get_blocked_domains", no_blocked_domains)
+    monkeypatch.setattr(app.main, "_image_proxy_slots", slots)
+
+    upstream = httpx.AsyncClient(
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(
+                200, content=b"x" * 200_000, headers={"content-type": "image/png"}
+            )
+        )
+    )
+    monkeypatch.setattr(app.main, "get_http_client", lambda: upstream)
+
+    image_url = "https://cdn.example.com/a.png"
+    response = await app.main.download_image_proxy_test(image_url=image_url, validate_only=False)
+    assert slots.locked()
+    assert b"".join([chunk async for chunk in response.body_iterator]) == b"x" * 200_000
+    assert not slots.locked()
+
+    # A client that disconnects before the first chunk still frees the slot
+    response = await app.main.download_image_proxy_direct(image_url=image_url)
+    assert slots.locked()
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        raise OSError("client went away")
+
+    with pytest.raises(ClientDisconnect):
+        await response({"type": "http", "asgi": {"spec_version": "2.4"}}, receive, send)
+    assert not slots.locked()
+
+    await upstream.aclose()
+
+
+
+def test_image_routes_skip_gzip():
+    """Test that every route streaming image bytes is excluded from compression."""
+    from app.main import app
+    from app.middleware.gzip import SelectiveGZipMiddleware
+
+    gzip = next(m for m in app.user_middleware if m.cls is SelectiveGZipMiddleware)
+    skip_path_prefixes = gzip.kwargs["skip_path_prefixes"]
+    for path in (
+        "/uploads/a/photo.png",
+        "/image-proxy",
+        "/api/v1/recipes/download-image",
+        "/api/v1/recipes/download-image-proxy",
+    ):
+        assert path.startswith(skip_path_prefixes), path
+    assert not "/api/v1/recipes".startswith(skip_path_prefixes)
@@ -1,47 +1,168 @@
+import json
 
 import pytest
-from starlette.requests import Request
 from starlette.responses import Response
 
 from app.middleware.rate_limit import RateLimitMiddleware
 
 
+async def ok_app(scope, receive, send):
+    await Response("ok", status_code=200)(scope, receive, send)
+
+
+async def call_middleware(mw, path="/test"):
+    """Run one HTTP request through the middleware and collect the sent messages."""
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "client": ("127.0.0.1", 1234),
+        "headers": [],
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await mw(scope, receive, send)
+    start = messages[0]
+    headers = {k.decode().lower(): v.decode() for k, v in start["headers"]}
+    body = b"".join(m.get("body", b"") for m in messages[1:])
+    return start["status"], headers, body
+
+
 @pytest.mark.asyncio
 async def test_rate_limit_skipped_when_testing_env(monkeypatch):
     # Ensure TESTING env var causes middleware to bypass limits
     monkeypatch.setenv("TESTING", "1")
 
-    mw = RateLimitMiddleware(app=None)
+    mw = RateLimitMiddleware(app=ok_app, requests_per_minute=1, requests_per_hour=1)
+
+    for _ in range(3):
+        status_code, headers, _ = await call_middleware(mw)
+        assert status_code == 200
+        assert "x-ratelimit-limit-minute" not in headers
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_blocks_and_headers(monkeypatch):
+    monkeypatch.delenv("TESTING", raising=False)
 
-    scope = {"type": "http", "method": "GET", "path": "/test", "client": ("127.0.0.1", 1234), "headers": []}
-    request = Request(scope)
+    mw = RateLimitMiddleware(app=ok_app, requests_per_minute=1, requests_per_hour=1)
 
-    async def call_next(req):
-        return Response("ok", status_code=200)
+    # First request should pass and include headers
+    status_code, headers, body = await call_middleware(mw)
+    assert status_code == 200
+    assert body == b"ok"
+    assert headers["x-ratelimit-limit-minute"] == "1"
+    assert headers["x-ratelimit-remaining-minute"] == "0"
+    assert headers["x-ratelimit-remaining-hour"] == "0"
 
-    resp = await mw.dispatch(request, call_next)
-    assert resp.status_code == 200
+    # Second request should be blocked (exceeds per-minute and per-hour)
+    status_code, headers, body = await call_middleware(mw)
+    assert status_code == 429
+    assert headers["retry-after"] == "3600"
+    assert json.loads(body) == {"detail": "Too many requests. Please try again later."}
 
 
 @pytest.mark.asyncio
-async def test_rate_limit_blocks_and_headers(monkeypatch):
+async def test_rate_limit_per_minute_block(monkeypatch):
     monkeypatch.delenv("TESTING", raising=False)
 
-    mw = RateLimitMiddleware(app=None, requests_per_minute=1, requests_per_hour=1)
+    mw = RateLimitMiddleware(app=ok_app, requests_per_minute=2, requests_per_hour=100)
 
-    scope = {"type": "http", "method": "GET", "path": "/test", "client": ("127.0.0.1", 1234), "headers": []}
-    request = Request(scope)
+    for _ in range(2):
+        status_code, _, _ = await call_middleware(mw)
+        assert status_code == 200
 
-    async def call_next(req):
-        return Response("ok", status_code=200)
+    status_code, headers, body = await call_middleware(mw)
+    assert status_code == 429
+    assert headers["retry-after"] == "60"
+    assert json.loads(body)["detail"] == "Rate limit exceeded. Please slow down."
 
-    # First request should pass and include headers
-    resp1 = await mw.dispatch(request, call_next)
-    assert resp1.status_code == 200
-    assert "X-RateLimit-Limit-Minute" in resp1.headers
 
-    # Second request should be blocked (exceeds per-minute and per-hour)
-    with pytest.raises(Exception) as exc:
-        await mw.dispatch(request, call_next)
-    # Expect HTTPException with 429 status
-    assert "Too many" in str(exc.value) or "Rate limit" in str(exc.value)
+@pytest.mark.asyncio
+async def test_rate_limit_skips_health_check(monkeypatch):
+    monkeypatch.delenv("TESTING", raising=False)
+
+    mw = RateLimitMiddleware(app=ok_app, requests_per_minute=1, requests_per_hour=1)
+
+    for _ in range(3):
+        status_code, _, _ = await call_middleware(mw, path="/health")
+        assert status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_window_slides(monkeypatch):
+    monkeypatch.delenv("TESTING", raising=False)
+    from app.middleware import rate_limit
+
+    now = [1_000_000.0]
+    monkeypatch.setattr(rate_limit.time, "time", lambda: now[0])
+
+    mw = RateLimitMiddleware(app=ok_app, requests_per_minute=1, requests_per_hour=2)
+
+    assert (await call_middleware(mw))[0] == 200
+    assert (await call_middleware(mw))[0] == 429
+
+    # A minute later the per-minute slot frees up, but the hour now has 2 requests
+    now[0] += 61
+    status_code, headers, _ = await call_middleware(mw)
+    assert status_code == 200
+    assert headers["x-ratelimit-remaining-hour"] == "0"
+    now[0] += 61
+    assert (await call_middleware(mw))[0] == 429
+
+    # Once the first request ages out of the hour window it is dropped
+    now[0] += 3600 - 122 + 1
+    assert (await call_middleware(mw))[0] == 200
+    assert len(mw.request_times["127.0.0.1"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_evicts_idle_client_buckets(monkeypatch):
+    monkeypatch.delenv("TESTING", raising=False)
+    from app.middleware import rate_limit
+
+    now = [1_000_000.0]
+    monkeypatch.setattr(rate_limit.time, "time", lambda: now[0])
+    monkeypatch.setattr(rate_limit, "BUCKET_SWEEP_INTERVAL", 3)
+
+    mw = RateLimitMiddleware(app=ok_app)
+    mw.request_times["10.0.0.1"].append(now[0] - 7200)
+    mw.request_times["10.0.0.2"].append(now[0] - 60)
+
+    await call_middleware(mw)
+    await call_middleware(mw)
+    assert "10.0.0.1" in mw.request_times
+
+    # The third request triggers a sweep that drops only the idle client
+    await call_middleware(mw)
+    assert "10.0.0.1" not in mw.request_times
+    assert "10.0.0.2" in mw.request_times
+    assert len(mw.request_times["127.0.0.1"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_keys_on_forwarded_client_behind_trusted_proxy(monkeypatch):
+    monkeypatch.delenv("TESTING", raising=False)
+
+    mw = RateLimitMiddleware(
+        app=ok_app, requests_per_minute=10, requests_per_hour=100, trusted_proxies=["10.0.0.0/8"]
+    )
+
+    def scope(peer, forwarded=None):
+        headers = [(b"x-forwarded-for", forwarded.encode())] if forwarded else []
+        return {"type": "http", "client": (peer, 1234), "headers": headers}
+
+    # The nearest untrusted hop is the client; spoofed entries to its left are ignored
+    assert mw._client_ip(scope("10.0.0.5", "6.6.6.6, 1.2.3.4, 10.0.0.9")) == "1.2.3.4"
+    assert mw._client_ip(scope("10.0.0.5")) == "10.0.0.5"
+    # Untrusted peers cannot choose their own bucket
+    assert mw._client_ip(scope("8.8.8.8", "1.2.3.4")) == "8.8.8.8"
+
+    untrusting = RateLimitMiddleware(app=ok_app)
+    assert untrusting._client_ip(scope("10.0.0.5", "1.2.3.4")) == "10.0.0.5"
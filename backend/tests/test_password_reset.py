@@ -80,6 +80,39 @@ async def test_forgot_password_flow(client: AsyncClient, db_session: AsyncSessio
     assert "access_token" in response.json()
 
 
+@pytest.mark.asyncio
+async def test_forgot_password_invalidates_previous_token(client: AsyncClient, db_session: AsyncSession):
+    """Test that requesting a new reset link invalidates the previous one."""
+    user = User(
+        username="testuser",
+        email="test@example.com",
+        password_hash=get_password_hash("oldpassword"),
+    )
+    db_session.add(user)
+    await db_session.commit()
+
+    tokens = []
+    for _ in range(2):
+        response = await client.post(
+            "/api/v1/auth/forgot-password",
+            json={"email": "test@example.com"},
+        )
+        assert response.status_code == 200
+        tokens.append(response.json()["token"])
+
+    response = await client.post(
+        "/api/v1/auth/reset-password",
+        json={"token": tokens[0], "new_password": "newpassword123"},
+    )
+    assert response.status_code == 400
+
+    response = await client.post(
+        "/api/v1/auth/reset-password",
+        json={"token": tokens[1], "new_password": "newpassword123"},
+    )
+    assert response.status_code == 200
+
+
 @pytest.mark.asyncio
 async def test_forgot_password_invalid_email(client: AsyncClient):
     """Test forgot password with non-existent email."""
@@ -163,3 +163,52 @@ async def test_list_favorites(client: AsyncClient, db_session: AsyncSession):
     favorites = response.json()
     assert len(favorites) == 1
     assert favorites[0]["title"] == "Recipe 0"
+
+
+@pytest.mark.asyncio
+async def test_rate_recipe_twice_updates_single_row(client: AsyncClient, db_session: AsyncSession):
+    """Test that re-rating a recipe updates the existing rating in place."""
+    from sqlalchemy import select
+
+    from app.models import RecipeRating
+
+    user = User(
+        username="testuser",
+        email="test@example.com",
+        password_hash=get_password_hash("password"),
+    )
+    db_session.add(user)
+    await db_session.commit()
+
+    recipe = Recipe(title="Test Recipe", owner_id=user.id)
+    db_session.add(recipe)
+    await db_session.commit()
+
+    token = create_access_token(data={"sub": str(user.id)})
+    headers = {"Authorization": f"Bearer {token}"}
+
+    first = await client.post(
+        f"/api/v1/recipes/{recipe.id}/ratings",
+        json={"rating": 2, "review": "Meh"},
+        headers=headers,
+    )
+    assert first.status_code == 201
+
+    second = await client.post(
+        f"/api/v1/recipes/{recipe.id}/ratings",
+        json={"rating": 4, "review": "Better second time"},
+        headers=headers,
+    )
+    assert second.status_code == 201
+    data = second.json()
+    assert data["id"] == first.json()["id"]
+    assert data["rating"] == 4
+    assert data["review"] == "Better second time"
+    assert data["created_at"] == first.json()["created_at"]
+
+    result = await db_session.execute(
+        select(RecipeRating).where(RecipeRating.recipe_id == recipe.id)
+    )
+    ratings = result.scalars().all()
+    assert len(ratings) == 1
+    assert ratings[0].rating == 4
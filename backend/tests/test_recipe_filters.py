@@ -99,6 +99,13 @@ async def test_filter_recipes_by_difficulty(client: AsyncClient, db_session: Asy
     assert len(recipes) == 1
     assert recipes[0]["difficulty"] == "easy"
 
+    # Unknown difficulty levels are rejected before reaching the database
+    response = await client.get(
+        "/api/v1/recipes?difficulty=extreme",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 422
+
 
 @pytest.mark.asyncio
 async def test_filter_recipes_by_prep_time(client: AsyncClient, db_session: AsyncSession):
@@ -191,3 +198,84 @@ async def test_filter_recipes_by_dietary_tag(client: AsyncClient, db_session: As
         recipes = recipes.get("items", [])
     assert len(recipes) == 1
     assert recipes[0]["title"] == "Vegan Salad"
+
+
+@pytest.mark.asyncio
+async def test_list_recipes_without_groups_hides_group_recipes(
+    client: AsyncClient, db_session: AsyncSession
+):
+    """Test that a user with no groups sees own and public recipes only."""
+    owner = User(
+        username="owner",
+        email="owner@example.com",
+        password_hash=get_password_hash("password"),
+    )
+    viewer = User(
+        username="viewer",
+        email="viewer@example.com",
+        password_hash=get_password_hash("password"),
+    )
+    db_session.add_all([owner, viewer])
+    await db_session.commit()
+
+    db_session.add_all(
+        [
+            Recipe(title="Public Soup", owner_id=owner.id, visibility="public"),
+            Recipe(title="Group Stew", owner_id=owner.id, visibility="group", group_id=1),
+            Recipe(title="Private Pie", owner_id=owner.id, visibility="private"),
+            Recipe(title="My Salad", owner_id=viewer.id, visibility="private"),
+        ]
+    )
+    await db_session.commit()
+
+    token = create_access_token(data={"sub": str(viewer.id)})
+    response = await client.get(
+        "/api/v1/recipes",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 200
+    titles = {r["title"] for r in response.json()["items"]}
+    assert titles == {"Public Soup", "My Salad"}
+
+    response = await client.get(
+        "/api/v1/recipes/tags/all",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_filter_recipes_by_multiple_tags_returns_each_recipe_once(
+    client: AsyncClient, db_session: AsyncSession
+):
+    """Test that a recipe matching several requested tags is listed once."""
+    user = User(
+        username="testuser",
+        email="test@example.com",
+        password_hash=get_password_hash("password"),
+    )
+    db_session.add(user)
+    await db_session.commit()
+
+    recipe = Recipe(title="Buddha Bowl", owner_id=user.id)
+    other = Recipe(title="Burger", owner_id=user.id)
+    db_session.add_all([recipe, other])
+    await db_session.commit()
+
+    db_session.add_all(
+        [
+            RecipeTag(recipe_id=recipe.id, tag_name="vegan", tag_category="dietary"),
+            RecipeTag(recipe_id=recipe.id, tag_name="gluten-free", tag_category="dietary"),
+        ]
+    )
+    await db_session.commit()
+
+    token = create_access_token(data={"sub": str(user.id)})
+    response = await client.get(
+        "/api/v1/recipes?tags=vegan,gluten-free",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [r["title"] for r in data["items"]] == ["Buddha Bowl"]
+    assert data["pagination"]["total"] == 1
@@ -1,6 +1,6 @@
 import pytest
 
-from app.models import Recipe
+from app.models import Recipe, RecipeTag, UserFavorite
 
 
 @pytest.mark.asyncio
@@ -13,3 +13,28 @@ async def test_owner_delete_nonexistent_tag_returns_404(client, test_user, test_
     # Owner deleting a tag that doesn't exist should return 404
     resp = await client.delete(f"/api/v1/recipes/{r.id}/tags/99999", headers={"Authorization": f"Bearer {test_token}"})
     assert resp.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_and_update_return_loaded_tags_and_favorite(client, test_user, test_token, db_session):
+    r = Recipe(title="Tagged", owner_id=test_user.id, ingredients=[], instructions=[], visibility="public")
+    db_session.add(r)
+    await db_session.commit()
+    await db_session.refresh(r)
+    db_session.add(RecipeTag(recipe_id=r.id, tag_name="vegan", tag_category="dietary"))
+    db_session.add(UserFavorite(user_id=test_user.id, recipe_id=r.id))
+    await db_session.commit()
+
+    headers = {"Authorization": f"Bearer {test_token}"}
+    resp = await client.get(f"/api/v1/recipes/{r.id}", headers=headers)
+    assert resp.status_code == 200
+    body = resp.json()
+    assert [t["tag_name"] for t in body["tags"]] == ["vegan"]
+    assert body["is_favorite"] is True
+
+    resp = await client.put(f"/api/v1/recipes/{r.id}", json={"title": "Renamed"}, headers=headers)
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["title"] == "Renamed"
+    assert [t["tag_name"] for t in body["tags"]] == ["vegan"]
+    assert body["is_favorite"] is True
@@ -26,3 +26,9 @@ def test_clean_ingredient_filters_invalid():
     cleaned = clean_ingredient_data(input_data)
     # Only the last with name starting with unit should be filtered out or normalized; expect empty
     assert isinstance(cleaned, list)
+
+
+def test_clean_ingredient_unparseable_quantity_falls_back_to_stripping():
+    input_data = [{"name": "1.2.3 cup sugar", "quantity": 2, "unit": "cup"}]
+    cleaned = clean_ingredient_data(input_data)
+    assert cleaned == [{"name": "sugar", "quantity": 2.0, "unit": "cup"}]
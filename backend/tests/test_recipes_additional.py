@@ -23,6 +23,26 @@ async def test_create_recipe_returns_expected_fields(client: AsyncClient, test_u
     assert data["tags"] == []
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("path", "payload"),
+    [
+        ("/api/v1/recipes", {"title": "No Ingredients"}),
+        ("/api/v1/recipes/quick-add", {"title": "Leftovers"}),
+    ],
+)
+async def test_create_response_matches_get(client: AsyncClient, test_user, test_token, path, payload):
+    headers = {"Authorization": f"Bearer {test_token}"}
+    resp = await client.post(path, json=payload, headers=headers)
+    assert resp.status_code == 201
+    created = resp.json()
+    assert created["ingredients"] == []
+
+    resp = await client.get(f"/api/v1/recipes/{created['id']}", headers=headers)
+    assert resp.status_code == 200
+    assert resp.json() == created
+
+
 @pytest.mark.asyncio
 async def test_add_and_remove_tag_permissions(client: AsyncClient, db_session, test_user, test_token):
     # create recipe
@@ -107,7 +107,7 @@ async def test_upload_image_io_failure_returns_500(client, db_session, test_user
             raise OSError("disk full")
 
     # monkeypatch UploadFile read by passing BadFile via files param may not work; instead call endpoint directly via starlette TestClient simulation
-    files = {"file": ("bad.jpg", io.BytesIO(b"x"), "image/jpeg")}
+    files = {"file": ("bad.jpg", io.BytesIO(b"\xff\xd8\xff"), "image/jpeg")}
 
     # monkeypatch the open/write to raise
     def raise_open(*args, **kwargs):
@@ -97,6 +97,75 @@ async def test_import_invalid_json(client: AsyncClient, test_user: User, test_to
     assert resp.status_code == 400
 
 
+@pytest.mark.asyncio
+async def test_import_validates_nutritional_info(
+    client: AsyncClient, test_user: User, test_token: str
+):
+    payload = (
+        b'[{"title": "A", "nutritional_info": {"calories": "250", "sodium": 520}},'
+        b' {"title": "B", "nutritional_info": {"calories": "a lot"}}]'
+    )
+    resp = await client.post(
+        "/api/v1/recipes/import",
+        files={"file": ("recipes.json", payload, "application/json")},
+        headers={"Authorization": f"Bearer {test_token}"},
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["imported"] == 1
+    assert len(data["errors"]) == 1 and data["errors"][0].startswith("Recipe 2:")
+
+    resp = await client.get("/api/v1/recipes", headers={"Authorization": f"Bearer {test_token}"})
+    assert resp.status_code == 200
+    nutritional_info = resp.json()["items"][0]["nutritional_info"]
+    assert nutritional_info["calories"] == 250.0
+    # Nutrients outside the typed fields survive the import
+    assert nutritional_info["sodium"] == 520
+
+
+@pytest.mark.asyncio
+async def test_legacy_nutritional_info_is_readable(
+    client: AsyncClient, test_user: User, test_token: str, db_session: AsyncSession
+):
+    # Rows written before nutrition facts were validated may hold free text
+    db_session.add(
+        Recipe(
+            title="Legacy",
+            owner_id=test_user.id,
+            nutritional_info={"calories": "250 kcal", "protein": "lots", "allergens": "nuts"},
+        )
+    )
+    await db_session.commit()
+
+    resp = await client.get("/api/v1/recipes", headers={"Authorization": f"Bearer {test_token}"})
+    assert resp.status_code == 200
+    nutritional_info = resp.json()["items"][0]["nutritional_info"]
+    assert nutritional_info["calories"] == 250.0
+    assert nutritional_info["protein"] is None
+    assert nutritional_info["allergens"] == []
+
+
+@pytest.mark.asyncio
+async def test_import_normalizes_and_rejects_difficulty(
+    client: AsyncClient, test_user: User, test_token: str
+):
+    payload = b'[{"title": "A", "difficulty": "Easy"}, {"title": "B", "difficulty": "tricky"}]'
+    resp = await client.post(
+        "/api/v1/recipes/import",
+        files={"file": ("recipes.json", payload, "application/json")},
+        headers={"Authorization": f"Bearer {test_token}"},
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["imported"] == 1
+    assert len(data["errors"]) == 1 and data["errors"][0].startswith("Recipe 2:")
+
+    # The stored value loads back through the enum column
+    resp = await client.get("/api/v1/recipes", headers={"Authorization": f"Bearer {test_token}"})
+    assert resp.status_code == 200
+    assert [r["difficulty"] for r in resp.json()["items"]] == ["easy"]
+
+
 @pytest.mark.asyncio
 async def test_create_recipe_with_string_ingredient_parsing(client: AsyncClient, test_user: User, test_token: str):
     payload = {
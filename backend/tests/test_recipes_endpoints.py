@@ -38,6 +38,69 @@ async def test_create_and_get_recipe(
     assert resp.status_code == 200
     got = resp.json()
     assert got["title"] == "Test Recipe"
+    # The create response is built from the request body without revalidating it
+    assert got == created
+
+
+@pytest.mark.asyncio
+async def test_create_recipe_rejects_unknown_fields(
+    client: AsyncClient, test_user: User, test_token: str
+):
+    resp = await client.post(
+        "/api/v1/recipes",
+        json={"title": "Test Recipe", "owner_id": 999},
+        headers={"Authorization": f"Bearer {test_token}"},
+    )
+    assert resp.status_code == 422
+    assert resp.json()["detail"][0]["type"] == "extra_forbidden"
+
+
+@pytest.mark.asyncio
+async def test_nutritional_info_is_typed(
+    client: AsyncClient, test_user: User, test_token: str, db_session: AsyncSession
+):
+    recipe_payload = {
+        "title": "Nutrition Recipe",
+        "nutritional_info": {"calories": "450", "protein": 30, "allergens": ["nuts"], "sodium": 520},
+    }
+
+    resp = await client.post(
+        "/api/v1/recipes", json=recipe_payload, headers={"Authorization": f"Bearer {test_token}"}
+    )
+    assert resp.status_code == 201
+    assert resp.json()["nutritional_info"] == {
+        "calories": 450.0,
+        "protein": 30.0,
+        "carbs": None,
+        "fat": None,
+        "fiber": None,
+        "allergens": ["nuts"],
+        "sodium": 520,
+    }
+
+    # Other nutrients are kept, and values never given are not written as nulls
+    recipe = await db_session.get(Recipe, resp.json()["id"])
+    assert recipe.nutritional_info == {
+        "calories": 450.0,
+        "protein": 30.0,
+        "allergens": ["nuts"],
+        "sodium": 520,
+    }
+
+    resp = await client.put(
+        f"/api/v1/recipes/{recipe.id}",
+        json={"nutritional_info": {"fat": 12, "sugar": 4}},
+        headers={"Authorization": f"Bearer {test_token}"},
+    )
+    assert resp.status_code == 200
+    await db_session.refresh(recipe)
+    assert recipe.nutritional_info == {"fat": 12.0, "sugar": 4}
+
+    recipe_payload["nutritional_info"] = {"calories": "a lot"}
+    resp = await client.post(
+        "/api/v1/recipes", json=recipe_payload, headers={"Authorization": f"Bearer {test_token}"}
+    )
+    assert resp.status_code == 422
 
 
 @pytest.mark.asyncio
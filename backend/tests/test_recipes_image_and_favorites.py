@@ -2,8 +2,9 @@ import builtins
 import json
 
 import pytest
+from sqlalchemy import event
 
-from app.models import Recipe, User
+from app.models import Recipe, RecipeTag, User, UserFavorite
 from app.utils.auth import create_access_token
 
 
@@ -54,6 +55,133 @@ async def test_upload_recipe_image_save_failure(monkeypatch, client, db_session)
     assert "Failed to save image" in resp.json()["detail"]
 
 
+@pytest.mark.asyncio
+async def test_upload_recipe_image_too_large(monkeypatch, client, db_session):
+    u = User(username="imguser3", email="img3@example.com", password_hash="x")
+    db_session.add(u)
+    await db_session.commit()
+    await db_session.refresh(u)
+
+    r = Recipe(title="ImgR3", owner_id=u.id, ingredients=[], instructions=[])
+    db_session.add(r)
+    await db_session.commit()
+    await db_session.refresh(r)
+
+    token = create_access_token({"sub": str(u.id)})
+
+    from app.api.v1.endpoints import recipes as recipes_module
+
+    monkeypatch.setattr(recipes_module.settings, "MAX_UPLOAD_SIZE", 8)
+    monkeypatch.setattr(recipes_module, "UPLOAD_CHUNK_SIZE", 4)
+
+    files = {"file": ("image.jpg", b"\xff\xd8\xff" + b"0" * 16, "image/jpeg")}
+    resp = await client.post(f"/api/v1/recipes/{r.id}/image", files=files, headers={"Authorization": f"Bearer {token}"})
+    assert resp.status_code == 413
+
+    await db_session.refresh(r)
+    assert r.image_url is None
+
+
+@pytest.mark.asyncio
+async def test_upload_recipe_image_is_written_atomically(monkeypatch, client, db_session):
+    from pathlib import Path
+
+    from app.api.v1.endpoints import recipes as recipes_module
+
+    u = User(username="imguser5", email="img5@example.com", password_hash="x")
+    db_session.add(u)
+    await db_session.commit()
+
+    r = Recipe(title="ImgR5", owner_id=u.id, ingredients=[], instructions=[])
+    db_session.add(r)
+    await db_session.commit()
+
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': str(u.id)})}"}
+    upload_dir = Path("uploads/recipes")
+    content = b"\x89PNG\r\n\x1a\n" + b"0" * 32
+
+    resp = await client.post(
+        f"/api/v1/recipes/{r.id}/image",
+        files={"file": ("image.png", content, "image/png")},
+        headers=headers,
+    )
+    assert resp.status_code == 200
+    saved = upload_dir / resp.json()["image_url"].rsplit("/", 1)[-1]
+    assert saved.read_bytes() == content
+    assert not saved.with_name(f"{saved.name}.tmp").exists()
+    saved.unlink()
+
+    # A failure before the rename leaves neither the final nor the temporary file
+    before = set(upload_dir.iterdir())
+
+    def fail_replace(src, dst):
+        raise OSError("rename failed")
+
+    monkeypatch.setattr(recipes_module.os, "replace", fail_replace)
+    resp = await client.post(
+        f"/api/v1/recipes/{r.id}/image",
+        files={"file": ("image.png", content, "image/png")},
+        headers=headers,
+    )
+    assert resp.status_code == 500
+    assert set(upload_dir.iterdir()) == before
+
+
+@pytest.mark.asyncio
+async def test_upload_recipe_image_checks_magic_bytes(client, db_session):
+    u = User(username="imguser4", email="img4@example.com", password_hash="x")
+    db_session.add(u)
+    await db_session.commit()
+
+    r = Recipe(title="ImgR4", owner_id=u.id, ingredients=[], instructions=[])
+    db_session.add(r)
+    await db_session.commit()
+
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': str(u.id)})}"}
+
+    # Client claims an image but the bytes are not one
+    files = {"file": ("image.jpg", b"<script>alert(1)</script>", "image/jpeg")}
+    resp = await client.post(f"/api/v1/recipes/{r.id}/image", files=files, headers=headers)
+    assert resp.status_code == 400
+    assert resp.json()["detail"] == "File must be an image"
+
+    webp = b"RIFF\x24\x00\x00\x00WEBPVP8 " + b"0" * 16
+    files = {"file": ("image.webp", webp, "image/webp")}
+    resp = await client.post(f"/api/v1/recipes/{r.id}/image", files=files, headers=headers)
+    assert resp.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_upload_recipe_image_response_includes_tags_and_favorite(client, db_session):
+    u = User(username="imguser4", email="img4@example.com", password_hash="x")
+    db_session.add(u)
+    await db_session.commit()
+    await db_session.refresh(u)
+
+    r = Recipe(title="ImgR4", owner_id=u.id, ingredients=[], instructions=[])
+    db_session.add(r)
+    await db_session.commit()
+    await db_session.refresh(r)
+
+    db_session.add_all(
+        [
+            RecipeTag(recipe_id=r.id, tag_name="quick"),
+            UserFavorite(user_id=u.id, recipe_id=r.id),
+        ]
+    )
+    await db_session.commit()
+
+    token = create_access_token({"sub": str(u.id)})
+
+    files = {"file": ("image.jpg", b"\xff\xd8\xff", "image/jpeg")}
+    resp = await client.post(f"/api/v1/recipes/{r.id}/image", files=files, headers={"Authorization": f"Bearer {token}"})
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["is_favorite"] is True
+    assert [t["tag_name"] for t in data["tags"]] == ["quick"]
+    assert data["image_url"].endswith(".jpg")
+
+
 @pytest.mark.asyncio
 async def test_favorite_and_unfavorite_branches(client, db_session):
     u = User(username="favuser", email="fav@example.com", password_hash="x")
@@ -153,3 +281,96 @@ async def test_export_and_import_recipes_success_and_errors(client, db_session,
     assert data["imported"] == 1
     assert data["errors"] is not None
     assert any("Missing required field 'title'" in str(e) for e in data["errors"])
+
+
+@pytest.mark.asyncio
+async def test_export_streams_json_array_that_can_be_reimported(client, db_session):
+    u = User(username="exuser2", email="ex2@example.com", password_hash="x")
+    db_session.add(u)
+    await db_session.commit()
+    await db_session.refresh(u)
+
+    db_session.add_all(
+        [
+            Recipe(title="First", owner_id=u.id, instructions=["a"]),
+            Recipe(title="Second", owner_id=u.id, ingredients=[{"name": "egg", "quantity": 2, "unit": "whole"}]),
+        ]
+    )
+    await db_session.commit()
+
+    token = create_access_token({"sub": str(u.id)})
+
+    statements = []
+    sync_engine = db_session.bind.sync_engine
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(sync_engine, "before_cursor_execute", record)
+    try:
+        resp = await client.get("/api/v1/recipes/export/all", headers={"Authorization": f"Bearer {token}"})
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", record)
+    assert resp.status_code == 200
+    body = json.loads(resp.text)
+    assert sorted(item["title"] for item in body) == ["First", "Second"]
+    # Tags are not exported, so they are never loaded
+    assert not [s for s in statements if "FROM recipe_tags" in s]
+
+    files = {"file": ("recipes.json", resp.content, "application/json")}
+    resp2 = await client.post("/api/v1/recipes/import", files=files, headers={"Authorization": f"Bearer {token}"})
+    assert resp2.status_code == 200
+    assert resp2.json()["imported"] == 2
+
+
+@pytest.mark.asyncio
+async def test_export_is_gzip_compressed_when_accepted(client, db_session):
+    u = User(username="exuser3", email="ex3@example.com", password_hash="x")
+    db_session.add(u)
+    await db_session.commit()
+
+    db_session.add_all(
+        [Recipe(title=f"Recipe {i}", owner_id=u.id, instructions=["step"] * 5) for i in range(20)]
+    )
+    await db_session.commit()
+
+    headers = {
+        "Authorization": f"Bearer {create_access_token({'sub': str(u.id)})}",
+        "Accept-Encoding": "gzip",
+    }
+    resp = await client.get("/api/v1/recipes/export/all", headers=headers)
+    assert resp.status_code == 200
+    assert resp.headers["content-encoding"] == "gzip"
+    assert len(json.loads(resp.text)) == 20
+
+
+@pytest.mark.asyncio
+async def test_download_image_proxy_streams_upstream_body(monkeypatch):
+    import httpx
+    from fastapi import HTTPException
+    from fastapi.responses import StreamingResponse
+
+    from app.api.v1.endpoints import recipes as recipes_endpoints
+
+    image_bytes = b"\x89PNG" + b"x" * 200_000
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/missing.png":
+            return httpx.Response(404)
+        return httpx.Response(200, content=image_bytes, headers={"content-type": "image/png"})
+
+    upstream = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(recipes_endpoints, "get_http_client", lambda: upstream)
+
+    resp = await recipes_endpoints.download_image_proxy(image_url="https://img.test/a.png")
+    assert isinstance(resp, StreamingResponse)
+    assert resp.media_type == "image/png"
+    chunks = [chunk async for chunk in resp.body_iterator]
+    assert len(chunks) > 1
+    assert b"".join(chunks) == image_bytes
+
+    with pytest.raises(HTTPException) as exc_info:
+        await recipes_endpoints.download_image_proxy(image_url="https://img.test/missing.png")
+    assert exc_info.value.status_code == 400
+
+    await upstream.aclose()
@@ -0,0 +1,52 @@
+"""Tests for the seed recipe import endpoint."""
+
+import json
+from pathlib import Path
+
+import pytest
+from sqlalchemy import func, select
+
+from app.api.v1.endpoints import recipes as recipes_endpoints
+from app.models import Recipe, User
+
+SEED_FILE = Path(__file__).parent.parent / "data" / "seed_recipes.json"
+
+
+@pytest.fixture(autouse=True)
+def reset_seed_user_cache(monkeypatch):
+    """Each test gets a fresh database, so the cached seed user id must not leak."""
+    monkeypatch.setattr(recipes_endpoints, "_seed_user_id", None)
+
+
+@pytest.mark.asyncio
+async def test_seed_import_is_idempotent(client, db_session):
+    seed_count = len(json.loads(SEED_FILE.read_text(encoding="utf-8")))
+
+    resp = await client.post("/api/v1/recipes/seed/import")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["imported"] == seed_count
+    assert data["skipped"] == 0
+
+    resp = await client.post("/api/v1/recipes/seed/import")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["imported"] == 0
+    assert data["skipped"] == seed_count
+
+    total = await db_session.execute(select(func.count(Recipe.id)))
+    assert total.scalar() == seed_count
+
+
+@pytest.mark.asyncio
+async def test_seed_user_id_is_cached_after_first_import(client, db_session):
+    resp = await client.post("/api/v1/recipes/seed/import")
+    assert resp.status_code == 200
+
+    seed_user = (
+        await db_session.execute(select(User).where(User.username == "_seed_recipes"))
+    ).scalar_one()
+    assert recipes_endpoints._seed_user_id == seed_user.id
+
+    owners = await db_session.execute(select(Recipe.owner_id).distinct())
+    assert owners.scalars().all() == [seed_user.id]
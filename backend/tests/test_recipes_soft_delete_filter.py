@@ -0,0 +1,63 @@
+"""Tests for the global soft-delete filter on recipes."""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import selectinload
+
+from app.models import Calendar, CalendarMeal, Recipe, User
+
+
+@pytest.mark.asyncio
+async def test_soft_deleted_recipes_hidden_unless_requested(db_session):
+    user = User(username="softdel", email="softdel@example.com", password_hash="x")
+    db_session.add(user)
+    await db_session.commit()
+
+    live = Recipe(title="Live", owner_id=user.id)
+    gone = Recipe(title="Gone", owner_id=user.id, deleted_at=datetime.utcnow())
+    db_session.add_all([live, gone])
+    await db_session.commit()
+
+    result = await db_session.execute(select(Recipe.title).where(Recipe.owner_id == user.id))
+    assert result.scalars().all() == ["Live"]
+
+    count = await db_session.execute(select(func.count(Recipe.id)))
+    assert count.scalar() == 1
+
+    result = await db_session.execute(
+        select(Recipe.title)
+        .where(Recipe.owner_id == user.id)
+        .execution_options(include_deleted=True)
+    )
+    assert sorted(result.scalars().all()) == ["Gone", "Live"]
+
+
+@pytest.mark.asyncio
+async def test_relationship_loads_still_resolve_deleted_recipe(db_session):
+    user = User(username="softdel2", email="softdel2@example.com", password_hash="x")
+    db_session.add(user)
+    await db_session.commit()
+
+    recipe = Recipe(title="Retired Dish", owner_id=user.id, deleted_at=datetime.utcnow())
+    calendar = Calendar(name="Week", owner_id=user.id)
+    db_session.add_all([recipe, calendar])
+    await db_session.commit()
+
+    db_session.add(
+        CalendarMeal(
+            calendar_id=calendar.id,
+            recipe_id=recipe.id,
+            meal_date=datetime(2026, 1, 1),
+            meal_type="dinner",
+        )
+    )
+    await db_session.commit()
+    db_session.expunge_all()
+
+    result = await db_session.execute(
+        select(CalendarMeal).options(selectinload(CalendarMeal.recipe))
+    )
+    meal = result.scalar_one()
+    assert meal.recipe_name == "Retired Dish"
@@ -46,7 +46,6 @@ export default function RecipeForm({ open, onClose, onSubmit, initialData }) {
     category: 'dinner',
     visibility: 'private',
     group_id: '',
-    is_public: false,
   })
   
   const [ingredients, setIngredients] = useState([{ name: '', quantity: '', unit: '' }])
@@ -99,7 +98,6 @@ export default function RecipeForm({ open, onClose, onSubmit, initialData }) {
         category: initialData.category || 'dinner',
         visibility: initialData.visibility || 'private',
         group_id: initialData.group_id || '',
-        is_public: initialData.is_public || false,
       })
       setIngredients(
         initialData.ingredients?.length > 0
@@ -143,7 +141,6 @@ export default function RecipeForm({ open, onClose, onSubmit, initialData }) {
       category: 'dinner',
       visibility: 'private',
       group_id: '',
-      is_public: false,
     })
     setIngredients([{ ingredient_type: 'regular', name: '', quantity: '', unit: '', notes: '' }])
     setInstructions([''])
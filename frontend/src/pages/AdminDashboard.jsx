@@ -470,7 +470,16 @@ export default function AdminDashboard() {
   // OpenAI Settings Management
   const handleUpdateOpenAISettings = async (settings) => {
     try {
-      await api.patch('/admin/openai-settings', settings)
+      // Send only the editable fields; the API rejects unknown keys
+      const { api_key, model, temperature, max_tokens, system_prompt, searxng_url } = settings
+      await api.patch('/admin/openai-settings', {
+        api_key,
+        model,
+        temperature,
+        max_tokens,
+        system_prompt,
+        searxng_url,
+      })
       await loadData()
       setSuccess('OpenAI settings updated successfully')
     } catch (err) {
@@ -492,7 +501,10 @@ export default function AdminDashboard() {
   // Session Settings Management
   const handleUpdateSessionSettings = async (settings) => {
     try {
-      await api.patch('/admin/session-settings', settings)
+      await api.patch('/admin/session-settings', {
+        session_ttl_value: settings.session_ttl_value,
+        session_ttl_unit: settings.session_ttl_unit,
+      })
       await loadData()
       setSuccess('Session settings updated successfully')
     } catch (err) {
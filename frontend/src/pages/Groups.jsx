@@ -184,8 +184,7 @@ export default function Groups() {
       await groupService.addGroupMember(viewingGroup.id, {
         user_id: selectedUser.id,
         role: newMemberRole,
-        can_edit: newMemberRole === 'admin',
-        can_delete: newMemberRole === 'admin'
+        permissions: { can_edit: newMemberRole === 'admin', can_view: true }
       })
       setSuccess('Member added successfully')
       setAddMemberDialog(false)